@@ -0,0 +1,106 @@
+"""
+Benchmark the cold-start cost of building a `PyAzul` client.
+
+Each sample runs in a fresh interpreter and measures importing pyazul, building
+``PyAzul(settings)`` and loading its SSL context, with the certificate and key
+given as PEM content. The in-memory (``memfd``) path is compared with the
+content-addressed file fallback.
+
+The certificate pair is read from ``AZUL_CERT``/``AZUL_KEY`` (PEM content) when
+set, otherwise a throwaway self-signed pair is generated with the ``openssl``
+command.
+
+Usage (with pyazul installed, e.g. ``pip install -e .``):
+    python benchmarks/bench_cold_start.py [samples]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+CHILD = """
+import json, sys, time
+
+started = time.perf_counter()
+from pyazul import AzulSettings, PyAzul
+from pyazul.core import certificates
+
+imported = time.perf_counter()
+if sys.argv[1] == "fallback":
+    certificates._memfd = lambda content: None
+settings = AzulSettings(
+    AUTH1="auth1", AUTH2="auth2", MERCHANT_ID="39038540035",
+    AZUL_CERT=sys.argv[2], AZUL_KEY=sys.argv[3],
+)
+PyAzul(settings).api.ssl_context
+done = time.perf_counter()
+print(json.dumps({"import": imported - started, "client": done - imported}))
+"""
+
+
+def certificate_pair() -> Dict[str, str]:
+    """Return PEM content for a certificate and key."""
+    if os.getenv("AZUL_CERT") and os.getenv("AZUL_KEY"):
+        return {"cert": os.environ["AZUL_CERT"], "key": os.environ["AZUL_KEY"]}
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = Path(directory, "cert.pem"), Path(directory, "key.pem")
+        subprocess.run(  # nosec B603 B607
+            [
+                "openssl",
+                "req",
+                "-x509",
+                "-newkey",
+                "rsa:2048",
+                "-nodes",
+                "-keyout",
+                str(key),
+                "-out",
+                str(cert),
+                "-days",
+                "1",
+                "-subj",
+                "/CN=pyazul-benchmark",
+            ],
+            check=True,
+            capture_output=True,
+        )
+        return {"cert": cert.read_text(), "key": key.read_text()}
+
+
+def run(mode: str, pair: Dict[str, str], samples: int) -> List[Dict[str, float]]:
+    """Start `samples` fresh interpreters and collect their timings."""
+    with tempfile.TemporaryDirectory() as home:
+        env = {**os.environ, "HOME": home}
+        return [
+            json.loads(
+                subprocess.run(  # nosec B603
+                    [sys.executable, "-c", CHILD, mode, pair["cert"], pair["key"]],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                    env=env,
+                ).stdout
+            )
+            for _ in range(samples)
+        ]
+
+
+def main() -> None:
+    """Run both certificate loading modes and print median timings."""
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    pair = certificate_pair()
+    print(f"{samples} cold starts per mode (median)")
+    for mode in ("memfd", "fallback"):
+        timings = run(mode, pair, samples)
+        imported = statistics.median(t["import"] for t in timings) * 1e3
+        client = statistics.median(t["client"] for t in timings) * 1e3
+        print(f"{mode:>9}: import {imported:.1f} ms, PyAzul() + SSL {client:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
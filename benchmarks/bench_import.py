@@ -0,0 +1,45 @@
+"""
+Benchmark the import time of pyazul in a fresh interpreter.
+
+``import pyazul`` only binds lazy exports; the client, models and their
+dependencies (httpx, pydantic) are imported on first use. Each statement is
+timed in new interpreters and reported net of the interpreter startup.
+
+Usage (with pyazul installed, e.g. ``pip install -e .``):
+    python benchmarks/bench_import.py [samples]
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = (
+    "import pyazul",
+    "from pyazul import Sale",
+    "from pyazul import PyAzul",
+)
+
+
+def measure(statement: str, samples: int) -> float:
+    """Return the median wall time of running `statement` in a new interpreter."""
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)  # nosec B603
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    """Time each statement and print the cost above interpreter startup."""
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    baseline = measure("pass", samples)
+    print(f"{samples} runs per statement (median), interpreter startup excluded")
+    for statement in STATEMENTS:
+        cost = (measure(statement, samples) - baseline) * 1e3
+        print(f"{statement:>26}: {cost:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
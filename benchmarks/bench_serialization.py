@@ -0,0 +1,76 @@
+"""
+Benchmark the per-transaction CPU cost of request/response serialization.
+
+Compares the previous path (``model_dump`` -> dict mutation -> httpx ``json=``
+-> ``response.json()``) with the pre-encoded path used by `AzulAPI`
+(``encode_request`` -> ``content=`` -> backend ``loads``).
+
+Usage (with pyazul installed, e.g. ``pip install -e .``):
+    python benchmarks/bench_serialization.py [iterations]
+"""
+
+import sys
+import timeit
+
+import httpx
+
+from pyazul.api.serialization import BACKEND, encode_request, loads
+from pyazul.models.payment import Sale
+
+URL = "https://pruebas.azul.com.do/webservices/JSON/Default.aspx"
+OVERRIDES = {"Channel": "EC", "Store": "39038540035"}
+SALE = Sale(
+    Store="39038540035",
+    OrderNumber="INV-12345",
+    Amount="100000",
+    Itbis="18000",
+    CardNumber="4111111111111111",
+    Expiration="202812",
+    CVC="123",
+)
+RESPONSE = httpx.Response(
+    200,
+    json={
+        "AuthorizationCode": "OK1234",
+        "AzulOrderId": "44444444",
+        "CustomOrderId": "",
+        "DateTime": "20250101120000",
+        "ErrorDescription": "",
+        "IsoCode": "00",
+        "LotNumber": "",
+        "RRN": "2025010112000044444444",
+        "ResponseCode": "ISO8583",
+        "ResponseMessage": "APROBADA",
+        "Ticket": "123",
+    },
+)
+
+
+def previous_path() -> None:
+    """Serialize one transaction the way the client used to."""
+    parameters = SALE.model_dump(exclude_none=True)
+    parameters.update(OVERRIDES)
+    httpx.Request("POST", URL, json=parameters)
+    RESPONSE.json()
+
+
+def pre_encoded_path() -> None:
+    """Serialize one transaction through the serialization layer."""
+    httpx.Request("POST", URL, content=encode_request(SALE, OVERRIDES))
+    loads(RESPONSE.content)
+
+
+def main() -> None:
+    """Run both paths and print the per-transaction cost."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"JSON backend: {BACKEND}, {iterations} transactions")
+    results = {}
+    for name, func in (("previous", previous_path), ("pre-encoded", pre_encoded_path)):
+        best = min(timeit.repeat(func, number=iterations, repeat=5))
+        results[name] = best / iterations * 1e6
+        print(f"{name:>12}: {results[name]:.2f} us/transaction")
+    print(f"     speedup: {results['previous'] / results['pre-encoded']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
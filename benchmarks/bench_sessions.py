@@ -0,0 +1,118 @@
+"""
+Benchmark 3DS session store operations per second.
+
+Runs the store operations of one 3DS flow (store the session, read it on the
+method notification, find it by AzulOrderId, store the result, delete it) for
+many sessions against:
+
+- the plain dict `SecureService` used before session stores,
+- `InMemorySessionStore`,
+- `SQLiteSessionStore` on a temporary file (WAL, dedicated thread).
+
+Usage (with pyazul installed, e.g. ``pip install -e .``):
+    python benchmarks/bench_sessions.py [sessions]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+from pyazul.core.sessions import (
+    InMemorySessionStore,
+    SessionData,
+    SQLiteSessionStore,
+    ThreeDSSessionStore,
+)
+
+OPERATIONS_PER_FLOW = 5
+
+
+class DictSessionStore(ThreeDSSessionStore):
+    """The previous unbounded dict, with its linear scan by AzulOrderId."""
+
+    def __init__(self) -> None:
+        """Initialize an empty dict."""
+        self.sessions: Dict[str, SessionData] = {}
+
+    async def get(self, secure_id: str) -> Optional[SessionData]:
+        """Return the session."""
+        return self.sessions.get(secure_id)
+
+    async def set(
+        self, secure_id: str, data: SessionData, ttl: Optional[float] = None
+    ) -> None:
+        """Store the session."""
+        self.sessions[secure_id] = data
+
+    async def delete(self, secure_id: str) -> bool:
+        """Remove the session."""
+        return self.sessions.pop(secure_id, None) is not None
+
+    async def find(self, value: str, field: str = "azul_order_id") -> Optional[str]:
+        """Scan every session, as `process_3ds_method` used to."""
+        for secure_id, data in self.sessions.items():
+            if data.get(field) == value:
+                return secure_id
+        return None
+
+    async def claim(self, key: str, ttl: Optional[float] = None) -> bool:
+        """Not benchmarked."""
+        return True
+
+    async def release(self, key: str) -> None:
+        """Not benchmarked."""
+
+
+def session(n: int) -> Dict[str, Any]:
+    """Build the session data stored after an initial 3DS sale."""
+    return {
+        "azul_order_id": str(40000000 + n),
+        "amount": "100000",
+        "itbis": "18000",
+        "order_number": f"INV-{n}",
+        "custom_order_id": None,
+        "term_url": f"https://shop.example/3ds/term?secure_id=s{n}",
+        "status": "processing",
+        "method_required": True,
+    }
+
+
+async def run(store: ThreeDSSessionStore, sessions: int) -> float:
+    """Run every flow, returning operations per second."""
+    # Live sessions of other checkouts, as in a busy process
+    for n in range(sessions):
+        await store.set(f"bg{n}", session(sessions + n))
+    start = time.perf_counter()
+    for n in range(sessions):
+        secure_id = f"s{n}"
+        await store.set(secure_id, session(n))
+        data = await store.get(secure_id)
+        assert data is not None
+        assert await store.find(data["azul_order_id"]) == secure_id
+        await store.set(secure_id, {**data, "status": "approved"})
+        await store.delete(secure_id)
+    elapsed = time.perf_counter() - start
+    await store.aclose()
+    return sessions * OPERATIONS_PER_FLOW / elapsed
+
+
+async def main() -> None:
+    """Run every store and print its throughput."""
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{sessions} 3DS flows, {OPERATIONS_PER_FLOW} operations each")
+    with tempfile.TemporaryDirectory() as directory:
+        stores = {
+            "dict": DictSessionStore(),
+            "in-memory": InMemorySessionStore(max_sessions=4 * sessions),
+            "sqlite": SQLiteSessionStore(os.path.join(directory, "3ds.sqlite3")),
+        }
+        results = {name: await run(store, sessions) for name, store in stores.items()}
+    for name, ops in results.items():
+        print(f"{name:>10}: {ops:12,.0f} ops/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
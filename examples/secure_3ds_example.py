@@ -222,15 +222,10 @@ async def process_payment(
         logger.info("=" * 50)
         logger.info(f"INITIAL SECURE_{transaction_type.upper()} RESPONSE:")
         logger.info("=" * 50)
-        result_keys = list(result.keys()) if isinstance(result, dict) else "Not a dict"
-        logger.info(f"Result keys: {result_keys}")
-        response_msg = (
-            result.get("ResponseMessage") if isinstance(result, dict) else "N/A"
-        )
-        logger.info(f"Response Message: {response_msg}")
-        has_redirect = result.get("redirect") if isinstance(result, dict) else False
-        logger.info(f"Has redirect: {has_redirect}")
-        secure_id = result.get("id") if isinstance(result, dict) else "N/A"
+        logger.info(f"Result keys: {list(result.keys())}")
+        logger.info(f"Response Message: {result.get('ResponseMessage')}")
+        logger.info(f"Has redirect: {result.get('redirect')}")
+        secure_id = result.get("id")
         logger.info(f"Secure ID: {secure_id}")
         logger.info("=" * 50)
 
@@ -260,7 +255,7 @@ async def process_payment(
             return {
                 "success": True,
                 "requires_3ds": False,
-                "result": response_data,
+                "result": dict(response_data),
                 "azul_order_id": response_data.get("AzulOrderId"),
                 "is_approved": is_success,
                 "transaction_type": transaction_type,
@@ -543,8 +538,7 @@ async def threeds_iframe(request: Request, secure_id: str):
         # Verify session exists
         session_info = await azul.get_session_info(secure_id)
         if not session_info:
-            return HTMLResponse(
-                """
+            return HTMLResponse("""
                 <html><body>
                     <script>
                         parent.postMessage({
@@ -553,8 +547,7 @@ async def threeds_iframe(request: Request, secure_id: str):
                         }, '*');
                     </script>
                 </body></html>
-            """
-            )
+            """)
 
         return templates.TemplateResponse(
             "iframe_3ds.html",
@@ -567,8 +560,7 @@ async def threeds_iframe(request: Request, secure_id: str):
 
     except Exception as e:
         logger.error(f"Error serving 3DS iframe: {e}")
-        return HTMLResponse(
-            f"""
+        return HTMLResponse(f"""
             <html><body>
                 <script>
                     parent.postMessage({{
@@ -577,8 +569,7 @@ async def threeds_iframe(request: Request, secure_id: str):
                     }}, '*');
                 </script>
             </body></html>
-        """
-        )
+        """)
 
 
 @app.post("/manual-3ds-method/{secure_id}")
@@ -230,16 +230,18 @@ async def process_token_payment(
         # SecureTokenSale model is handled by azul.secure_token_sale
         response = await azul.secure_token_sale(sale_data_dict)
 
-        logger.info(f"Secure Token Sale Initial Response: {json.dumps(response)}")
+        logger.info(
+            f"Secure Token Sale Initial Response: {json.dumps(response.to_dict())}"
+        )
 
-        secure_id = response.get("id") if isinstance(response, dict) else None
+        secure_id = response.get("id")
         if secure_id:
             app_3ds_session_store[secure_id] = {
                 "original_term_url": three_ds_auth_dict["TermUrl"],
                 "azul_order_id": None,  # Initialize as None
                 "app_order_number": order_number,
             }
-            value_dict = response.get("value") if isinstance(response, dict) else None
+            value_dict = response.get("value")
             if isinstance(value_dict, dict):
                 app_3ds_session_store[secure_id]["azul_order_id"] = value_dict.get(
                     "AzulOrderId"
@@ -265,7 +267,7 @@ async def process_token_payment(
                         f"{type(pyazul_session)}"
                     )
 
-        return response
+        return response.to_dict()  # includes the 3DS html
 
     except AzulError as e:
         logger.error(f"Azul error processing payment: {str(e)}")
@@ -336,18 +338,12 @@ async def capture_3ds_method_route(request: Request, data: SessionID):
 
         logger.info(f"Processing 3DS method for order: {azul_order_id}")
         result = await azul.process_3ds_method(azul_order_id, method_status)
-        logger.info(f"3DS Method result: {json.dumps(result)}")
+        logger.info(f"3DS Method result: {json.dumps(result.to_dict())}")
 
-        if (
-            isinstance(result, dict)
-            and result.get("ResponseMessage") == "ALREADY_PROCESSED"
-        ):
+        if result.get("ResponseMessage") == "ALREADY_PROCESSED":
             return {"status": "ok", "message": "Already processed"}
 
-        if (
-            isinstance(result, dict)
-            and result.get("ResponseMessage") == "3D_SECURE_CHALLENGE"
-        ):
+        if result.get("ResponseMessage") == "3D_SECURE_CHALLENGE":
             logger.info("Additional 3DS challenge required")
             challenge_data = result.get("ThreeDSChallenge")
             if not isinstance(challenge_data, dict):
@@ -375,7 +371,7 @@ async def capture_3ds_method_route(request: Request, data: SessionID):
                 ),
             }
 
-        return result  # For other cases like APROBADA directly after method
+        return result.to_dict()  # For other cases like APROBADA after method
 
     except AzulError as e:
         logger.error(f"Azul error processing 3DS method: {str(e)}")
@@ -407,7 +403,7 @@ async def post_3ds(request: Request, data: ChallengeRequest):
         result = await azul.process_challenge(
             session_id=azul_order_id, challenge_response=cres
         )
-        logger.info(f"Challenge result: {json.dumps(result)}")
+        logger.info(f"Challenge result: {json.dumps(result.to_dict())}")
 
         # Clean up app 3DS session store
         if azul_order_id in app_3ds_session_store:
@@ -30,44 +30,111 @@ Example:
     ... })
 """
 
-from .core.config import AzulSettings, get_azul_settings
-from .core.exceptions import AzulError, AzulResponseError
-from .index import PyAzul
+from typing import TYPE_CHECKING
 
-# Import models from the centralized pyazul.models package
-from .models import (
-    AzulBase,
-    CardHolderInfo,
-    ChallengeIndicator,
-    Hold,
-    PaymentPage,
-    Post,
-    Refund,
-    Sale,
-    SecureSale,
-    SecureTokenSale,
-    ThreeDSAuth,
-    TokenRequest,
-    TokenSale,
-    VerifyTransaction,
-    Void,
-)
-from .services import DataVaultService, PaymentPageService, TransactionService
-from .services.secure import SecureService
+from .core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .api.constants import Priority
+    from .api.timeouts import Deadline, TimeoutProfile
+    from .core.config import AzulSettings, get_azul_settings
+    from .core.exceptions import AzulError, AzulResponseError
+    from .core.sessions import InMemorySessionStore, ThreeDSSessionStore
+    from .index import PyAzul
+    from .models import (
+        AzulBase,
+        CardHolderInfo,
+        ChallengeIndicator,
+        Hold,
+        PaymentPage,
+        Post,
+        Refund,
+        Sale,
+        SecureSale,
+        SecureTokenSale,
+        ThreeDSAuth,
+        ThreeDSResult,
+        TokenRequest,
+        TokenSale,
+        TransactionResult,
+        VerifyTransaction,
+        Void,
+    )
+    from .services import (
+        BatchOperation,
+        BatchResult,
+        DataVaultService,
+        PaymentPageService,
+        TransactionService,
+    )
+    from .services.secure import SecureService
+    from .sync import PyAzulSync
+    from .tenants import TenantRegistry
+
+# Exports are imported on first access, keeping `import pyazul` cheap
+_EXPORTS = {
+    "PyAzul": ".index",
+    "PyAzulSync": ".sync",
+    "TenantRegistry": ".tenants",
+    "AzulSettings": ".core.config",
+    "get_azul_settings": ".core.config",
+    "AzulError": ".core.exceptions",
+    "AzulResponseError": ".core.exceptions",
+    "Deadline": ".api.timeouts",
+    "Priority": ".api.constants",
+    "TimeoutProfile": ".api.timeouts",
+    "ThreeDSSessionStore": ".core.sessions.base",
+    "InMemorySessionStore": ".core.sessions.memory",
+    "TransactionService": ".services.transaction",
+    "DataVaultService": ".services.datavault",
+    "PaymentPageService": ".services.payment_page",
+    "SecureService": ".services.secure",
+    "BatchOperation": ".services.batch",
+    "BatchResult": ".services.batch",
+    "AzulBase": ".models.schemas",
+    "Sale": ".models.payment",
+    "Hold": ".models.payment",
+    "Refund": ".models.payment",
+    "Post": ".models.payment",
+    "Void": ".models.payment",
+    "TokenRequest": ".models.datavault",
+    "TokenSale": ".models.datavault",
+    "VerifyTransaction": ".models.verification",
+    "PaymentPage": ".models.payment_page",
+    "SecureSale": ".models.three_ds",
+    "SecureTokenSale": ".models.three_ds",
+    "CardHolderInfo": ".models.three_ds",
+    "ThreeDSAuth": ".models.three_ds",
+    "ChallengeIndicator": ".models.three_ds",
+    "TransactionResult": ".models.results",
+    "ThreeDSResult": ".models.results",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Main class
     "PyAzul",
+    "PyAzulSync",
+    "TenantRegistry",
     # Configuration
     "get_azul_settings",
     "AzulSettings",
     "AzulError",
     "AzulResponseError",
+    "Deadline",
+    "Priority",
+    "TimeoutProfile",
+    # 3DS session storage
+    "ThreeDSSessionStore",
+    "InMemorySessionStore",
     # Services
     "TransactionService",
     "DataVaultService",
     "PaymentPageService",
     "SecureService",
+    "BatchOperation",
+    "BatchResult",
     # Models
     "AzulBase",
     "Sale",
@@ -84,4 +151,7 @@ __all__ = [
     "CardHolderInfo",
     "ThreeDSAuth",
     "ChallengeIndicator",
+    # Results
+    "TransactionResult",
+    "ThreeDSResult",
 ]
@@ -4,7 +4,51 @@ API module for PyAzul.
 Contains client and constants for API communication.
 """
 
-from .client import AzulAPI
-from .constants import AzulEndpoints, Environment
+from typing import TYPE_CHECKING
 
-__all__ = ["AzulAPI", "Environment", "AzulEndpoints"]
+from ..core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import AzulAPI
+    from .constants import AzulEndpoints, Environment, Priority
+    from .dns import DNSCache
+    from .keepalive import KeepAlive
+    from .limits import MerchantGovernor
+    from .reload import ClientGeneration, CredentialWatcher
+    from .routing import CircuitState, EndpointRouter
+    from .timeouts import Deadline, TimeoutProfile
+
+__all__ = [
+    "AzulAPI",
+    "Environment",
+    "AzulEndpoints",
+    "Priority",
+    "EndpointRouter",
+    "CircuitState",
+    "Deadline",
+    "TimeoutProfile",
+    "MerchantGovernor",
+    "ClientGeneration",
+    "CredentialWatcher",
+    "KeepAlive",
+    "DNSCache",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AzulAPI": ".client",
+        "Environment": ".constants",
+        "AzulEndpoints": ".constants",
+        "Priority": ".constants",
+        "EndpointRouter": ".routing",
+        "CircuitState": ".routing",
+        "Deadline": ".timeouts",
+        "TimeoutProfile": ".timeouts",
+        "MerchantGovernor": ".limits",
+        "ClientGeneration": ".reload",
+        "CredentialWatcher": ".reload",
+        "KeepAlive": ".keepalive",
+        "DNSCache": ".dns",
+    },
+)
@@ -1,19 +1,45 @@
 """Handles HTTP communication with the Azul payment gateway."""
 
+import asyncio
 import json
 import logging
 import ssl
-from typing import Any, Dict, NoReturn
+import time
+from types import TracebackType
+from typing import Any, Dict, List, Mapping, NoReturn, Optional, Tuple, Type
 
 import httpx
 
-from pyazul.api.constants import AzulEndpoints, Environment
+from pyazul.api.constants import AzulEndpoints, Environment, Priority
+from pyazul.api.dns import DNSCache, resolving_transport
+from pyazul.api.limits import MerchantGovernor
+from pyazul.api.reload import ClientGeneration
+from pyazul.api.routing import EndpointRouter
+from pyazul.api.serialization import RequestData, encode_request, loads
+from pyazul.api.stats import LatencyWindow
+from pyazul.api.timeouts import Deadline, TimeoutProfile, TimeoutProfiles
+from pyazul.core.certificates import get_ssl_context
 from pyazul.core.config import AzulSettings
-from pyazul.core.exceptions import APIError, AzulResponseError, SSLError
+from pyazul.core.exceptions import (
+    APIError,
+    AzulGatewayError,
+    AzulResponseError,
+    DeadlineExceededError,
+    NoHealthyEndpointError,
+)
+from pyazul.core.fork import register_after_fork
+from pyazul.core.log import log_event
 
 _logger = logging.getLogger(__name__)
 
 
+def _get_field(data: RequestData, name: str) -> Any:
+    """Read a field from a request model or mapping."""
+    if isinstance(data, Mapping):
+        return data.get(name)
+    return getattr(data, name, None)
+
+
 class AzulAPI:
     """
     AzulAPI is the main client class for interacting with the Azul payment gateway.
@@ -27,54 +53,371 @@ class AzulAPI:
 
     The client automatically loads configuration from environment variables
     and handles all the low-level details of making secure API requests.
+
+    A pooled `httpx.AsyncClient` is created on first use and reused for every
+    request, so connections (and their mutual-TLS handshakes) are kept alive
+    between transactions. Interactive and background traffic each get their
+    own pool, so a large batch cannot exhaust the connections checkout needs.
+    Use the client as an async context manager or call `aclose()` to release
+    the pools when done.
     """
 
-    def __init__(self, settings: AzulSettings):
-        """Initialize AzulAPI using provided configuration."""
+    def __init__(
+        self,
+        settings: AzulSettings,
+        http_client: Optional[httpx.AsyncClient] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        timeout_profiles: Optional[Mapping[str, TimeoutProfile]] = None,
+        shared_pools: Optional[ClientGeneration] = None,
+    ):
+        """
+        Initialize AzulAPI using provided configuration.
+
+        Args:
+            settings: SDK configuration.
+            http_client: Optional pre-built client. It must already be configured
+                with the Azul certificates (``verify``); it is never closed by
+                `AzulAPI`, its lifecycle belongs to the caller.
+            transport: Optional transport used when building the internal client
+                (e.g. for proxies or testing). Ignored if `http_client` is given.
+            timeout_profiles: Optional timeouts per operation name (``"Sale"``,
+                ``"VerifyPayment"``, ``"ProcessDatavault"``, ...).
+            shared_pools: Optional SSL context and connection pools shared with
+                other clients using the same certificate (see `TenantRegistry`).
+                They are never closed by `AzulAPI`, and `reload` then only
+                applies new credentials.
+        """
         self.settings = settings
+        self._http_client = http_client
+        self._shared_pools = shared_pools
+        self._owns_client = http_client is None and shared_pools is None
+        self._transport = transport
+        self.timeout_profiles = TimeoutProfiles(timeout_profiles)
         self._init_configuration()
         self._init_client_config()
+        register_after_fork(self)
 
     def _init_configuration(self) -> None:
         """Initialize basic configuration from settings."""
-        if self.settings.AUTH1 is None:
-            raise ValueError(
-                "AUTH1 is not set in settings; essential for API authentication."
-            )
-        self.auth1 = self.settings.AUTH1
-
-        if self.settings.AUTH2 is None:
-            raise ValueError(
-                "AUTH2 is not set in settings; essential for API authentication."
-            )
-        self.auth2 = self.settings.AUTH2
-        self.ssl_context = self._load_certificates()
+        self._check_credentials(self.settings)
+        self._generation = ClientGeneration(self.settings)
         self.ENVIRONMENT = Environment(self.settings.ENVIRONMENT)
         self.url = self._get_base_url()
         if self.ENVIRONMENT == Environment.PROD:
             # Prioritize user-defined ALT_PROD_URL from settings, fallback to constant
             self.ALT_URL = self.settings.ALT_PROD_URL or AzulEndpoints.ALT_PROD_URL
+        self.router = EndpointRouter(
+            self._get_endpoint_urls(),
+            failure_threshold=self.settings.CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=self.settings.CIRCUIT_RESET_TIMEOUT,
+            probe=self._probe_endpoint,
+        )
+        self._governor: Optional[MerchantGovernor] = None
+        self._governor_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Latency per (base URL, operation), which the hedge delay follows
+        self._latency: Dict[Tuple[str, str], LatencyWindow] = {}
+        self.dns: Optional[DNSCache] = None
+        if self.settings.DNS_CACHE_TTL or self.settings.DNS_PINNED_HOSTS:
+            self.dns = DNSCache(
+                self.settings.DNS_CACHE_TTL, self.settings.DNS_PINNED_HOSTS
+            )
 
-    def _load_certificates(self) -> ssl.SSLContext:
-        """Load and validate certificates into an SSL context."""
+    @property
+    def governor(self) -> MerchantGovernor:
+        """Admission governor shared by this merchant's clients on this loop."""
         try:
-            cert_path, key_path = self.settings._load_certificates()
-            if not all((cert_path, key_path)):
-                raise SSLError("Invalid certificate configuration")
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if self._governor is None or self._governor_loop is not loop:
+            self._governor = self._get_governor()
+            self._governor_loop = loop
+        return self._governor
+
+    def _get_governor(self) -> MerchantGovernor:
+        """Return the admission governor shared by this merchant's clients."""
+        return MerchantGovernor.for_merchant(
+            self.settings.MERCHANT_ID,
+            rate=self.settings.RATE_LIMIT_PER_SECOND,
+            burst=self.settings.RATE_LIMIT_BURST,
+            max_in_flight=self.settings.MAX_IN_FLIGHT,
+            adaptive=self.settings.ADAPTIVE_CONCURRENCY,
+            min_in_flight=self.settings.ADAPTIVE_MIN_IN_FLIGHT,
+            background_share=self.settings.BACKGROUND_IN_FLIGHT_SHARE,
+        )
+
+    def _after_fork(self) -> None:
+        """Take the merchant governor of the child process.
+
+        Pools and probes are reset by the generation and the router.
+        """
+        self._governor = None
+
+    def _get_endpoint_urls(self) -> List[str]:
+        """Return gateway base URLs in order of preference."""
+        urls = [self.url]
+        if self.ENVIRONMENT == Environment.PROD:
+            urls.append(self.ALT_URL)
+        urls.extend(self.settings.FAILOVER_URLS)
+        return urls
+
+    @staticmethod
+    def _check_credentials(settings: AzulSettings) -> None:
+        """Ensure the settings carry the API credentials."""
+        if settings.AUTH1 is None:
+            raise ValueError(
+                "AUTH1 is not set in settings; essential for API authentication."
+            )
+        if settings.AUTH2 is None:
+            raise ValueError(
+                "AUTH2 is not set in settings; essential for API authentication."
+            )
+
+    def _load_certificates(
+        self, settings: Optional[AzulSettings] = None
+    ) -> ssl.SSLContext:
+        """Return the process-wide SSL context for the configured certificates."""
+        return get_ssl_context(settings or self.settings)
+
+    @property
+    def auth1(self) -> Optional[str]:
+        """``Auth1`` credential of the current generation."""
+        return self._generation.auth1
+
+    @property
+    def auth2(self) -> Optional[str]:
+        """``Auth2`` credential of the current generation."""
+        return self._generation.auth2
+
+    @property
+    def generation(self) -> ClientGeneration:
+        """Current certificates, credentials and connection pools."""
+        return self._generation
+
+    @property
+    def _clients(self) -> Dict[Priority, httpx.AsyncClient]:
+        """Pooled HTTP clients of the current generation."""
+        return self._generation.clients
+
+    @property
+    def ssl_context(self) -> ssl.SSLContext:
+        """SSL context holding the Azul client certificates, loaded on first use."""
+        pools = self._shared_pools or self._generation
+        if pools.ssl_context is None:
+            pools.ssl_context = self._load_certificates(pools.settings)
+        return pools.ssl_context
+
+    async def _ensure_ssl_context(self) -> None:
+        """Load the certificates in a worker thread, off the event loop.
+
+        Not needed when the HTTP client was injected.
+        """
+        if self._http_client is not None:
+            return
+        pools = self._shared_pools or self._generation
+        if pools.ssl_context is None:
+            pools.ssl_context = await asyncio.to_thread(
+                self._load_certificates, pools.settings
+            )
+
+    def preload(self) -> None:
+        """
+        Load the certificates now instead of on the first request.
+
+        Call it in the master process of a pre-fork server (e.g. gunicorn with
+        ``preload_app``): the SSL context is then built once and shared
+        copy-on-write by every worker. Blocking.
+        """
+        if self._http_client is None:
+            pools = self._shared_pools or self._generation
+            if pools.ssl_context is None:
+                pools.ssl_context = self._load_certificates(pools.settings)
+
+    async def warmup(self, connections: Optional[int] = None) -> int:
+        """
+        Open pooled connections to every healthy gateway endpoint ahead of traffic.
+
+        Each connection pays DNS, TCP and the mutual-TLS handshake now, so the
+        first transactions do not, and neither does a failover to the
+        alternate host. Run it in every worker after the fork, e.g. in the
+        application's startup hook; connections already open are reused, so
+        running it again refreshes them (see `KeepAlive`).
+
+        Args:
+            connections: Connections per endpoint; defaults to
+                ``WARMUP_CONNECTIONS`` (or 1), capped so all endpoints fit in
+                the keep-alive pool.
+
+        Returns:
+            Number of connections that answered.
+        """
+        await self._ensure_ssl_context()
+        urls = [endpoint.url for endpoint in self.router.available()]
+        count = min(
+            connections or self.settings.WARMUP_CONNECTIONS or 1,
+            max(1, self.settings.HTTP_MAX_KEEPALIVE_CONNECTIONS // len(urls)),
+        )
+        client = self._get_client(Priority.INTERACTIVE)
+        # Concurrent requests force the pool to open one connection each
+        results = await asyncio.gather(
+            *(
+                client.get(url, timeout=self.settings.CIRCUIT_PROBE_TIMEOUT)
+                for url in urls
+                for _ in range(count)
+            ),
+            return_exceptions=True,
+        )
+        warm = sum(1 for result in results if isinstance(result, httpx.Response))
+        _logger.debug(
+            "Warmed up %s/%s connections to %s", warm, len(results), ", ".join(urls)
+        )
+        return warm
+
+    async def reload(self, settings: Optional[AzulSettings] = None) -> ClientGeneration:
+        """
+        Apply new certificates and credentials without interrupting traffic.
+
+        The new certificate is loaded in a worker thread and pools for it are
+        built before anything is swapped. New requests then use the new
+        generation, while requests already in flight finish on the previous
+        pools, which are closed once drained. When the certificate did not
+        change, the open pools are kept.
 
-            ssl_context = ssl.create_default_context()
-            ssl_context.load_cert_chain(cert_path, key_path)
-            return ssl_context
-        except Exception as e:
-            raise SSLError(f"Error loading certificates: {str(e)}") from e
+        Only the certificates (``AZUL_CERT``/``AZUL_KEY``) and credentials
+        (``AUTH1``/``AUTH2``) are applied; URLs, pool sizes and limits keep the
+        values the client was built with.
+
+        Args:
+            settings: New settings; defaults to the current ones, which reloads
+                certificate files whose content changed on disk.
+
+        Returns:
+            The retired generation (see `ClientGeneration.wait_closed`).
+
+        Raises:
+            ValueError: If the credentials are missing.
+            SSLError: If the certificates cannot be loaded; the current
+                generation is then kept.
+        """
+        settings = settings or self.settings
+        self._check_credentials(settings)
+        old = self._generation
+        ssl_context = None
+        if self._owns_client:
+            ssl_context = await asyncio.to_thread(self._load_certificates, settings)
+        new = ClientGeneration(settings, ssl_context, number=old.number + 1)
+        if ssl_context is not None and ssl_context is old.ssl_context:
+            new.clients, old.clients = old.clients, {}
+        elif ssl_context is not None:
+            for priority in old.clients:
+                self._get_client(priority, new)
+        self._generation = new
+        self.settings = settings
+        old.retire()
+        _logger.info(
+            "Reloaded certificates and credentials (generation %s)", new.number
+        )
+        return old
 
     def _init_client_config(self) -> None:
         """Initialize HTTP client configuration."""
-        self.timeout = httpx.Timeout(30.0, read=30.0)
+        self.timeout = self.timeout_profiles.default.timeout()
+        self.limits = httpx.Limits(
+            max_connections=self.settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=self.settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=self.settings.HTTP_KEEPALIVE_EXPIRY,
+        )
+        self.background_limits = httpx.Limits(
+            max_connections=self.settings.HTTP_BACKGROUND_MAX_CONNECTIONS,
+            max_keepalive_connections=min(
+                self.settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                self.settings.HTTP_BACKGROUND_MAX_CONNECTIONS,
+            ),
+            keepalive_expiry=self.settings.HTTP_KEEPALIVE_EXPIRY,
+        )
         self.base_headers = {
             "Content-Type": "application/json",
         }
 
+    def _get_client(
+        self,
+        priority: Priority = Priority.INTERACTIVE,
+        generation: Optional[ClientGeneration] = None,
+    ) -> httpx.AsyncClient:
+        """Return the pooled HTTP client of a priority, creating it on first use.
+
+        An injected client serves every priority.
+
+        Args:
+            priority: Traffic class of the pool.
+            generation: Generation owning the pool; defaults to the current one.
+                Ignored when the pools are shared.
+        """
+        if self._shared_pools is not None:
+            generation = self._shared_pools
+        elif not self._owns_client:
+            if self._http_client is None or self._http_client.is_closed:
+                raise APIError("The provided HTTP client has been closed")
+            return self._http_client
+        elif generation is None:
+            generation = self._generation
+        client = generation.clients.get(priority)
+        if client is None or client.is_closed:
+            if generation.ssl_context is None:
+                generation.ssl_context = self._load_certificates(generation.settings)
+            limits = (
+                self.background_limits
+                if priority == Priority.BACKGROUND
+                else self.limits
+            )
+            transport = self._transport
+            if transport is None and self.dns is not None:
+                transport = resolving_transport(
+                    self.dns, generation.ssl_context, limits
+                )
+            client = generation.clients[priority] = httpx.AsyncClient(
+                verify=generation.ssl_context,
+                limits=limits,
+                timeout=self.timeout,
+                transport=transport,
+            )
+        return client
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether every pooled HTTP client has been released."""
+        if self._shared_pools is not None:
+            return all(
+                client.is_closed for client in self._shared_pools.clients.values()
+            )
+        if not self._owns_client:
+            return self._http_client is None or self._http_client.is_closed
+        return all(client.is_closed for client in self._clients.values())
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients and release their connections.
+
+        A client injected through ``http_client`` is left open; closing it is
+        the caller's responsibility. Calling this more than once is safe.
+        """
+        await self.router.aclose()
+        if self.dns is not None:
+            await self.dns.aclose()
+        await self._generation.aclose()
+
+    async def __aenter__(self) -> "AzulAPI":
+        """Enter the async context, returning this client."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the pooled HTTP client on context exit."""
+        await self.aclose()
+
     def _get_base_url(self) -> str:
         """Get the base URL based on environment."""
         if self.settings.CUSTOM_URL:
@@ -96,21 +439,21 @@ class AzulAPI:
         headers["Auth2"] = self.auth2
         return headers
 
-    def _prepare_request(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepare request data with required parameters from settings.
+    def _encode_request(self, data: RequestData) -> bytes:
+        """Encode the request body with required parameters from settings.
 
-        Ensures Channel & Store are always sourced from SDK settings.
+        Channel & Store are always sourced from SDK settings, overriding model
+        values if present. The caller's data is not modified.
 
         Args:
-            data: The input dictionary representing the request payload.
+            data: The request model or payload mapping.
 
         Returns:
-            The modified dictionary with Channel and Store updated from settings.
+            The JSON request body.
         """
-        # Always use Channel & Store from settings, overriding model values if present.
-        data["Channel"] = self.settings.CHANNEL
-        data["Store"] = self.settings.MERCHANT_ID
-        return data  # Return the modified data, None filtering is handled by model_dump
+        return encode_request(
+            data, {"Channel": self.settings.CHANNEL, "Store": self.settings.MERCHANT_ID}
+        )
 
     def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
         """
@@ -127,8 +470,15 @@ class AzulAPI:
         """
         try:
             response.raise_for_status()
-            data: Dict[str, Any] = response.json()
-            _logger.debug(f"Received response: {json.dumps(data, indent=2)}")
+            data: Dict[str, Any] = loads(response.content)
+            log_event(
+                _logger,
+                logging.DEBUG,
+                "azul.response",
+                self.settings.LOG_SAMPLE_RATE,
+                status=response.status_code,
+                payload=data,
+            )
             self._check_for_errors(data)
             return data
         except (httpx.HTTPStatusError, json.JSONDecodeError) as e:
@@ -144,7 +494,7 @@ class AzulAPI:
         # Handle system errors (ResponseCode = "Error")
         if response_code == "Error":
             error_msg = error_description or "System error occurred"
-            _logger.error(f"System Error: {error_msg}")
+            _logger.error("System Error: %s", error_msg)
             raise AzulResponseError(f"System Error: {error_msg}", response_data=data)
 
         # Handle ISO8583 responses
@@ -156,7 +506,7 @@ class AzulAPI:
 
             # 3DS special cases - these are processing states, not final results
             if iso_code in ["3D", "3D2METHOD"]:
-                _logger.info(f"3DS processing required: {response_message}")
+                _logger.info("3DS processing required: %s", response_message)
                 return
 
             # All other ISO codes are declines - treat as normal responses
@@ -173,7 +523,7 @@ class AzulAPI:
             else:
                 # Neither available - use ISO code fallback
                 decline_reason = f"Declined (ISO: {iso_code})"
-            _logger.info(f"Transaction declined: {decline_reason}")
+            _logger.info("Transaction declined: %s", decline_reason)
             return
 
         # Handle legacy error patterns and unexpected response structures
@@ -191,45 +541,44 @@ class AzulAPI:
             if any(
                 error_type in error_description for error_type in system_error_types
             ):
-                _logger.error(f"Gateway Error: {error_description}")
-                raise AzulResponseError(
+                _logger.error("Gateway Error: %s", error_description)
+                raise AzulGatewayError(
                     f"Gateway Error: {error_description}", response_data=data
                 )
             else:
                 # Business rule errors (like invalid card type) - treat as declines
-                _logger.info(f"Transaction declined: {error_description}")
+                _logger.info("Transaction declined: %s", error_description)
                 return
 
         # If we have an ErrorMessage, it's typically a system error
         error_message = data.get("ErrorMessage")
         if error_message:
-            _logger.error(f"API Error: {error_message}")
+            _logger.error("API Error: %s", error_message)
             raise AzulResponseError(f"API Error: {error_message}", response_data=data)
 
         # If we reach here with no clear response pattern, log and return
         # (avoid throwing exceptions for unknown but potentially valid responses)
         if response_code or iso_code or response_message:
             _logger.debug(
-                f"Response received - Code: {response_code}, ISO: {iso_code}, "
-                f"Message: {response_message}"
+                "Response received - Code: %s, ISO: %s, Message: %s",
+                response_code,
+                iso_code,
+                response_message,
             )
         else:
-            _logger.warning(
-                "Received response with unclear structure",
-                extra={"response_data": data},
-            )
+            log_event(_logger, logging.WARNING, "azul.response.unclear", payload=data)
 
     def _log_and_raise_api_error(
         self, error: Exception, response: httpx.Response
     ) -> NoReturn:
         """Log and raise API error."""
         if isinstance(error, httpx.HTTPStatusError):
-            _logger.error(f"HTTP error occurred: {response.text}")
+            _logger.error("HTTP error occurred: %s", response.text)
             raise APIError(f"HTTP {response.status_code}: {response.text}")
         elif isinstance(error, json.JSONDecodeError):
-            _logger.error(f"Invalid JSON response: {error}")
+            _logger.error("Invalid JSON response: %s", error)
             raise APIError("Invalid JSON response from API")
-        _logger.error(f"An unexpected error occurred: {error}")
+        _logger.error("An unexpected error occurred: %s", error)
         raise APIError(f"An unexpected error type was handled: {str(error)}")
 
     def _get_request_config(self, is_secure: bool = False) -> Dict[str, Any]:
@@ -241,73 +590,326 @@ class AzulAPI:
 
     async def _async_request(
         self,
-        data: Dict[str, Any],
+        data: RequestData,
         operation: str = "",
         retry_on_fail: bool = True,
         is_secure: bool = False,
+        hedge: bool = False,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
     ) -> Dict[str, Any]:
         """
         Make async request to Azul API.
 
         Args:
-            data: Request data to send
+            data: Request model or payload mapping to send
             operation: Optional operation name to append to URL
             retry_on_fail: Whether to retry with alternate URL on failure
                            (production only)
             is_secure: Whether this is a secure (3DS) request
+            hedge: Whether the operation is idempotent and may be hedged against
+                   the alternate URL (requires ``HEDGE_REQUESTS``, production only)
+            deadline: Optional absolute deadline for the whole call, including
+                      the failover attempt and any time queued by the merchant
+                      governor
+            priority: Traffic class, selecting the connection pool and the
+                      admission queue
 
         Returns:
             Dict with API response
 
         Raises:
             APIError: If request fails
+            DeadlineExceededError: If the deadline passes before an answer
         """
-        parameters = self._prepare_request(data)
-        endpoint = self._build_endpoint(operation)
-
-        _logger.debug(f"Making request to {endpoint} with data: {parameters}")
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceededError("Deadline expired before sending request")
+
+        body = self._encode_request(data)
+        name = self._operation_name(operation, data)
+        profile = self.timeout_profiles.get(name)
+
+        # Fails fast with NoHealthyEndpointError when every circuit is open
+        endpoints = [
+            self._build_endpoint(operation, base_url=endpoint.url)
+            for endpoint in self.router.available()
+        ]
+        if not retry_on_fail:
+            endpoints = endpoints[:1]
+
+        log_event(
+            _logger,
+            logging.DEBUG,
+            "azul.request",
+            self.settings.LOG_SAMPLE_RATE,
+            url=endpoints[0],
+            payload=data,
+        )
 
+        await self._ensure_ssl_context()
+        # One admission covers the failover attempt as well
+        governor = self.governor
+        await governor.acquire(deadline, priority)
+        # Headers and pool come from the same generation, which is kept open
+        # until this request finishes even if a reload retires it meanwhile
+        generation = self._generation
+        generation.enter()
         try:
-            async with httpx.AsyncClient(verify=self.ssl_context) as client:
+            client = self._get_client(priority, generation)
+            config = self._get_request_config(is_secure)
+
+            if hedge and len(endpoints) > 1 and self.settings.HEDGE_REQUESTS:
+                budget = profile.attempt_budget(deadline, attempts_left=1)
+                config["timeout"] = profile.timeout(budget)
+                hedged = self._hedged_request(
+                    client, (endpoints[0], endpoints[1]), body, config, name, priority
+                )
+                if budget is None:
+                    return await hedged
+                try:
+                    return await asyncio.wait_for(hedged, budget)
+                except asyncio.TimeoutError as e:
+                    raise DeadlineExceededError("Deadline exceeded") from e
+
+            for attempt, endpoint in enumerate(endpoints, start=1):
+                budget = profile.attempt_budget(
+                    deadline, attempts_left=len(endpoints) - attempt + 1
+                )
+                config["timeout"] = profile.timeout(budget)
                 try:
-                    response = await client.post(
-                        endpoint, json=parameters, **self._get_request_config(is_secure)
+                    return await self._send(
+                        client, endpoint, body, config, name, budget=budget
                     )
-                    return self._handle_response(response)
-                except (httpx.HTTPError, APIError) as e:
-                    if retry_on_fail and self.ENVIRONMENT == Environment.PROD:
-                        _logger.info("Retrying request with alternate URL")
-                        alt_endpoint = f"{self.ALT_URL}?{operation}"
-                        response = await client.post(
-                            alt_endpoint,
-                            json=parameters,
-                            **self._get_request_config(is_secure),
-                        )
-                        return self._handle_response(response)
-                    raise APIError(f"Request failed: {str(e)}") from e
+                except Exception as e:
+                    if not self._is_retry_safe(e):
+                        raise
+                    if attempt == len(endpoints):
+                        if deadline is not None and deadline.expired:
+                            raise DeadlineExceededError("Deadline exceeded") from e
+                        raise APIError(f"Request failed: {str(e)}") from e
+                    if deadline is not None and (
+                        deadline.remaining() < profile.min_attempt
+                    ):
+                        raise DeadlineExceededError(
+                            "Not enough time left before the deadline to retry "
+                            "with alternate URL"
+                        ) from e
+                    _logger.info("Retrying request with alternate URL")
+            raise APIError("No endpoint available for request")
+        except (DeadlineExceededError, NoHealthyEndpointError) as err:
+            _logger.error("Request failed: %s", err)
+            raise
         except Exception as err:
-            _logger.error(f"Request failed: {str(err)}")
+            _logger.error("Request failed: %s", err)
             raise APIError(f"Request failed: {str(err)}") from err
+        finally:
+            generation.exit()
+            governor.release(priority)
+
+    @staticmethod
+    def _operation_name(operation: str, data: RequestData) -> str:
+        """Return the name of an operation.
+
+        Operations sent to the default endpoint (Sale, Hold, Refund) are told
+        apart by their ``TrxType``.
+        """
+        return operation or str(_get_field(data, "TrxType") or "Sale")
 
-    def _build_endpoint(self, operation: str = "") -> str:
+    def _get_timeout_profile(self, operation: str, data: RequestData) -> TimeoutProfile:
+        """Return the timeout profile for an operation."""
+        return self.timeout_profiles.get(self._operation_name(operation, data))
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        body: bytes,
+        config: Dict[str, Any],
+        operation: str = "",
+        budget: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Send a single request to one endpoint and record its outcome.
+
+        Args:
+            operation: Operation name (see `_operation_name`) its latency is
+                recorded under.
+            budget: Optional overall time limit for the attempt, in seconds.
+        """
+        base_url = endpoint.split("?", 1)[0]
+        started = time.monotonic()
+        try:
+            request = client.post(endpoint, content=body, **config)
+            if budget is None:
+                response = await request
+            else:
+                try:
+                    response = await asyncio.wait_for(request, budget)
+                except asyncio.TimeoutError as e:
+                    raise httpx.TimeoutException(
+                        f"Request exceeded its time budget of {budget:.2f}s"
+                    ) from e
+        except httpx.HTTPError as e:
+            self.router.record_failure(base_url)
+            if isinstance(e, httpx.TimeoutException):
+                self.governor.record_overload()
+            raise
+        try:
+            result = self._handle_response(response)
+        except (APIError, AzulGatewayError) as e:
+            # Client errors (4xx) say nothing about the endpoint's health
+            if response.is_success or response.status_code >= 500:
+                self.router.record_failure(base_url)
+            if self._is_overload(e, response):
+                self.governor.record_overload()
+            raise
+        elapsed = time.monotonic() - started
+        self.router.record_success(base_url, elapsed)
+        self._latency_window(base_url, operation).record(elapsed)
+        self.governor.record_success(elapsed)
+        return result
+
+    @staticmethod
+    def _is_overload(error: Exception, response: httpx.Response) -> bool:
+        """Whether a failed response means the gateway is over capacity."""
+        if response.status_code in (429, 503):
+            return True
+        return isinstance(error, AzulGatewayError) and any(
+            marker in str(error) for marker in ("timeout", "Server Unavailable")
+        )
+
+    @staticmethod
+    def _is_retry_safe(error: BaseException) -> bool:
+        """Whether a failure is the endpoint's, so another endpoint may answer.
+
+        Transport errors, HTTP 5xx answers and gateway (SGS) errors qualify;
+        client errors and other API errors would fail the same way on any
+        endpoint. Both failover and hedging follow this rule.
+        """
+        if isinstance(error, (httpx.TransportError, AzulGatewayError)):
+            return True
+        # HTTP errors are raised as APIError while handling the status error
+        cause = error.__context__
+        return (
+            isinstance(error, APIError)
+            and isinstance(cause, httpx.HTTPStatusError)
+            and cause.response.status_code >= 500
+        )
+
+    async def _probe_endpoint(self, base_url: str) -> bool:
+        """Check whether a gateway base URL answers HTTP requests."""
+        await self._ensure_ssl_context()
+        response = await self._get_client(Priority.BACKGROUND).get(
+            base_url, timeout=self.settings.CIRCUIT_PROBE_TIMEOUT
+        )
+        return response.status_code < 500
+
+    def _latency_window(self, endpoint: str, operation: str) -> LatencyWindow:
+        """Return the latency window of `operation` on the base URL of `endpoint`."""
+        key = (endpoint.split("?", 1)[0], operation)
+        window = self._latency.get(key)
+        if window is None:
+            window = self._latency[key] = LatencyWindow()
+        return window
+
+    def _hedge_delay(self, endpoint: str, operation: str) -> float:
+        """Return how long to wait on `endpoint` before hedging `operation`."""
+        window = self._latency_window(endpoint, operation)
+        if len(window) < self.settings.HEDGE_MIN_SAMPLES:
+            return self.settings.HEDGE_DEFAULT_DELAY
+        return window.percentile(self.settings.HEDGE_PERCENTILE)
+
+    async def _hedged_request(
+        self,
+        client: httpx.AsyncClient,
+        endpoints: Tuple[str, str],
+        body: bytes,
+        config: Dict[str, Any],
+        operation: str,
+        priority: Priority,
+    ) -> Dict[str, Any]:
+        """
+        Race the primary endpoint against a delayed copy sent to the alternate.
+
+        The copy is only sent if the primary has not answered within the
+        observed latency percentile of `operation`, or failed in a way another
+        endpoint may not (see `_is_retry_safe`); any other early failure is
+        raised as is. The copy is a second request to the gateway, so it needs
+        its own admission by the merchant governor: without a token or slot
+        available at once, the primary is awaited alone. The first successful
+        answer wins and the other in-flight request is cancelled.
+        """
+        primary, alternate = endpoints
+        pending = {
+            asyncio.ensure_future(self._send(client, primary, body, config, operation))
+        }
+        error: Optional[BaseException] = None
+        admitted = False
+        try:
+            done, pending = await asyncio.wait(
+                pending, timeout=self._hedge_delay(primary, operation)
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+                if not self._is_retry_safe(error):
+                    raise error
+
+            admitted = self.governor.try_acquire(priority)
+            if admitted:
+                _logger.info("Hedging request with alternate URL")
+                pending.add(
+                    asyncio.ensure_future(
+                        self._send(client, alternate, body, config, operation)
+                    )
+                )
+            elif error is not None:
+                raise error
+            else:
+                _logger.info("Not hedging request: merchant limit reached")
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error or APIError("Hedged request failed")
+        finally:
+            for task in pending:
+                task.cancel()
+            if admitted:
+                self.governor.release(priority)
+
+    def _build_endpoint(
+        self, operation: str = "", base_url: Optional[str] = None
+    ) -> str:
         """Build the full endpoint URL."""
-        return f"{self.url}?{operation}" if operation else self.url
+        base_url = base_url or self.url
+        return f"{base_url}?{operation}" if operation else base_url
 
     async def post(
         self,
         endpoint: str,
-        data: Dict[str, Any],
+        data: RequestData,
         is_secure: bool = False,
         retry_on_fail: bool = True,
+        hedge: bool = False,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
     ) -> Dict[str, Any]:
         """
         Make a POST request to the Azul API.
 
         Args:
             endpoint: API endpoint (e.g., "/webservices/JSON/default.aspx")
-            data: Request data to send
+            data: Request model or payload mapping to send
             is_secure: Whether this is a secure (3DS) request
             retry_on_fail: Whether to retry with alternate URL on failure
+            hedge: Whether the (idempotent) request may be hedged
+            deadline: Optional absolute deadline for the call
+            priority: Traffic class of the request
 
         Returns:
             Dict with API response
@@ -325,4 +927,7 @@ class AzulAPI:
             operation=operation,
             retry_on_fail=retry_on_fail,
             is_secure=is_secure,
+            hedge=hedge,
+            deadline=deadline,
+            priority=priority,
         )
@@ -15,6 +15,17 @@ class Environment(str, Enum):
     PROD = "prod"
 
 
+class Priority(str, Enum):
+    """Traffic class of a request.
+
+    Interactive requests (e.g. checkout) are admitted before background ones
+    (reconciliation, bulk refunds) and use their own connection pool.
+    """
+
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
 class AzulEndpoints:
     """Holds the API endpoint URLs for different environments."""
 
@@ -0,0 +1,244 @@
+"""
+In-process DNS cache and IP pinning for the Azul gateway hosts.
+
+Every new pooled connection normally resolves its host through the system
+resolver, which can stall under burst load or container DNS limits. With
+``DNS_CACHE_TTL`` set, `DNSCache` keeps the resolved addresses of each host:
+fresh entries are served from memory, stale ones are still served while a
+single background lookup refreshes them, and a failed refresh keeps the last
+known addresses. ``DNS_PINNED_HOSTS`` maps hosts to fixed IPs (e.g. for the
+site-to-site VPN), which are never resolved.
+
+`ResolvingBackend` plugs the cache into the httpcore connection pool below
+httpx. Only the TCP connection goes to the IP: TLS still uses the host name
+for SNI and certificate verification.
+"""
+
+import asyncio
+import ipaddress
+import logging
+import socket
+import ssl
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+import httpcore
+import httpx
+
+from pyazul.core.fork import register_after_fork
+
+_logger = logging.getLogger(__name__)
+
+Lookup = Callable[[str, int], Awaitable[List[str]]]
+
+
+async def _getaddrinfo(host: str, port: int) -> List[str]:
+    """Resolve `host` with the system resolver, without blocking the loop."""
+    infos = await asyncio.get_running_loop().getaddrinfo(
+        host, port, type=socket.SOCK_STREAM
+    )
+    addresses: List[str] = []
+    for *_, sockaddr in infos:
+        if sockaddr[0] not in addresses:
+            addresses.append(sockaddr[0])
+    return addresses
+
+
+def _is_ip(host: str) -> bool:
+    """Whether `host` is an IP literal."""
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+class DNSCache:
+    """Resolved addresses per host, refreshed in the background when stale."""
+
+    def __init__(
+        self,
+        ttl: Optional[float] = 60.0,
+        pinned: Optional[Mapping[str, Sequence[str]]] = None,
+        lookup: Optional[Lookup] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry is fresh; None disables caching, so only
+                pinned hosts skip the resolver.
+            pinned: Fixed addresses per host name.
+            lookup: Coroutine function resolving ``(host, port)`` to addresses;
+                defaults to the system resolver.
+        """
+        self.ttl = ttl
+        self.pinned = {
+            host.lower(): list(addresses) for host, addresses in (pinned or {}).items()
+        }
+        self._lookup = lookup or _getaddrinfo
+        self._entries: Dict[Tuple[str, int], Tuple[List[str], float]] = {}
+        self._lookups: Dict[Tuple[str, int], "asyncio.Future[List[str]]"] = {}
+        self._refreshes: Set["asyncio.Task[None]"] = set()
+        self.hits = 0
+        self.misses = 0
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Forget lookups of the parent's event loop; entries stay valid."""
+        self._lookups = {}
+        self._refreshes = set()
+
+    async def resolve(self, host: str, port: int) -> List[str]:
+        """
+        Return the addresses to connect to for `host`.
+
+        Raises:
+            OSError: If the host cannot be resolved and nothing is cached.
+        """
+        pinned = self.pinned.get(host.lower())
+        if pinned:
+            return pinned
+        if self.ttl is None:
+            return await self._lookup(host, port)
+
+        key = (host.lower(), port)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return await self._shared_lookup(key)
+        self.hits += 1
+        addresses, resolved_at = entry
+        if time.monotonic() - resolved_at >= self.ttl and key not in self._lookups:
+            task = asyncio.get_running_loop().create_task(self._refresh(key))
+            self._refreshes.add(task)
+            task.add_done_callback(self._refreshes.discard)
+        return addresses
+
+    def invalidate(self, host: str) -> None:
+        """Drop the cached addresses of `host`, e.g. after connecting failed."""
+        for key in [key for key in self._entries if key[0] == host.lower()]:
+            del self._entries[key]
+
+    async def _shared_lookup(self, key: Tuple[str, int]) -> List[str]:
+        """Resolve once for every concurrent caller and cache the result."""
+        future = self._lookups.get(key)
+        if future is None:
+            future = self._lookups[key] = asyncio.ensure_future(self._store(key))
+            future.add_done_callback(lambda done: self._forget(key, done))
+        # A cancelled caller must not cancel the lookup others are waiting on
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Tuple[str, int], done: "asyncio.Future[List[str]]") -> None:
+        """Drop a finished lookup."""
+        if self._lookups.get(key) is done:
+            del self._lookups[key]
+
+    async def _store(self, key: Tuple[str, int]) -> List[str]:
+        """Resolve `key` and cache its addresses."""
+        addresses = await self._lookup(*key)
+        if not addresses:
+            raise OSError(f"No addresses found for {key[0]}")
+        self._entries[key] = (addresses, time.monotonic())
+        return addresses
+
+    async def _refresh(self, key: Tuple[str, int]) -> None:
+        """Refresh a stale entry, keeping the old addresses if it fails."""
+        try:
+            await self._shared_lookup(key)
+        except Exception as e:  # Keep serving the last known addresses
+            _logger.warning("DNS refresh of %s failed: %s", key[0], e)
+
+    async def aclose(self) -> None:
+        """Cancel background refreshes."""
+        tasks = list(self._refreshes)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class ResolvingBackend(httpcore.AsyncNetworkBackend):
+    """httpcore network backend connecting through a `DNSCache`."""
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, cache: DNSCache):
+        """Wrap `backend`, resolving host names through `cache` first."""
+        self._backend = backend
+        self.cache = cache
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[httpcore.SOCKET_OPTION]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        """Connect to the first reachable address of `host`."""
+        if _is_ip(host):
+            addresses = [host]
+        else:
+            try:
+                addresses = await self.cache.resolve(host, port)
+            except OSError as e:
+                raise httpcore.ConnectError(f"Cannot resolve {host}: {e}") from e
+        error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                _logger.debug("Connecting to %s (%s) failed: %s", host, address, e)
+                error = e
+        # Every cached address failed: resolve again on the next attempt
+        self.cache.invalidate(host)
+        raise error or httpcore.ConnectError(f"No addresses for {host}")
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable[httpcore.SOCKET_OPTION]] = None,
+    ) -> httpcore.AsyncNetworkStream:  # pragma: no cover - Azul is TCP only
+        """Delegate to the wrapped backend."""
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        """Delegate to the wrapped backend."""
+        await self._backend.sleep(seconds)
+
+
+def resolving_transport(
+    cache: DNSCache, verify: ssl.SSLContext, limits: httpx.Limits
+) -> httpx.AsyncHTTPTransport:
+    """
+    Build an httpx transport whose connections resolve through `cache`.
+
+    Args:
+        cache: DNS cache to use.
+        verify: SSL context holding the Azul client certificates.
+        limits: Connection pool limits.
+    """
+    transport = httpx.AsyncHTTPTransport(verify=verify, limits=limits)
+    # httpx does not expose the network backend of its httpcore pool
+    pool = transport._pool
+    pool._network_backend = ResolvingBackend(pool._network_backend, cache)
+    return transport
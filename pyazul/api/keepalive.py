@@ -0,0 +1,89 @@
+"""
+Keep-alive of pooled connections to the Azul gateway endpoints.
+
+Idle pooled connections expire after ``HTTP_KEEPALIVE_EXPIRY`` seconds, and
+the next request pays DNS, TCP and the mutual-TLS handshake again. The
+alternate production host is usually idle, so a failover pays it at the worst
+moment. `KeepAlive` periodically runs `AzulAPI.warmup`, which keeps a minimum
+number of connections to every healthy endpoint open.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from pyazul.core.fork import register_after_fork
+
+if TYPE_CHECKING:
+    from pyazul.api.client import AzulAPI
+
+_logger = logging.getLogger(__name__)
+
+
+class KeepAlive:
+    """Periodically refresh warm connections to every gateway endpoint."""
+
+    def __init__(self, api: "AzulAPI", interval: float, connections: int = 1):
+        """
+        Initialize the keep-alive.
+
+        Args:
+            api: Client whose pools are kept warm.
+            interval: Seconds between refreshes; keep it below
+                ``HTTP_KEEPALIVE_EXPIRY`` so idle connections never expire.
+            connections: Connections kept open per endpoint.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+        self.api = api
+        self.interval = interval
+        self.connections = connections
+        self.pings = 0
+        self._task: Optional["asyncio.Task[None]"] = None
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Forget the task of the parent; `start()` again in the child."""
+        self._task = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is active."""
+        return self._task is not None and not self._task.done()
+
+    async def ping(self) -> int:
+        """
+        Refresh the warm connections once.
+
+        Skipped while enough requests are in flight to keep them warm.
+
+        Returns:
+            Number of connections that answered.
+        """
+        if self.api.generation.in_flight >= self.connections:
+            return 0
+        self.pings += 1
+        return await self.api.warmup(self.connections)
+
+    def start(self) -> None:
+        """Start refreshing in the background of the running event loop."""
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        """Refresh until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.ping()
+            except Exception as e:  # Requests will reconnect on their own
+                _logger.debug("Connection keep-alive failed: %s", e)
+
+    async def aclose(self) -> None:
+        """Stop refreshing."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
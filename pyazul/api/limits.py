@@ -0,0 +1,544 @@
+"""
+Client-side admission control for requests sent to the Azul gateway.
+
+Azul throttles per merchant, so bursts from many workers end in SGS gateway
+errors. This module provides a token-bucket rate limit and a max-in-flight
+limiter (static, or adaptive with AIMD), combined per merchant by
+`MerchantGovernor`, which also tracks how long requests wait in its queue.
+"""
+
+import asyncio
+import logging
+import math
+import time
+import weakref
+from collections import defaultdict, deque
+from typing import Any, ClassVar, Deque, Dict, Mapping, Optional, Tuple
+
+from pyazul.api.constants import Priority
+from pyazul.api.stats import LatencyWindow
+from pyazul.api.timeouts import Deadline
+from pyazul.core.exceptions import DeadlineExceededError
+from pyazul.core.fork import after_fork
+
+_logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter.
+
+    Tokens are reserved up front, so the bucket may go negative: callers are
+    served in arrival order and each one knows its exact wait before queueing.
+    Priorities are integers as in `ConcurrencyLimiter`: priority 0 reserves
+    ahead, while less urgent callers queue in arrival order and only take a
+    token the bucket actually holds, so they never delay a priority 0 caller.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Maximum number of tokens held (requests sent back to back).
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._spare_waiters: Deque["asyncio.Future[None]"] = deque()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def reserve(self, max_wait: Optional[float] = None) -> float:
+        """
+        Reserve a token and return how long to wait before using it.
+
+        Args:
+            max_wait: Optional longest acceptable wait, in seconds.
+
+        Raises:
+            DeadlineExceededError: If the wait would exceed `max_wait`; no token
+                is reserved in that case.
+        """
+        self._refill()
+        wait = max(0.0, (1.0 - self._tokens) / self.rate)
+        if max_wait is not None and wait > max_wait:
+            raise DeadlineExceededError(
+                f"Rate limit wait of {wait:.2f}s exceeds the remaining deadline"
+            )
+        self._tokens -= 1.0
+        return wait
+
+    def try_take(self) -> bool:
+        """Take a token the bucket holds, without waiting or reserving ahead."""
+        self._refill()
+        if self._spare_waiters or self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    async def acquire(
+        self, max_wait: Optional[float] = None, priority: int = 0
+    ) -> float:
+        """
+        Wait for a token and return the time spent waiting.
+
+        Args:
+            max_wait: Optional longest acceptable wait, in seconds.
+            priority: Lower values are served first; see the class docstring.
+
+        Raises:
+            DeadlineExceededError: If the wait would exceed `max_wait`, which is
+                known up front at priority 0.
+        """
+        if priority > 0:
+            return await self._acquire_spare(max_wait)
+        wait = self.reserve(max_wait)
+        if wait:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._tokens += 1.0
+                raise
+        return wait
+
+    async def _acquire_spare(self, max_wait: Optional[float]) -> float:
+        """Wait for a token no reservation has claimed, first come first served."""
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(self._take_spare(), max_wait)
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(
+                "Deadline expired while queued for the rate limit"
+            ) from None
+        return time.monotonic() - started
+
+    async def _take_spare(self) -> None:
+        """Take a held token once every earlier spare waiter has taken one."""
+        waiter = asyncio.get_running_loop().create_future()
+        self._spare_waiters.append(waiter)
+        try:
+            if self._spare_waiters[0] is not waiter:
+                await waiter
+            while True:
+                self._refill()
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+        finally:
+            self._spare_waiters.remove(waiter)
+            if self._spare_waiters and not self._spare_waiters[0].done():
+                self._spare_waiters[0].set_result(None)
+
+
+class ConcurrencyLimiter:
+    """
+    Limiter on the number of requests in flight, with one queue per priority.
+
+    Priorities are integers, lower values first: a freed slot goes to the oldest
+    waiter of the most urgent queue, and new arrivals never overtake requests
+    already queued at the same or a more urgent priority. A priority can be
+    capped to a share of the limit so that it never takes every slot.
+    Subclasses may change `limit` at runtime through `_set_limit()` and react
+    to request outcomes by overriding `on_success()` and `on_overload()`.
+    """
+
+    def __init__(self, limit: int, shares: Optional[Mapping[int, float]] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            limit: Maximum number of concurrent holders.
+            shares: Optional fraction of `limit` each priority may hold at once;
+                priorities not listed may use the whole limit.
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.limit = limit
+        self.shares: Dict[int, float] = dict(shares or {})
+        self._in_flight = 0
+        self._active: Dict[int, int] = defaultdict(int)
+        self._waiters: Dict[int, Deque["asyncio.Future[None]"]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently held."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of callers waiting for a slot."""
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    async def acquire(self, timeout: Optional[float] = None, priority: int = 0) -> None:
+        """
+        Wait for a free slot.
+
+        Args:
+            timeout: Optional longest wait, in seconds.
+            priority: Queue to wait in; lower values are served first.
+
+        Raises:
+            DeadlineExceededError: If no slot frees up within `timeout`.
+        """
+        if self.try_acquire(priority):
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(priority, deque()).append(waiter)
+        try:
+            await asyncio.wait((waiter,), timeout=timeout)
+        except asyncio.CancelledError:
+            self._abandon(waiter, priority)
+            raise
+        if not waiter.done():
+            self._abandon(waiter, priority)
+            raise DeadlineExceededError("Deadline expired while queued for a slot")
+
+    def try_acquire(self, priority: int = 0) -> bool:
+        """Take a free slot unless one would have to be waited for."""
+        if self._can_admit(priority) and not any(
+            waiters for rank, waiters in self._waiters.items() if rank <= priority
+        ):
+            self._admit(priority)
+            return True
+        return False
+
+    def release(self, priority: int = 0) -> None:
+        """Release a slot taken at `priority` and admit waiting callers."""
+        self._in_flight -= 1
+        self._active[priority] -= 1
+        self._dispatch()
+
+    def on_success(self, seconds: float) -> None:
+        """Record a request that completed normally after `seconds`."""
+
+    def on_overload(self) -> None:
+        """Record a request that failed because the gateway is overloaded."""
+
+    def _set_limit(self, limit: int) -> None:
+        """Change the limit, admitting waiters if it grew."""
+        self.limit = limit
+        self._dispatch()
+
+    def _can_admit(self, priority: int) -> bool:
+        """Whether a caller at `priority` may take a slot now."""
+        cap = max(1, int(self.limit * self.shares.get(priority, 1.0)))
+        return self._in_flight < self.limit and self._active[priority] < cap
+
+    def _admit(self, priority: int) -> None:
+        """Account for a slot taken at `priority`."""
+        self._in_flight += 1
+        self._active[priority] += 1
+
+    def _dispatch(self) -> None:
+        """Hand free slots to waiters, most urgent priority first."""
+        for priority in sorted(self._waiters):
+            waiters = self._waiters[priority]
+            while waiters and self._can_admit(priority):
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    self._admit(priority)
+                    waiter.set_result(None)
+
+    def _abandon(self, waiter: "asyncio.Future[None]", priority: int) -> None:
+        """Withdraw a waiter, giving back the slot if it was already granted."""
+        if waiter.done():
+            self.release(priority)
+            return
+        waiter.cancel()
+        try:
+            self._waiters[priority].remove(waiter)
+        except ValueError:
+            pass
+
+
+class AdaptiveConcurrencyLimiter(ConcurrencyLimiter):
+    """
+    Concurrency limiter whose limit follows the gateway's capacity (AIMD).
+
+    Completed requests are evaluated in windows of `window` samples. While the
+    window's p90 latency stays within `tolerance` times its baseline and the
+    limit was actually reached, the limit grows by one. A latency rise or an
+    overload signal (gateway timeout or unavailable error) cuts it by
+    `backoff`, at most once per window.
+    """
+
+    def __init__(
+        self,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        initial: Optional[int] = None,
+        window: int = 20,
+        tolerance: float = 1.5,
+        backoff: float = 0.5,
+        shares: Optional[Mapping[int, float]] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            min_limit: Lowest limit the limiter may shrink to.
+            max_limit: Highest limit the limiter may grow to.
+            initial: Starting limit; defaults to halfway up the range.
+            window: Completed requests per evaluation.
+            tolerance: p90 latency ratio over the baseline treated as a rise.
+            backoff: Factor applied to the limit on a decrease.
+            shares: Optional fraction of the limit each priority may hold.
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= max_limit")
+        if initial is None:
+            initial = max(min_limit, max_limit // 2)
+        super().__init__(min(max(initial, min_limit), max_limit), shares)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.window = window
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.baseline: Optional[float] = None
+        self._latency = LatencyWindow(window)
+        self._pending = 0
+        self._saturated = False
+        self._backed_off = False
+
+    async def acquire(self, timeout: Optional[float] = None, priority: int = 0) -> None:
+        """Wait for a free slot, noting whether the limit was reached."""
+        await super().acquire(timeout, priority)
+        if self._in_flight >= self.limit:
+            self._saturated = True
+
+    def on_success(self, seconds: float) -> None:
+        """Record a latency sample and re-evaluate the limit every window."""
+        self._latency.record(seconds)
+        self._pending += 1
+        if self._pending < self.window:
+            return
+        p90 = self._latency.percentile(0.9)
+        if self.baseline is None:
+            self.baseline = p90
+        if p90 > self.baseline * self.tolerance:
+            self._decrease()
+        else:
+            # Follow slow drifts of the baseline, not spikes
+            self.baseline += 0.1 * (p90 - self.baseline)
+            if self._saturated and not self._backed_off:
+                self._set_limit(min(self.limit + 1, self.max_limit))
+        self._pending = 0
+        self._saturated = False
+        self._backed_off = False
+
+    def on_overload(self) -> None:
+        """Cut the limit after a gateway overload signal."""
+        self._decrease()
+
+    def _decrease(self) -> None:
+        """Apply the multiplicative decrease, once per window."""
+        if self._backed_off:
+            return
+        self._backed_off = True
+        self._set_limit(max(self.min_limit, int(self.limit * self.backoff)))
+
+
+_PRIORITY_RANKS = {Priority.INTERACTIVE: 0, Priority.BACKGROUND: 1}
+
+
+class MerchantGovernor:
+    """
+    Rate limit and max-in-flight governor shared by all clients of a merchant.
+
+    Use `for_merchant()` to get the governor for a merchant ID; every `AzulAPI`
+    configured for that merchant in the process then draws from the same limits
+    on a given event loop. Each loop gets its own governor, since queued
+    requests wait on futures bound to their loop (e.g. `PyAzulSync` next to an
+    async client).
+    Both limits are optional and the governor is a no-op when neither is set.
+    Interactive requests are admitted before background ones, which never
+    delay them on the rate limit and may only hold `background_share` of the
+    in-flight limit.
+
+    Attributes:
+        queue_wait: Time requests spent waiting for admission, in seconds.
+        rejected: Requests refused because their deadline would expire in queue.
+    """
+
+    # Governors by event loop (None outside one), then by merchant ID
+    _registry: ClassVar[
+        "weakref.WeakKeyDictionary[Any, Dict[str, MerchantGovernor]]"
+    ] = weakref.WeakKeyDictionary()
+    _unbound: ClassVar[Dict[str, "MerchantGovernor"]] = {}
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        adaptive: bool = False,
+        min_in_flight: int = 1,
+        background_share: float = 1.0,
+    ):
+        """
+        Initialize the governor.
+
+        Args:
+            rate: Optional requests per second.
+            burst: Requests allowed back to back; defaults to one second of `rate`.
+            max_in_flight: Optional maximum number of concurrent requests.
+            adaptive: Whether the in-flight limit adapts between `min_in_flight`
+                and `max_in_flight` to the gateway's latency and errors.
+            min_in_flight: Lowest in-flight limit when adaptive.
+            background_share: Fraction of the in-flight limit background
+                requests may hold at once.
+        """
+        self.bucket = (
+            TokenBucket(rate, burst or max(1, math.ceil(rate))) if rate else None
+        )
+        shares = {_PRIORITY_RANKS[Priority.BACKGROUND]: background_share}
+        self.limiter: Optional[ConcurrencyLimiter] = None
+        if adaptive and max_in_flight:
+            self.limiter = AdaptiveConcurrencyLimiter(
+                min(min_in_flight, max_in_flight), max_in_flight, shares=shares
+            )
+        elif max_in_flight:
+            self.limiter = ConcurrencyLimiter(max_in_flight, shares)
+        self.queue_wait = LatencyWindow()
+        self.rejected = 0
+        self.limits: Tuple[Any, ...] = (
+            rate,
+            burst,
+            max_in_flight,
+            adaptive,
+            min_in_flight,
+            background_share,
+        )
+
+    @classmethod
+    def for_merchant(
+        cls,
+        merchant_id: Optional[str],
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        adaptive: bool = False,
+        min_in_flight: int = 1,
+        background_share: float = 1.0,
+    ) -> "MerchantGovernor":
+        """
+        Return the governor of a merchant on the running event loop.
+
+        The governor is created on first use. Its limits are those of the
+        first caller; a later caller asking for different limits gets the
+        existing governor and a logged warning.
+        """
+        if not (rate or max_in_flight):
+            return cls()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            governors = cls._unbound
+        else:
+            governors = cls._registry.setdefault(loop, {})
+        limits = (rate, burst, max_in_flight, adaptive, min_in_flight, background_share)
+        key = merchant_id or ""
+        governor = governors.get(key)
+        if governor is None:
+            governor = governors[key] = cls(*limits)
+        elif governor.limits != limits:
+            _logger.warning(
+                "Merchant %s already has a governor with limits %s; "
+                "ignoring limits %s",
+                key,
+                governor.limits,
+                limits,
+            )
+        return governor
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured."""
+        return self.bucket is not None or self.limiter is not None
+
+    async def acquire(
+        self,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> float:
+        """
+        Wait for admission and return the time spent queued.
+
+        An interactive request whose deadline would pass while waiting on the
+        rate limit is rejected up front; background requests, whose rate limit
+        wait is not known in advance, and requests waiting for a concurrency
+        slot give up when their deadline passes. Each successful call must be
+        paired with `release()`.
+
+        Raises:
+            DeadlineExceededError: If the request cannot be admitted in time.
+        """
+        if not self.enabled:
+            return 0.0
+        started = time.monotonic()
+        try:
+            if self.bucket is not None:
+                remaining = deadline.remaining() if deadline is not None else None
+                await self.bucket.acquire(remaining, _PRIORITY_RANKS[priority])
+            if self.limiter is not None:
+                remaining = deadline.remaining() if deadline is not None else None
+                await self.limiter.acquire(remaining, _PRIORITY_RANKS[priority])
+        except DeadlineExceededError:
+            self.rejected += 1
+            raise
+        waited = time.monotonic() - started
+        self.queue_wait.record(waited)
+        return waited
+
+    def try_acquire(self, priority: Priority = Priority.INTERACTIVE) -> bool:
+        """
+        Admit a request only if no waiting is needed, e.g. for a hedged copy.
+
+        Returns:
+            True if admitted, in which case the call must be paired with
+            `release()`; False if the request would have to queue.
+        """
+        if not self.enabled:
+            return True
+        rank = _PRIORITY_RANKS[priority]
+        if self.limiter is not None and not self.limiter.try_acquire(rank):
+            return False
+        if self.bucket is not None and not self.bucket.try_take():
+            if self.limiter is not None:
+                self.limiter.release(rank)
+            return False
+        return True
+
+    def release(self, priority: Priority = Priority.INTERACTIVE) -> None:
+        """Release the concurrency slot taken by `acquire()`."""
+        if self.limiter is not None:
+            self.limiter.release(_PRIORITY_RANKS[priority])
+
+    def record_success(self, seconds: float) -> None:
+        """Report a request the gateway answered normally."""
+        if self.limiter is not None:
+            self.limiter.on_success(seconds)
+
+    def record_overload(self) -> None:
+        """Report a request that failed because the gateway is overloaded."""
+        if self.limiter is not None:
+            self.limiter.on_overload()
+
+
+@after_fork
+def _reset_governors() -> None:
+    """Forget the governors of the parent; their queues belong to its loop."""
+    MerchantGovernor._registry.clear()
+    MerchantGovernor._unbound.clear()
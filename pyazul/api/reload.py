@@ -0,0 +1,204 @@
+"""
+Hot reload of Azul certificates and credentials.
+
+An `AzulAPI` keeps its SSL context, ``Auth1``/``Auth2`` and connection pools in
+a `ClientGeneration`. Reloading builds the next generation (loading the new
+certificate in a worker thread), swaps it in at once and retires the previous
+one: requests already running keep using the retired pools, which are closed
+when the last of them finishes.
+
+`CredentialWatcher` polls the certificate files and the settings source and
+triggers the reload when anything changed, so rotations need no restart.
+"""
+
+import asyncio
+import logging
+import ssl
+from typing import Callable, Dict, Optional, Protocol, Tuple
+
+import httpx
+
+from pyazul.api.constants import Priority
+from pyazul.core.certificates import certificate_fingerprint
+from pyazul.core.config import AzulSettings
+from pyazul.core.fork import register_after_fork
+
+_logger = logging.getLogger(__name__)
+
+
+class ClientGeneration:
+    """SSL context, credentials and pooled HTTP clients of one configuration."""
+
+    def __init__(
+        self,
+        settings: AzulSettings,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        number: int = 1,
+    ):
+        """
+        Initialize a generation.
+
+        Args:
+            settings: Settings the credentials and certificates come from.
+            ssl_context: SSL context, if already loaded.
+            number: Sequence number of the generation, starting at 1.
+        """
+        self.settings = settings
+        self.auth1 = settings.AUTH1
+        self.auth2 = settings.AUTH2
+        self.ssl_context = ssl_context
+        self.number = number
+        self.clients: Dict[Priority, httpx.AsyncClient] = {}
+        self.in_flight = 0
+        self.retired = False
+        self._closed: Optional[asyncio.Event] = None
+        self._closing: Optional["asyncio.Task[None]"] = None
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Drop the connections of the parent without closing them.
+
+        Closing would shut down sockets the parent still uses; the SSL context
+        is kept and new pools are built on first use.
+        """
+        self.clients = {}
+        self.in_flight = 0
+        self._closed = None
+        self._closing = None
+
+    def enter(self) -> None:
+        """Register a request using this generation."""
+        self.in_flight += 1
+
+    def exit(self) -> None:
+        """Unregister a request, closing a retired generation once drained."""
+        self.in_flight -= 1
+        if self.retired and self.in_flight == 0:
+            self._close_soon()
+
+    def retire(self) -> None:
+        """Stop handing out this generation and close it once drained."""
+        self.retired = True
+        self._closed = asyncio.Event()
+        if self.in_flight == 0:
+            self._close_soon()
+
+    def _close_soon(self) -> None:
+        """Schedule the closing of the pools."""
+        if self._closing is None:
+            self._closing = asyncio.get_running_loop().create_task(self.aclose())
+
+    async def wait_closed(self) -> None:
+        """Wait until a retired generation has drained and closed its pools."""
+        if self._closed is not None:
+            await self._closed.wait()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients."""
+        clients, self.clients = self.clients, {}
+        for client in clients.values():
+            await client.aclose()
+        if self._closed is not None:
+            self._closed.set()
+
+
+class Reloadable(Protocol):
+    """Client whose certificates and credentials can be hot reloaded."""
+
+    settings: AzulSettings
+
+    async def reload(self, settings: Optional[AzulSettings] = None) -> object:
+        """Apply the certificates and credentials of `settings`."""
+        ...
+
+
+def credentials_fingerprint(settings: AzulSettings) -> Tuple[str, ...]:
+    """Identify the certificate content and credentials of `settings`.
+
+    Reads certificate files, so it is blocking.
+    """
+    return (
+        certificate_fingerprint(settings.AZUL_CERT or "", settings.AZUL_KEY or ""),
+        settings.AUTH1 or "",
+        settings.AUTH2 or "",
+    )
+
+
+class CredentialWatcher:
+    """
+    Poll certificates and credentials and hot reload a client on change.
+
+    Certificate files are compared by content, so rewriting the file a
+    ``AZUL_CERT`` path points to is picked up as well as new settings values.
+    """
+
+    def __init__(
+        self,
+        target: Reloadable,
+        interval: float = 60.0,
+        settings_factory: Optional[Callable[[], AzulSettings]] = None,
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            target: `AzulAPI` or `PyAzul` to reload.
+            interval: Seconds between polls.
+            settings_factory: Returns the current settings; defaults to reading
+                them again from the environment and ``.env`` file.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.target = target
+        self.interval = interval
+        self.settings_factory = settings_factory or AzulSettings
+        self.reloads = 0
+        self._fingerprint: Optional[Tuple[str, ...]] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Forget the polling task of the parent; `start()` again to poll."""
+        self._task = None
+
+    async def check(self) -> bool:
+        """
+        Poll once, reloading the target if anything changed.
+
+        Returns:
+            Whether a reload happened.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = await asyncio.to_thread(
+                credentials_fingerprint, self.target.settings
+            )
+        settings = await asyncio.to_thread(self.settings_factory)
+        fingerprint = await asyncio.to_thread(credentials_fingerprint, settings)
+        if fingerprint == self._fingerprint:
+            return False
+        _logger.info("Certificates or credentials changed, reloading")
+        await self.target.reload(settings)
+        self._fingerprint = fingerprint
+        self.reloads += 1
+        return True
+
+    def start(self) -> None:
+        """Start polling in the background of the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        """Poll until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.check()
+            except Exception as e:  # Keep serving with the current generation
+                _logger.warning("Credential reload failed: %s", e)
+
+    async def aclose(self) -> None:
+        """Stop polling."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,217 @@
+"""
+Endpoint routing and circuit breaking for the Azul API client.
+
+Azul exposes a primary gateway and one or more alternates. `EndpointRouter`
+keeps per-endpoint health (success rate, latency and circuit state) so that
+requests go straight to a healthy endpoint instead of waiting for the primary
+to fail first. When an endpoint keeps failing its circuit opens, a background
+probe checks it periodically, and it only receives traffic again once the probe
+succeeds. If every circuit is open, requests fail fast.
+
+Isolated failures are forgiven over time: the success rate drifts back to 1.0
+with a half-life of `reset_timeout`, so traffic returns to the primary instead
+of staying on an alternate for good.
+"""
+
+import asyncio
+import logging
+import time
+from enum import Enum
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from pyazul.api.stats import LatencyWindow
+from pyazul.core.exceptions import NoHealthyEndpointError
+from pyazul.core.fork import register_after_fork
+
+_logger = logging.getLogger(__name__)
+
+# Weight of the newest outcome in the exponentially weighted success rate
+_SUCCESS_RATE_ALPHA = 0.2
+
+ProbeCallable = Callable[[str], Awaitable[bool]]
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker state of an endpoint."""
+
+    CLOSED = "closed"  # Healthy, receives traffic
+    OPEN = "open"  # Failing, receives no traffic until probed
+    HALF_OPEN = "half_open"  # Probe succeeded, next request decides
+
+
+class Endpoint:
+    """Health information for a single gateway base URL."""
+
+    def __init__(self, url: str, position: int):
+        """Initialize a healthy endpoint at the given preference position."""
+        self.url = url
+        self.position = position
+        self.state = CircuitState.CLOSED
+        self.success_rate = 1.0
+        self.updated_at = time.monotonic()
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.latency = LatencyWindow()
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return (
+            f"Endpoint(url={self.url!r}, state={self.state.value}, "
+            f"success_rate={self.success_rate:.2f})"
+        )
+
+
+class EndpointRouter:
+    """Choose gateway endpoints by health, with a circuit breaker per endpoint."""
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        probe: Optional[ProbeCallable] = None,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            urls: Base URLs in order of preference (duplicates are ignored).
+            failure_threshold: Consecutive failures that open an endpoint circuit.
+            reset_timeout: Seconds between background probes of an open endpoint,
+                and half-life of a failure's effect on the success rate.
+            probe: Coroutine function checking whether a base URL is reachable.
+                Without it (or outside an event loop) an open circuit is simply
+                retried with one request after `reset_timeout`.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._probe = probe
+        self._probe_tasks: Dict[str, "asyncio.Task[None]"] = {}
+        self.endpoints: Dict[str, Endpoint] = {}
+        register_after_fork(self)
+        for url in urls:
+            if url and url not in self.endpoints:
+                self.endpoints[url] = Endpoint(url, len(self.endpoints))
+
+    def get(self, url: str) -> Endpoint:
+        """Return the endpoint for a base URL, tracking unknown URLs on the fly."""
+        endpoint = self.endpoints.get(url)
+        if endpoint is None:
+            endpoint = self.endpoints[url] = Endpoint(url, len(self.endpoints))
+        return endpoint
+
+    def available(self) -> List[Endpoint]:
+        """
+        Return endpoints that may receive traffic, healthiest first.
+
+        Closed circuits come before half-open ones; within a state endpoints are
+        ordered by success rate, recovering toward 1.0 over time, and then by
+        configured preference.
+
+        Raises:
+            NoHealthyEndpointError: If every endpoint circuit is open.
+        """
+        now = time.monotonic()
+        candidates = []
+        for endpoint in self.endpoints.values():
+            self._recover(endpoint, now)
+            if (
+                endpoint.state == CircuitState.OPEN
+                and endpoint.url not in self._probe_tasks
+                and endpoint.opened_at is not None
+                and now - endpoint.opened_at >= self.reset_timeout
+            ):
+                endpoint.state = CircuitState.HALF_OPEN
+            if endpoint.state != CircuitState.OPEN:
+                candidates.append(endpoint)
+
+        if not candidates:
+            raise NoHealthyEndpointError(
+                "All Azul endpoints are unavailable (circuits open): "
+                + ", ".join(self.endpoints)
+            )
+        return sorted(
+            candidates,
+            key=lambda e: (
+                e.state != CircuitState.CLOSED,
+                -round(e.success_rate, 1),
+                e.position,
+            ),
+        )
+
+    def _recover(self, endpoint: Endpoint, now: float) -> None:
+        """Decay the failure share of the success rate since its last update."""
+        elapsed = now - endpoint.updated_at
+        endpoint.updated_at = now
+        if self.reset_timeout <= 0:
+            endpoint.success_rate = 1.0
+        elif elapsed > 0:
+            decay = 0.5 ** (elapsed / self.reset_timeout)
+            endpoint.success_rate = 1.0 - (1.0 - endpoint.success_rate) * decay
+
+    def record_success(self, url: str, seconds: float) -> None:
+        """Record a successful request and its latency."""
+        endpoint = self.get(url)
+        self._recover(endpoint, time.monotonic())
+        endpoint.latency.record(seconds)
+        endpoint.success_rate += _SUCCESS_RATE_ALPHA * (1.0 - endpoint.success_rate)
+        endpoint.consecutive_failures = 0
+        if endpoint.state != CircuitState.CLOSED:
+            _logger.info("Endpoint %s recovered, closing circuit", url)
+            endpoint.state = CircuitState.CLOSED
+            endpoint.opened_at = None
+
+    def record_failure(self, url: str) -> None:
+        """Record a failed request, opening the circuit past the threshold."""
+        endpoint = self.get(url)
+        self._recover(endpoint, time.monotonic())
+        endpoint.success_rate -= _SUCCESS_RATE_ALPHA * endpoint.success_rate
+        endpoint.consecutive_failures += 1
+        if endpoint.state == CircuitState.HALF_OPEN or (
+            endpoint.state == CircuitState.CLOSED
+            and endpoint.consecutive_failures >= self.failure_threshold
+        ):
+            self._open(endpoint)
+
+    def _open(self, endpoint: Endpoint) -> None:
+        """Open the circuit of an endpoint and start probing it."""
+        _logger.warning("Opening circuit for endpoint %s", endpoint.url)
+        endpoint.state = CircuitState.OPEN
+        endpoint.opened_at = time.monotonic()
+        if self._probe is None or endpoint.url in self._probe_tasks:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # No running loop, fall back to lazy half-open
+            return
+        task = loop.create_task(self._probe_loop(endpoint, self._probe))
+        self._probe_tasks[endpoint.url] = task
+        task.add_done_callback(lambda _: self._probe_tasks.pop(endpoint.url, None))
+
+    async def _probe_loop(self, endpoint: Endpoint, probe: ProbeCallable) -> None:
+        """Probe an open endpoint until it answers, then half-open its circuit."""
+        while endpoint.state == CircuitState.OPEN:
+            await asyncio.sleep(self.reset_timeout)
+            try:
+                healthy = await probe(endpoint.url)
+            except Exception as e:  # Probe failures only keep the circuit open
+                _logger.debug("Probe of %s failed: %s", endpoint.url, e)
+                healthy = False
+            if healthy and endpoint.state == CircuitState.OPEN:
+                _logger.info("Probe of %s succeeded, half-opening", endpoint.url)
+                endpoint.state = CircuitState.HALF_OPEN
+
+    def _after_fork(self) -> None:
+        """Forget probes running on the parent's event loop.
+
+        Open circuits fall back to a half-open retry after `reset_timeout`.
+        """
+        self._probe_tasks = {}
+
+    async def aclose(self) -> None:
+        """Cancel background probes."""
+        tasks = list(self._probe_tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
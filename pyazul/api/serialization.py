@@ -0,0 +1,70 @@
+"""
+JSON serialization for requests and responses exchanged with Azul.
+
+Request bodies are encoded straight to bytes (models through pydantic's
+serializer, plain mappings through the fastest available backend) and sent
+as-is, and responses are decoded from the raw body. `orjson` or `msgspec` are
+used when installed; otherwise the standard library `json` module is used.
+"""
+
+import json
+from typing import Any, Callable, Mapping, Union
+
+from pydantic import BaseModel
+
+RequestData = Union[Mapping[str, Any], BaseModel]
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    """Encode with the standard library, matching httpx's compact output."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _select_backend() -> "tuple[str, Callable[[Any], bytes], Callable[[bytes], Any]]":
+    """Return the name, encoder and decoder of the fastest installed backend."""
+    try:
+        import orjson
+
+        return "orjson", orjson.dumps, orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+
+        decoder = msgspec.json.Decoder()
+
+        def msgspec_loads(content: bytes) -> Any:
+            try:
+                return decoder.decode(content)
+            except msgspec.DecodeError as e:
+                text = content.decode("utf-8", errors="replace")
+                raise json.JSONDecodeError(str(e), text, 0) from e
+
+        return "msgspec", msgspec.json.encode, msgspec_loads
+    except ImportError:
+        pass
+    return "json", _stdlib_dumps, json.loads
+
+
+# Backend name, encoder (to bytes) and decoder; decoding errors are raised as
+# (subclasses of) json.JSONDecodeError whatever the backend.
+BACKEND, dumps, loads = _select_backend()
+
+
+def encode_request(data: RequestData, overrides: Mapping[str, Any]) -> bytes:
+    """
+    Encode a request body, applying `overrides` without mutating `data`.
+
+    Args:
+        data: A request model (dumped without ``None`` fields) or a mapping.
+        overrides: Fields that replace those of `data`, e.g. Channel and Store.
+
+    Returns:
+        The JSON body as bytes.
+    """
+    if isinstance(data, BaseModel):
+        if overrides.keys() <= type(data).model_fields.keys():
+            copy = data.model_copy(update=overrides)
+            return copy.model_dump_json(exclude_none=True).encode()
+        data = data.model_dump(mode="json", exclude_none=True)
+    return dumps({**data, **overrides})
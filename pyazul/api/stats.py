@@ -0,0 +1,46 @@
+"""
+Lightweight runtime statistics used by the Azul API client.
+
+This module provides small, allocation-friendly helpers to track request
+latencies so the client can make routing and timing decisions (such as when
+to hedge a slow request) based on what it has actually observed.
+"""
+
+import math
+from collections import deque
+from typing import Deque, List, Optional
+
+
+class LatencyWindow:
+    """Rolling window of the most recent latency samples (in seconds)."""
+
+    def __init__(self, size: int = 256):
+        """Initialize an empty window keeping at most `size` samples."""
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._sorted: Optional[List[float]] = None
+
+    def __len__(self) -> int:
+        """Return the number of samples currently held."""
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Add a latency sample, evicting the oldest one when full."""
+        self._samples.append(seconds)
+        self._sorted = None
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Return the `q` quantile of the window (nearest-rank method).
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.95 for p95).
+
+        Returns:
+            The latency in seconds, or None if no samples were recorded.
+        """
+        if not self._samples:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self._samples)
+        rank = max(1, math.ceil(q * len(self._sorted)))
+        return self._sorted[min(rank, len(self._sorted)) - 1]
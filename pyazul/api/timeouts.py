@@ -0,0 +1,130 @@
+"""
+Deadlines and per-operation timeout profiles for the Azul API client.
+
+A `Deadline` is an absolute point in time (on the monotonic clock) by which a
+call must finish, including any failover attempt. A `TimeoutProfile` holds the
+connect/read/write/pool timeouts for one kind of operation (Sale, VerifyPayment,
+ProcessDatavault, ...). When a deadline is given, the client caps every phase
+of an attempt by the time that is actually left and reserves part of it for
+the failover attempt.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+import httpx
+
+
+class Deadline:
+    """Absolute deadline measured on the monotonic clock."""
+
+    __slots__ = ("at",)
+
+    def __init__(self, at: float):
+        """Initialize a deadline expiring at monotonic time `at`."""
+        self.at = at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Return a deadline expiring `seconds` from now."""
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        """Return the seconds left before the deadline (never negative)."""
+        return max(0.0, self.at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.at
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"Deadline(remaining={self.remaining():.3f}s)"
+
+
+@dataclass(frozen=True)
+class TimeoutProfile:
+    """
+    Timeouts for one kind of operation, in seconds.
+
+    Attributes:
+        connect: Time allowed to establish a connection (including TLS).
+        read: Time allowed between bytes of the response.
+        write: Time allowed to send the request.
+        pool: Time allowed to wait for a free pooled connection.
+        min_attempt: Smallest budget worth starting an attempt with; when less
+            than this is left the failover attempt is skipped.
+        failover_share: Fraction of the remaining budget kept in reserve for
+            the failover attempt when a deadline is set.
+    """
+
+    connect: float = 30.0
+    read: float = 30.0
+    write: float = 30.0
+    pool: float = 30.0
+    min_attempt: float = 1.0
+    failover_share: float = 0.4
+
+    def timeout(self, budget: Optional[float] = None) -> httpx.Timeout:
+        """Return the httpx timeout for an attempt limited to `budget` seconds."""
+        if budget is None:
+            return httpx.Timeout(
+                connect=self.connect, read=self.read, write=self.write, pool=self.pool
+            )
+        return httpx.Timeout(
+            connect=min(self.connect, budget),
+            read=min(self.read, budget),
+            write=min(self.write, budget),
+            pool=min(self.pool, budget),
+        )
+
+    def attempt_budget(
+        self, deadline: Optional[Deadline], attempts_left: int
+    ) -> Optional[float]:
+        """
+        Return the total time the next attempt may use.
+
+        Without a deadline there is no overall cap (None). With one, the
+        remaining time is split between this attempt and a failover reserve,
+        unless there is not enough time left for both to be meaningful.
+        """
+        if deadline is None:
+            return None
+        remaining = deadline.remaining()
+        if attempts_left > 1:
+            reserve = remaining * self.failover_share
+            if reserve >= self.min_attempt and remaining - reserve >= self.min_attempt:
+                return remaining - reserve
+        return remaining
+
+
+DEFAULT_TIMEOUT_PROFILE = TimeoutProfile()
+
+
+class TimeoutProfiles:
+    """Timeout profiles by operation name, with a default fallback."""
+
+    def __init__(
+        self,
+        profiles: Optional[Mapping[str, TimeoutProfile]] = None,
+        default: TimeoutProfile = DEFAULT_TIMEOUT_PROFILE,
+    ):
+        """
+        Initialize the profiles.
+
+        Args:
+            profiles: Profiles keyed by operation name, e.g. ``"Sale"``,
+                ``"Hold"``, ``"VerifyPayment"``, ``"ProcessDatavault"`` or
+                ``"ProcessThreeDSMethod"`` (case-insensitive).
+            default: Profile used for operations without their own entry.
+        """
+        self.default = default
+        self._profiles: Dict[str, TimeoutProfile] = {
+            name.lower(): profile for name, profile in (profiles or {}).items()
+        }
+
+    def get(self, operation: str) -> TimeoutProfile:
+        """Return the profile for an operation name."""
+        return self._profiles.get(operation.lower(), self.default)
@@ -4,8 +4,23 @@ Core module for PyAzul.
 Contains base classes, configuration, exceptions, and session management.
 """
 
-from .base import BaseService
-from .config import AzulSettings, get_azul_settings
-from .exceptions import AzulError
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import BaseService
+    from .config import AzulSettings, get_azul_settings
+    from .exceptions import AzulError
 
 __all__ = ["get_azul_settings", "AzulSettings", "AzulError", "BaseService"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "get_azul_settings": ".config",
+        "AzulSettings": ".config",
+        "AzulError": ".exceptions",
+        "BaseService": ".base",
+    },
+)
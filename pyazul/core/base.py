@@ -1,12 +1,15 @@
 """Base classes and utilities for the PyAzul library."""
 
-from ..api.client import AzulAPI
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..api.client import AzulAPI
 
 
 class BaseService:
     """Base class for all Azul API services."""
 
-    def __init__(self, api_client: AzulAPI):
+    def __init__(self, api_client: "AzulAPI"):
         """
         Initialize the service with a shared AzulAPI client.
 
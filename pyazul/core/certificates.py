@@ -0,0 +1,268 @@
+"""
+Certificate loading and process-wide cache of SSL contexts.
+
+Building an SSL context decodes the configured certificate and key and runs
+`load_cert_chain`, which is costly compared to a request. Contexts are cached
+by a hash of the certificate and key content, so every `AzulAPI` (and every
+tenant) configured with the same material shares one context, while a rotated
+certificate yields a new one. The cache keeps the `MAX_CACHED_CONTEXTS` most
+recently used contexts, so rotations do not accumulate retired ones; clients
+keep their own reference to the context they use. `AzulAPI` does the loading
+in a worker thread so it never blocks the event loop.
+
+`load_cert_chain` only reads files. Certificates given as PEM or base64 content
+are handed to it through anonymous in-memory files (``memfd``) on Linux, so
+nothing is written to disk. Elsewhere they are written once to content-addressed
+files under ``~/.pyazul/certs``: a file named after the hash of its content is
+never rewritten, so processes with different certificates cannot overwrite
+each other's.
+"""
+
+import base64
+import hashlib
+import os
+import ssl
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import ExitStack, contextmanager, suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple, Union
+
+from .exceptions import SSLError
+from .fork import after_fork
+
+if TYPE_CHECKING:
+    from .config import AzulSettings
+
+# Distinct certificates in use at once: a few tenants, or one during rotation
+MAX_CACHED_CONTEXTS = 16
+
+_contexts: "OrderedDict[str, ssl.SSLContext]" = OrderedDict()
+_lock = threading.Lock()
+
+_PROC_FD_DIR = Path("/proc/self/fd")
+
+
+@after_fork
+def _reset_lock() -> None:
+    """Replace the lock, which another thread may have held at fork time.
+
+    Cached contexts are kept: forked workers share them copy-on-write.
+    """
+    global _lock
+    _lock = threading.Lock()
+
+
+def _is_file(value: str) -> bool:
+    """Check if a string is a valid and existing file path."""
+    try:
+        return Path(value).is_file()
+    except (OSError, ValueError, TypeError):
+        return False
+
+
+def _is_pem(content: str, pem_type: str) -> bool:
+    """Check if a string contains PEM markers of the given type."""
+    return (
+        f"-----BEGIN {pem_type}-----" in content
+        and f"-----END {pem_type}-----" in content
+    )
+
+
+def _decode_base64_pem(value: str) -> Optional[bytes]:
+    """Decode base64 encoded PEM content; None if `value` is not one."""
+    try:
+        decoded = base64.b64decode(value)
+        text = decoded.decode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if _is_pem(text, "CERTIFICATE") or _is_pem(text, "PRIVATE KEY"):
+        return decoded
+    return None
+
+
+def read_certificate(
+    value: str, pem_type: str = "CERTIFICATE", label: str = "certificate"
+) -> Union[Path, bytes]:
+    """
+    Resolve a configured certificate or key.
+
+    Args:
+        value: File path, PEM content or base64 encoded PEM.
+        pem_type: PEM marker expected in direct content (``"CERTIFICATE"`` or
+            ``"PRIVATE KEY"``).
+        label: Name used in error messages.
+
+    Returns:
+        The path for file paths, otherwise the PEM content.
+
+    Raises:
+        ValueError: If `value` is none of the supported formats.
+    """
+    value = value.strip("'\"")
+    if _is_file(value):
+        return Path(value)
+    if _is_pem(value, pem_type):
+        return value.encode("utf-8")
+    decoded = _decode_base64_pem(value)
+    if decoded is not None:
+        return decoded
+    raise ValueError(
+        f"Invalid {label} format: Must be a valid file path, PEM content, "
+        "or base64 encoded PEM."
+    )
+
+
+def write_content_addressed(content: bytes, suffix: str = ".pem") -> Path:
+    """
+    Return a private file holding `content`, writing it only if absent.
+
+    The file is named after the SHA-256 of its content and written atomically
+    with ``0600`` permissions.
+    """
+    directory = Path.home() / ".pyazul" / "certs"
+    path = directory / f"{hashlib.sha256(content).hexdigest()}{suffix}"
+    if path.is_file():
+        return path
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    return path
+
+
+def _memfd(content: bytes) -> Optional[int]:
+    """Return an anonymous in-memory file holding `content`, if supported."""
+    if not hasattr(os, "memfd_create") or not _PROC_FD_DIR.is_dir():
+        return None
+    try:
+        fd = os.memfd_create("pyazul-cert", os.MFD_CLOEXEC)
+    except OSError:
+        return None
+    try:
+        written = 0
+        while written < len(content):
+            written += os.write(fd, content[written:])
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+@contextmanager
+def _pem_file(content: bytes, suffix: str) -> Iterator[str]:
+    """Yield a path to `content`, in memory when possible."""
+    fd = _memfd(content)
+    if fd is None:
+        yield str(write_content_addressed(content, suffix))
+        return
+    try:
+        yield str(_PROC_FD_DIR / str(fd))
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def certificate_files(cert: str, key: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield file paths for a certificate/key pair.
+
+    The paths are only guaranteed to exist inside the ``with`` block.
+
+    Raises:
+        ValueError: If the certificate or key has an invalid format.
+    """
+    with ExitStack() as stack:
+        paths = []
+        for value, pem_type, label, suffix in (
+            (cert, "CERTIFICATE", "certificate", ".crt"),
+            (key, "PRIVATE KEY", "key", ".key"),
+        ):
+            resolved = read_certificate(value, pem_type, label)
+            if isinstance(resolved, Path):
+                paths.append(str(resolved))
+            else:
+                paths.append(stack.enter_context(_pem_file(resolved, suffix)))
+        yield paths[0], paths[1]
+
+
+def _certificate_material(value: str) -> bytes:
+    """Return the bytes identifying a configured certificate or key."""
+    try:
+        path = Path(value)
+        if path.is_file():
+            return path.read_bytes()
+    except (OSError, ValueError):
+        pass
+    return value.encode("utf-8")
+
+
+def certificate_fingerprint(cert: str, key: str) -> str:
+    """
+    Hash the content of a certificate/key pair.
+
+    Args:
+        cert: Certificate as a file path, PEM content or base64 encoded PEM.
+        key: Private key in any of the same forms.
+
+    Returns:
+        Hex digest identifying the pair.
+    """
+    digest = hashlib.sha256()
+    for value in (cert, key):
+        material = _certificate_material(value.strip("'\""))
+        digest.update(len(material).to_bytes(8, "big"))
+        digest.update(material)
+    return digest.hexdigest()
+
+
+def get_ssl_context(settings: "AzulSettings") -> ssl.SSLContext:
+    """
+    Return the shared SSL context for the certificates in `settings`.
+
+    Loads and caches the context on first use, evicting the least recently
+    used one beyond `MAX_CACHED_CONTEXTS`. Blocking; call it from a worker
+    thread in async code.
+
+    Raises:
+        SSLError: If the certificates cannot be loaded.
+    """
+    fingerprint = certificate_fingerprint(
+        settings.AZUL_CERT or "", settings.AZUL_KEY or ""
+    )
+    with _lock:
+        context = _contexts.get(fingerprint)
+        if context is None:
+            context = _contexts[fingerprint] = _create_ssl_context(settings)
+            while len(_contexts) > MAX_CACHED_CONTEXTS:
+                _contexts.popitem(last=False)
+        else:
+            _contexts.move_to_end(fingerprint)
+    return context
+
+
+def clear_ssl_context_cache() -> None:
+    """Forget every cached SSL context."""
+    with _lock:
+        _contexts.clear()
+
+
+def _create_ssl_context(settings: "AzulSettings") -> ssl.SSLContext:
+    """Load the certificates of `settings` into a new SSL context."""
+    try:
+        with certificate_files(settings.AZUL_CERT or "", settings.AZUL_KEY or "") as (
+            cert_path,
+            key_path,
+        ):
+            ssl_context = ssl.create_default_context()
+            ssl_context.load_cert_chain(cert_path, key_path)
+        return ssl_context
+    except Exception as e:
+        raise SSLError(f"Error loading certificates: {str(e)}") from e
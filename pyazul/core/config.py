@@ -6,33 +6,30 @@ from environment variables and .env files. It also provides utility
 functions for accessing these settings.
 """
 
-import base64
-import os
 import sys
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from dotenv import load_dotenv
 from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from pyazul.api.constants import AzulEndpoints
+from pyazul.core.certificates import read_certificate, write_content_addressed
 
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
     from typing_extensions import Self
 
-# Load .env file with override=True to ensure values are loaded
-load_dotenv(override=True)
-
 
 class AzulSettings(BaseSettings):
     """
     Manages configuration settings for the PyAzul library.
 
-    Loads settings from environment variables and a .env file.
+    Loads settings from environment variables and a .env file when the settings
+    are constructed; environment variables take precedence over the .env file,
+    which is never copied into ``os.environ``.
     It includes credentials, API endpoints, and certificate configurations.
     """
 
@@ -50,6 +47,8 @@ class AzulSettings(BaseSettings):
     # Certificate Settings
     AZUL_CERT: Optional[str] = None
     AZUL_KEY: Optional[str] = None
+    # Seconds between checks for rotated certificates/credentials (off when unset)
+    CREDENTIAL_RELOAD_INTERVAL: Optional[float] = None
 
     # Optional Settings
     ENVIRONMENT: str = "dev"
@@ -58,6 +57,47 @@ class AzulSettings(BaseSettings):
     # Service URLs
     ALT_PROD_URL: Optional[str] = None
     ALT_PROD_URL_PAYMENT: Optional[str] = None
+    FAILOVER_URLS: List[str] = []
+
+    # HTTP Connection Pool Settings
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_BACKGROUND_MAX_CONNECTIONS: int = 20
+    # Connections per endpoint opened by warmup(), e.g. in each worker after a fork
+    WARMUP_CONNECTIONS: int = 0
+    # Seconds between refreshes of the warm connections (off when unset)
+    KEEPALIVE_INTERVAL: Optional[float] = None
+
+    # In-process DNS cache (off when unset) and fixed IPs per host name
+    DNS_CACHE_TTL: Optional[float] = None
+    DNS_PINNED_HOSTS: Dict[str, List[str]] = {}
+
+    # 3D Secure sessions kept in memory and seconds until an unfinished one expires
+    THREEDS_MAX_SESSIONS: int = 10000
+    THREEDS_SESSION_TTL: float = 1800.0
+
+    # Logging Settings
+    LOG_SAMPLE_RATE: float = 1.0
+
+    # Request Hedging Settings (production only, idempotent operations)
+    HEDGE_REQUESTS: bool = False
+    HEDGE_PERCENTILE: float = 0.95
+    HEDGE_DEFAULT_DELAY: float = 1.0
+    HEDGE_MIN_SAMPLES: int = 20
+
+    # Endpoint Circuit Breaker Settings
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_RESET_TIMEOUT: float = 30.0
+    CIRCUIT_PROBE_TIMEOUT: float = 5.0
+
+    # Per-Merchant Admission Control (disabled when unset)
+    RATE_LIMIT_PER_SECOND: Optional[float] = None
+    RATE_LIMIT_BURST: Optional[int] = None
+    MAX_IN_FLIGHT: Optional[int] = None
+    ADAPTIVE_CONCURRENCY: bool = False
+    ADAPTIVE_MIN_IN_FLIGHT: int = 1
+    BACKGROUND_IN_FLIGHT_SHARE: float = 0.5
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -77,85 +117,23 @@ class AzulSettings(BaseSettings):
 
     def _load_certificates(self) -> Tuple[str, str]:
         """
-        Load SSL certificates from environment variables.
+        Resolve the ``AZUL_CERT``/``AZUL_KEY`` settings to file paths.
 
         Certificates can be provided as file paths, direct PEM content,
-        or base64 encoded PEM content. They are loaded and written to
-        temporary files if necessary.
+        or base64 encoded PEM content. Content is written once to
+        content-addressed files (see `pyazul.core.certificates`); the SDK
+        itself loads certificates without writing them to disk when possible.
         """
-        cert_value = os.getenv("AZUL_CERT", "").strip("'\"")
-        key_value = os.getenv("AZUL_KEY", "").strip("'\"")
-
-        temp_dir = Path.home() / ".pyazul" / "certs"
-        temp_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
-
-        def is_valid_file_path(path_str: str) -> bool:
-            """Check if a string is a valid and existing file path."""
-            try:
-                path = Path(path_str)
-                return path.is_file() and path.exists()
-            except (OSError, ValueError, TypeError):
-                return False
-
-        def is_pem_content(content: str, cert_type: str = "CERTIFICATE") -> bool:
-            """Check if a string contains PEM markers for certificates or keys."""
-            begin = f"-----BEGIN {cert_type}-----"
-            end = f"-----END {cert_type}-----"
-            return begin in content and end in content
-
-        def is_base64(s: str) -> bool:
-            """Check if a string is a base64 encoded PEM content."""
-            try:
-                decoded = base64.b64decode(s).decode("utf-8")
-                return is_pem_content(decoded) or is_pem_content(decoded, "PRIVATE KEY")
-            except (ValueError, UnicodeDecodeError):
-                return False
-
-        def write_cert(
-            path: Path, content: str, is_base64_encoded: bool = False
-        ) -> None:
-            """Write certificate content to a file with restricted permissions."""
-            try:
-                data = (
-                    base64.b64decode(content)
-                    if is_base64_encoded
-                    else content.encode("utf-8")
-                )
-                with open(path, "wb") as f:
-                    f.write(data)
-                path.chmod(0o600)
-            except Exception as e:
-                raise ValueError(f"Error writing certificate: {str(e)}") from e
-
-        # Process certificate
-        cert_path = temp_dir / "azul_cert.crt"
-        if is_valid_file_path(cert_value):
-            cert_path = Path(cert_value)
-        elif is_pem_content(cert_value):
-            write_cert(cert_path, cert_value)
-        elif is_base64(cert_value):
-            write_cert(cert_path, cert_value, True)
-        else:
-            raise ValueError(
-                "Invalid certificate format: Must be a valid file path, PEM content, "
-                "or base64 encoded PEM."
-            )
-
-        # Process key
-        key_path = temp_dir / "azul_key.key"
-        if is_valid_file_path(key_value):
-            key_path = Path(key_value)
-        elif is_pem_content(key_value, "PRIVATE KEY"):
-            write_cert(key_path, key_value)
-        elif is_base64(key_value):
-            write_cert(key_path, key_value, True)
-        else:
-            raise ValueError(
-                "Invalid key format: Must be a valid file path, PEM content, "
-                "or base64 encoded PEM."
-            )
-
-        return str(cert_path), str(key_path)
+        paths = []
+        for value, pem_type, label, suffix in (
+            (self.AZUL_CERT or "", "CERTIFICATE", "certificate", ".crt"),
+            (self.AZUL_KEY or "", "PRIVATE KEY", "key", ".key"),
+        ):
+            resolved = read_certificate(value, pem_type, label)
+            if not isinstance(resolved, Path):
+                resolved = write_content_addressed(resolved, suffix)
+            paths.append(str(resolved))
+        return paths[0], paths[1]
 
     def get_api_url(self) -> str:
         """Get the appropriate API URL based on environment and custom settings."""
@@ -21,6 +21,18 @@ class APIError(AzulError):
         super().__init__(self.message)
 
 
+class NoHealthyEndpointError(APIError):
+    """Exception raised when every Azul endpoint circuit is open."""
+
+    pass
+
+
+class DeadlineExceededError(APIError):
+    """Exception raised when a request cannot complete before its deadline."""
+
+    pass
+
+
 class AzulResponseError(AzulError):
     """Exception raised when Azul returns an error response."""
 
@@ -31,6 +43,12 @@ class AzulResponseError(AzulError):
         super().__init__(self.message)
 
 
+class AzulGatewayError(AzulResponseError):
+    """Exception raised for gateway-level (SGS) failures such as timeouts."""
+
+    pass
+
+
 class ValidationError(AzulError):
     """Exception raised for validation errors."""
 
@@ -0,0 +1,62 @@
+"""
+Fork safety for pre-fork servers (gunicorn, uvicorn workers).
+
+A client created in the master process is inherited by every worker. Parsed
+settings, loaded SSL contexts and compiled validators are immutable and stay
+shared copy-on-write, but sockets, locks, threads and event-loop bound state
+are not fork-safe. Objects holding such state register here and are reset in
+the child right after ``os.fork()`` through `os.register_at_fork`.
+"""
+
+import itertools
+import logging
+import os
+import weakref
+from typing import Callable, List, Protocol
+
+_logger = logging.getLogger(__name__)
+
+
+class ForkAware(Protocol):
+    """Object resetting its per-process state in a forked child."""
+
+    def _after_fork(self) -> None:
+        """Drop the state inherited from the parent process."""
+        ...
+
+
+# Insertion ordered, so objects are reset after the ones they were built from
+_objects: "weakref.WeakValueDictionary[int, ForkAware]" = weakref.WeakValueDictionary()
+_counter = itertools.count()
+_callbacks: List[Callable[[], None]] = []
+
+
+def register_after_fork(obj: ForkAware) -> None:
+    """
+    Reset `obj` in forked children; only a weak reference is kept.
+
+    Objects are reset in registration order, so an object registered after the
+    ones it owns can rely on them being reset already.
+    """
+    _objects[next(_counter)] = obj
+
+
+def after_fork(callback: Callable[[], None]) -> Callable[[], None]:
+    """Register a module-level reset run in forked children, before objects."""
+    _callbacks.append(callback)
+    return callback
+
+
+def _reinit_in_child() -> None:
+    """Reset module state, then every registered object."""
+    for callback in _callbacks:
+        callback()
+    for obj in list(_objects.values()):
+        try:
+            obj._after_fork()
+        except Exception as e:  # One broken object must not break the worker
+            _logger.warning("Post-fork reset of %r failed: %s", obj, e)
+
+
+if hasattr(os, "register_at_fork"):  # Not available on Windows
+    os.register_at_fork(after_in_child=_reinit_in_child)
@@ -0,0 +1,42 @@
+"""
+Lazy package exports (PEP 562).
+
+Packages list the names they export and the module defining each one; the
+module is only imported the first time the name is accessed, so importing
+``pyazul`` does not pay for pydantic schemas, httpx or services that are never
+used.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module-level ``__getattr__`` and ``__dir__`` of a package.
+
+    Args:
+        package: Name of the package (``__name__``).
+        exports: Exported name to the module defining it, relative to
+            `package` (e.g. ``{"PyAzul": ".index"}``).
+
+    Returns:
+        The ``(__getattr__, __dir__)`` pair to assign in the package.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
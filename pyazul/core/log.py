@@ -0,0 +1,114 @@
+"""
+Structured, redacted and lazily formatted logging helpers for PyAzul.
+
+Request and response payloads carry card data and credentials, and are logged
+on the hot path of every transaction. `log_event` only does work when the
+logger is enabled for the level (and the event is sampled); sensitive fields
+are redacted before the payload reaches any handler, and the JSON rendering is
+deferred until a handler actually formats the record.
+"""
+
+import json
+import logging
+import random
+from typing import Any, Dict, Mapping
+
+from pydantic import BaseModel
+
+# Fields masked down to their BIN and last four digits
+MASKED_FIELDS = frozenset({"CardNumber"})
+
+# Fields replaced entirely
+REDACTED_FIELDS = frozenset(
+    {
+        "CVC",
+        "Expiration",
+        "DataVaultToken",
+        "Auth1",
+        "Auth2",
+        "AuthHash",
+        "AZUL_AUTH_KEY",
+        "CRes",
+        "CReq",
+        "threeDSMethodData",
+    }
+)
+
+REDACTED = "[REDACTED]"
+
+
+def mask_card_number(value: Any) -> str:
+    """Mask a card number, keeping only its BIN and last four digits."""
+    digits = str(value)
+    if len(digits) < 13:
+        return REDACTED
+    return f"{digits[:6]}{'*' * (len(digits) - 10)}{digits[-4:]}"
+
+
+def redact(value: Any) -> Any:
+    """Return a copy of `value` with sensitive fields masked, at any depth."""
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json", exclude_none=True)
+    if isinstance(value, Mapping):
+        redacted: Dict[str, Any] = {}
+        for key, item in value.items():
+            if key in MASKED_FIELDS and item:
+                redacted[key] = mask_card_number(item)
+            elif key in REDACTED_FIELDS and item:
+                redacted[key] = REDACTED
+            else:
+                redacted[key] = redact(item)
+        return redacted
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    return value
+
+
+class LazyJSON:
+    """Render a value as compact JSON only when the log record is formatted."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        """Wrap an already redacted value."""
+        self.value = value
+
+    def __str__(self) -> str:
+        """Serialize the wrapped value."""
+        return json.dumps(self.value, separators=(",", ":"), default=str)
+
+
+def log_event(
+    logger: logging.Logger,
+    level: int,
+    event: str,
+    sample_rate: float = 1.0,
+    **fields: Any,
+) -> None:
+    """
+    Log a structured event with redacted fields.
+
+    Nothing is computed when `logger` is disabled for `level` or the event is
+    not sampled. The message reads ``"<event> <json fields>"`` and the event
+    name and redacted fields are also attached to the record as ``event`` and
+    ``fields`` for structured handlers.
+
+    Args:
+        logger: Logger to emit on.
+        level: Logging level, e.g. ``logging.DEBUG``.
+        event: Event name, e.g. ``"azul.request"``.
+        sample_rate: Fraction of events to emit, between 0 and 1.
+        **fields: Event data; sensitive fields are redacted.
+    """
+    if not logger.isEnabledFor(level):
+        return
+    if sample_rate < 1.0 and random.random() >= sample_rate:
+        return
+    redacted = redact(fields)
+    logger.log(
+        level,
+        "%s %s",
+        event,
+        LazyJSON(redacted),
+        extra={"event": event, "fields": redacted},
+    )
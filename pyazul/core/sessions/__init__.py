@@ -0,0 +1,39 @@
+"""
+Pluggable storage of 3D Secure sessions (ADR 0001).
+
+`SecureService` keeps the state of each 3DS flow (amounts, AzulOrderId, status)
+between the initial request and the method and challenge callbacks in a
+`ThreeDSSessionStore`. `InMemorySessionStore` is the default; other backends
+implement the same async interface.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import INDEXED_FIELDS, SessionData, ThreeDSSessionStore
+    from .memory import InMemorySessionStore
+    from .redis import RedisSessionStore
+    from .sqlite import SQLiteSessionStore
+
+__all__ = [
+    "INDEXED_FIELDS",
+    "SessionData",
+    "ThreeDSSessionStore",
+    "InMemorySessionStore",
+    "RedisSessionStore",
+    "SQLiteSessionStore",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "INDEXED_FIELDS": ".base",
+        "SessionData": ".base",
+        "ThreeDSSessionStore": ".base",
+        "InMemorySessionStore": ".memory",
+        "RedisSessionStore": ".redis",
+        "SQLiteSessionStore": ".sqlite",
+    },
+)
@@ -0,0 +1,142 @@
+"""Interface of 3D Secure session stores."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+SessionData = Dict[str, Any]
+
+# Session fields a session can be found by, besides its secure_id
+INDEXED_FIELDS = ("azul_order_id", "order_number", "custom_order_id")
+
+
+def index_keys(data: SessionData) -> Tuple[Tuple[str, str], ...]:
+    """Return the ``(field, value)`` pairs a session is indexed under."""
+    return tuple(
+        (field, str(data[field])) for field in INDEXED_FIELDS if data.get(field)
+    )
+
+
+def check_indexed(field: str) -> None:
+    """
+    Reject lookups by a field that is not indexed.
+
+    Raises:
+        ValueError: If `field` is not in `INDEXED_FIELDS`.
+    """
+    if field not in INDEXED_FIELDS:
+        raise ValueError(
+            f"Sessions cannot be found by {field!r}; "
+            f"indexed fields are {', '.join(INDEXED_FIELDS)}"
+        )
+
+
+class ThreeDSSessionStore(ABC):
+    """
+    Async storage of 3DS sessions, keyed by ``secure_id``.
+
+    Sessions are plain dictionaries of JSON-compatible values. Stores expire
+    sessions on their own, since abandoned checkouts never reach a final
+    status, and index them by the fields in `INDEXED_FIELDS`, so that `find`
+    is a key lookup rather than a scan. Indexes follow every `set`, `delete`,
+    expiry and eviction; when several live sessions share a value, the most
+    recently stored one is found.
+
+    A dictionary returned by `get` may be the stored object itself; changes
+    are only guaranteed to persist once passed to `set`.
+    """
+
+    @abstractmethod
+    async def get(self, secure_id: str) -> Optional[SessionData]:
+        """Return the session, or None if it is unknown or expired."""
+
+    @abstractmethod
+    async def set(
+        self, secure_id: str, data: SessionData, ttl: Optional[float] = None
+    ) -> None:
+        """
+        Create or replace a session.
+
+        Args:
+            secure_id: Session ID.
+            data: Session data.
+            ttl: Seconds until the session expires; defaults to the store's.
+        """
+
+    @abstractmethod
+    async def delete(self, secure_id: str) -> bool:
+        """Remove a session, returning whether it existed."""
+
+    @abstractmethod
+    async def find(self, value: str, field: str = "azul_order_id") -> Optional[str]:
+        """
+        Return the ``secure_id`` of the session whose `field` equals `value`.
+
+        Args:
+            value: Value to look up, compared as a string.
+            field: One of `INDEXED_FIELDS`.
+
+        Raises:
+            ValueError: If `field` is not indexed.
+        """
+
+    @abstractmethod
+    async def claim(self, key: str, ttl: Optional[float] = None) -> bool:
+        """
+        Atomically take `key` unless it is already taken (set-if-absent).
+
+        Used to process each 3DS method notification once across workers
+        sharing the store.
+
+        Args:
+            key: Key to take.
+            ttl: Seconds until the key is free again; defaults to the store's
+                session TTL.
+
+        Returns:
+            True if this call took the key.
+        """
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        """Free a key taken by `claim`, e.g. after its work failed."""
+
+    async def claim_and_get(
+        self,
+        key: str,
+        value: str,
+        field: str = "azul_order_id",
+        ttl: Optional[float] = None,
+    ) -> Tuple[bool, Optional[str], Optional[SessionData]]:
+        """
+        Take `key` and, if taken, read the session whose `field` is `value`.
+
+        Combines `claim`, `find` and `get` for the 3DS method notification.
+        Stores on a network backend should override it to do all three in
+        one round trip; this default releases `key` if the lookup fails.
+
+        Args:
+            key: Key to take, as in `claim`.
+            value: Value to look up, as in `find`.
+            field: One of `INDEXED_FIELDS`.
+            ttl: Seconds until `key` is free again.
+
+        Returns:
+            Whether `key` was taken, then the ``secure_id`` and data of the
+            session, both None if it was not taken or no session was found.
+        """
+        if not await self.claim(key, ttl):
+            return False, None, None
+        try:
+            secure_id = await self.find(value, field)
+            data = await self.get(secure_id) if secure_id else None
+        except BaseException:
+            await self.release(key)
+            raise
+        return True, secure_id if data else None, data
+
+    async def aclose(self) -> None:
+        """Release the store's resources."""
+
+    def metrics(self) -> Dict[str, int]:
+        """Return counters for monitoring, such as size and evictions."""
+        return {}
@@ -0,0 +1,48 @@
+"""
+Encoding of 3D Secure sessions for stores that persist them as bytes.
+
+Sessions are encoded with msgpack when installed, or else as compact JSON
+through the fastest installed backend (see `pyazul.api.serialization`).
+"""
+
+from typing import Any, Callable, Optional, Tuple
+
+from ...api import serialization
+from .base import SessionData
+
+Codec = Tuple[str, Callable[[Any], bytes], Optional[Callable[[bytes], Any]]]
+
+
+def _select_codec() -> Codec:
+    """Return the name, encoder and msgpack decoder of the best codec."""
+    try:
+        import msgpack
+    except ImportError:
+        return "json", serialization.dumps, None
+
+    def packb(value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def unpackb(content: bytes) -> Any:
+        return msgpack.unpackb(content, raw=False)
+
+    return "msgpack", packb, unpackb
+
+
+# Codec name, encoder and msgpack decoder (None when msgpack is not installed)
+CODEC, encode, _unpackb = _select_codec()
+
+
+def decode(content: bytes) -> SessionData:
+    """
+    Decode a stored session, whichever codec the writing process used.
+
+    A JSON object starts with ``{`` while a msgpack map never does, so nodes
+    with and without msgpack can share sessions as long as the reading node
+    can decode them.
+    """
+    if content[:1] == b"{":
+        return serialization.loads(content)
+    if _unpackb is None:
+        raise ValueError("Session is msgpack-encoded but msgpack is not installed")
+    return _unpackb(content)
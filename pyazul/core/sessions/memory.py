@@ -0,0 +1,245 @@
+"""
+Bounded in-memory 3D Secure session store.
+
+Sessions live in an LRU bounded by ``max_sessions`` and expire after their
+TTL, so abandoned checkouts do not accumulate in long-running processes.
+Expired sessions are never returned and are removed by a background sweep,
+which pops them off a heap ordered by expiry time. A dictionary keyed by
+``(field, value)`` indexes the sessions for `find`.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from ..fork import register_after_fork
+from .base import SessionData, ThreeDSSessionStore, check_indexed, index_keys
+
+IndexKey = Tuple[str, str]
+# Session data, expiry time and the index keys it was stored under
+_Entry = Tuple[SessionData, float, Tuple[IndexKey, ...]]
+
+_logger = logging.getLogger(__name__)
+
+
+class InMemorySessionStore(ThreeDSSessionStore):
+    """Process-local session store with TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        max_sessions: int = 10000,
+        ttl: float = 1800.0,
+        sweep_interval: float = 60.0,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            max_sessions: Sessions kept at most; the least recently used one
+                is evicted beyond that.
+            ttl: Default seconds until a session expires.
+            sweep_interval: Seconds between background removals of expired
+                sessions.
+        """
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        if ttl <= 0 or sweep_interval <= 0:
+            raise ValueError("ttl and sweep_interval must be positive")
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.sweep_interval = sweep_interval
+        self._sessions: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._index: Dict[IndexKey, str] = {}
+        # Keys taken by claim() and when they expire
+        self._claims: "OrderedDict[str, float]" = OrderedDict()
+        self._expiries: List[Tuple[float, str]] = []
+        self._sweeper: Optional["asyncio.Task[None]"] = None
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+        register_after_fork(self)
+
+    @classmethod
+    def from_mapping(
+        cls, sessions: Mapping[str, SessionData], **kwargs: Any
+    ) -> "InMemorySessionStore":
+        """
+        Create a store holding a copy of existing sessions.
+
+        Args:
+            sessions: Session data by ``secure_id``, e.g. the plain dict used as
+                session store by earlier versions.
+            **kwargs: Arguments of the store, such as ``ttl``.
+        """
+        store = cls(**kwargs)
+        for secure_id, data in sessions.items():
+            store._put(secure_id, data, None)
+        return store
+
+    def _after_fork(self) -> None:
+        """Forget the sweeper of the parent's event loop."""
+        self._sweeper = None
+
+    def __len__(self) -> int:
+        """Return the number of stored sessions, expired ones included."""
+        return len(self._sessions)
+
+    async def get(self, secure_id: str) -> Optional[SessionData]:
+        """Return the session, or None if it is unknown or expired."""
+        return self.get_nowait(secure_id)
+
+    def get_nowait(self, secure_id: str) -> Optional[SessionData]:
+        """Return the session like `get`, without awaiting."""
+        entry = self._sessions.get(secure_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        data, expires_at, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(secure_id)
+            self.expired += 1
+            self.misses += 1
+            return None
+        self._sessions.move_to_end(secure_id)
+        self.hits += 1
+        return data
+
+    async def set(
+        self, secure_id: str, data: SessionData, ttl: Optional[float] = None
+    ) -> None:
+        """Create or replace a session, evicting the least recently used."""
+        self._put(secure_id, data, ttl)
+        self._start_sweeper()
+
+    def _put(self, secure_id: str, data: SessionData, ttl: Optional[float]) -> None:
+        """Store a session and its index keys."""
+        expires_at = time.monotonic() + (ttl or self.ttl)
+        # The caller may have changed indexed fields of the stored dictionary
+        # in place, so the old keys come from the entry, not from the data
+        previous = self._sessions.get(secure_id)
+        if previous is not None:
+            self._unindex(secure_id, previous[2])
+        keys = index_keys(data)
+        self._sessions[secure_id] = (data, expires_at, keys)
+        self._sessions.move_to_end(secure_id)
+        for key in keys:
+            self._index[key] = secure_id
+        heapq.heappush(self._expiries, (expires_at, secure_id))
+        while len(self._sessions) > self.max_sessions:
+            evicted, (_, _, evicted_keys) = self._sessions.popitem(last=False)
+            self._unindex(evicted, evicted_keys)
+            self.evicted += 1
+            _logger.debug("Evicted least recently used 3DS session %s", evicted)
+
+    async def delete(self, secure_id: str) -> bool:
+        """Remove a session, returning whether it existed."""
+        return self._remove(secure_id)
+
+    async def find(self, value: str, field: str = "azul_order_id") -> Optional[str]:
+        """Return the ``secure_id`` of the live session whose `field` is `value`."""
+        check_indexed(field)
+        secure_id = self._index.get((field, str(value)))
+        if secure_id is None:
+            return None
+        if self._sessions[secure_id][1] <= time.monotonic():
+            self._remove(secure_id)
+            self.expired += 1
+            return None
+        return secure_id
+
+    async def claim(self, key: str, ttl: Optional[float] = None) -> bool:
+        """Take `key` unless a live claim holds it."""
+        now = time.monotonic()
+        expires_at = self._claims.get(key)
+        if expires_at is not None and expires_at > now:
+            return False
+        self._claims[key] = now + (ttl or self.ttl)
+        self._claims.move_to_end(key)
+        while len(self._claims) > self.max_sessions:
+            self._claims.popitem(last=False)
+        self._start_sweeper()
+        return True
+
+    async def release(self, key: str) -> None:
+        """Free a claimed key."""
+        self._claims.pop(key, None)
+
+    def _remove(self, secure_id: str) -> bool:
+        """Drop a session; its heap entry is discarded when popped."""
+        entry = self._sessions.pop(secure_id, None)
+        if entry is None:
+            return False
+        self._unindex(secure_id, entry[2])
+        return True
+
+    def _unindex(self, secure_id: str, keys: Tuple[IndexKey, ...]) -> None:
+        """Drop index keys still pointing at `secure_id`."""
+        for key in keys:
+            # A later session with the same value has taken the key over
+            if self._index.get(key) == secure_id:
+                del self._index[key]
+
+    def sweep(self) -> int:
+        """
+        Remove every expired session now.
+
+        Returns:
+            Number of sessions removed.
+        """
+        now = time.monotonic()
+        removed = 0
+        while self._expiries and self._expiries[0][0] <= now:
+            expires_at, secure_id = heapq.heappop(self._expiries)
+            entry = self._sessions.get(secure_id)
+            # Entries replaced by a later set() carry a later expiry
+            if entry is not None and entry[1] == expires_at:
+                self._remove(secure_id)
+                removed += 1
+        # Replaced and evicted sessions leave stale heap entries behind
+        if len(self._expiries) > 2 * len(self._sessions) + 1024:
+            self._expiries = [
+                (expires_at, secure_id)
+                for secure_id, (_, expires_at, _) in self._sessions.items()
+            ]
+            heapq.heapify(self._expiries)
+        for key in [
+            key for key, expires_at in self._claims.items() if expires_at <= now
+        ]:
+            del self._claims[key]
+        self.expired += removed
+        return removed
+
+    def _start_sweeper(self) -> None:
+        """Start the background sweep on the running loop, if not started."""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        """Sweep until cancelled."""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            removed = self.sweep()
+            if removed:
+                _logger.debug("Expired %s 3DS sessions", removed)
+
+    async def aclose(self) -> None:
+        """Stop the background sweep; stored sessions are kept."""
+        task, self._sweeper = self._sweeper, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def metrics(self) -> Dict[str, int]:
+        """Return size, hit, eviction and claim counters."""
+        return {
+            "size": len(self._sessions),
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "claims": len(self._claims),
+        }
@@ -0,0 +1,161 @@
+"""
+3D Secure session store on Redis, shared by every node of a deployment.
+
+The initial sale, the method notification and the challenge callback of one
+3DS flow may reach different pods; `RedisSessionStore` keeps their state in
+Redis so any of them can continue it. It takes any client compatible with
+``redis.asyncio.Redis`` (e.g. ``redis.asyncio.Redis.from_url(...)`` or a
+Valkey server), created with the default ``decode_responses=False``. On Redis
+Cluster, give a hash-tagged ``prefix`` such as ``"{pyazul}:3ds:"`` so the
+keys written together live in one slot.
+
+Each write is one round trip: a session and its index keys are written in a
+single MULTI/EXEC pipeline, all with the session's TTL, so Redis expires them
+together. The 3DS method notification claims its key and reads the session in
+one Lua script. Sessions are encoded by `pyazul.core.sessions.codec`: msgpack when
+installed, or else compact JSON.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from .base import SessionData, ThreeDSSessionStore, check_indexed, index_keys
+from .codec import decode, encode
+
+# Takes the claim (KEYS[1]) and follows the index key (KEYS[2]) to the session;
+# its key is only known in the script, so it shares the hash tag of the prefix
+_CLAIM_AND_GET = """
+if not redis.call("SET", KEYS[1], "1", "PX", ARGV[1], "NX") then
+    return false
+end
+local secure_id = redis.call("GET", KEYS[2])
+if not secure_id then
+    return {}
+end
+return {secure_id, redis.call("GET", ARGV[2] .. secure_id)}
+"""
+
+
+def _text(value: Any) -> str:
+    """Return a Redis reply as text."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class RedisSessionStore(ThreeDSSessionStore):
+    """Session store on Redis with server-side TTLs."""
+
+    def __init__(self, client: Any, prefix: str = "pyazul:3ds:", ttl: float = 1800.0):
+        """
+        Initialize the store.
+
+        Args:
+            client: Async Redis client; it is not closed by `aclose()`.
+            prefix: Prefix of every key, e.g. to share a database.
+            ttl: Default seconds until a session expires.
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # Sent by its SHA once Redis knows it, falling back to EVAL
+        self._claim_and_get = client.register_script(_CLAIM_AND_GET)
+
+    def _session_key(self, secure_id: str) -> str:
+        """Return the key of a session."""
+        return f"{self.prefix}s:{secure_id}"
+
+    def _index_key(self, field: str, value: str) -> str:
+        """Return the key mapping an indexed value to its ``secure_id``."""
+        return f"{self.prefix}i:{field}:{value}"
+
+    def _ttl_ms(self, ttl: Optional[float]) -> int:
+        """Return a TTL in milliseconds, as Redis expects it."""
+        return max(1, int((ttl or self.ttl) * 1000))
+
+    async def get(self, secure_id: str) -> Optional[SessionData]:
+        """Return the session, or None if it is unknown or expired."""
+        content = await self.client.get(self._session_key(secure_id))
+        if content is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return decode(content)
+
+    async def set(
+        self, secure_id: str, data: SessionData, ttl: Optional[float] = None
+    ) -> None:
+        """Write a session and its index keys in one transaction."""
+        ttl_ms = self._ttl_ms(ttl)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(self._session_key(secure_id), encode(data), px=ttl_ms)
+            for field, value in index_keys(data):
+                pipe.set(self._index_key(field, value), secure_id, px=ttl_ms)
+            await pipe.execute()
+
+    async def delete(self, secure_id: str) -> bool:
+        """
+        Remove a session, returning whether it existed.
+
+        Its index keys are left to expire: `find` ignores keys whose session
+        is gone, which saves reading the session first.
+        """
+        return bool(await self.client.delete(self._session_key(secure_id)))
+
+    async def find(self, value: str, field: str = "azul_order_id") -> Optional[str]:
+        """
+        Return the ``secure_id`` of the live session whose `field` is `value`.
+
+        Reads the index key, then checks the session still holds the value,
+        since index keys of deleted or changed sessions are not removed.
+        """
+        check_indexed(field)
+        secure_id = await self.client.get(self._index_key(field, str(value)))
+        if secure_id is None:
+            return None
+        secure_id = _text(secure_id)
+        content = await self.client.get(self._session_key(secure_id))
+        if content is None or str(decode(content).get(field)) != str(value):
+            return None
+        return secure_id
+
+    async def claim(self, key: str, ttl: Optional[float] = None) -> bool:
+        """Take `key` with ``SET NX``, atomically across nodes."""
+        taken = await self.client.set(
+            f"{self.prefix}c:{key}", b"1", px=self._ttl_ms(ttl), nx=True
+        )
+        return bool(taken)
+
+    async def claim_and_get(
+        self,
+        key: str,
+        value: str,
+        field: str = "azul_order_id",
+        ttl: Optional[float] = None,
+    ) -> Tuple[bool, Optional[str], Optional[SessionData]]:
+        """Claim `key` and read the session found by `value` in one script."""
+        check_indexed(field)
+        reply = await self._claim_and_get(
+            keys=[f"{self.prefix}c:{key}", self._index_key(field, str(value))],
+            args=[self._ttl_ms(ttl), self._session_key("")],
+        )
+        if reply is None:
+            return False, None, None
+        if len(reply) < 2:
+            self.misses += 1
+            return True, None, None
+        data = decode(reply[1])
+        if str(data.get(field)) != str(value):
+            self.misses += 1
+            return True, None, None
+        self.hits += 1
+        return True, _text(reply[0]), data
+
+    async def release(self, key: str) -> None:
+        """Free a claimed key."""
+        await self.client.delete(f"{self.prefix}c:{key}")
+
+    def metrics(self) -> Dict[str, int]:
+        """Return hit counters; size and expiry are tracked by Redis."""
+        return {"hits": self.hits, "misses": self.misses}
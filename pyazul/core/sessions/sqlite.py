@@ -0,0 +1,287 @@
+"""
+Durable 3D Secure session store on SQLite, for single-node deployments.
+
+`SQLiteSessionStore` keeps sessions in a local database file, so 3DS flows
+survive a restart without running Redis. The database runs in WAL mode with
+``synchronous=NORMAL``: commits append to the log without waiting for a full
+sync, and readers never block the writer.
+
+SQLite calls block, so they run on one dedicated thread owning the
+connection; coroutines hand work to it and await the result. The SQL is kept
+in constants, so the connection's statement cache reuses each prepared
+statement. Expired rows are skipped by every read and deleted in batches by a
+background sweep, keeping write transactions short.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from ..fork import register_after_fork
+from .base import (
+    INDEXED_FIELDS,
+    SessionData,
+    ThreeDSSessionStore,
+    check_indexed,
+    index_keys,
+)
+from .codec import decode, encode
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+Statement = Tuple[str, Tuple[Any, ...]]
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS threeds_sessions (
+        secure_id TEXT PRIMARY KEY,
+        azul_order_id TEXT,
+        order_number TEXT,
+        custom_order_id TEXT,
+        data BLOB NOT NULL,
+        expires_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS threeds_sessions_azul_order_id"
+    " ON threeds_sessions (azul_order_id)",
+    "CREATE INDEX IF NOT EXISTS threeds_sessions_order_number"
+    " ON threeds_sessions (order_number)",
+    "CREATE INDEX IF NOT EXISTS threeds_sessions_custom_order_id"
+    " ON threeds_sessions (custom_order_id)",
+    "CREATE INDEX IF NOT EXISTS threeds_sessions_expires_at"
+    " ON threeds_sessions (expires_at)",
+    """
+    CREATE TABLE IF NOT EXISTS threeds_claims (
+        key TEXT PRIMARY KEY,
+        expires_at REAL NOT NULL
+    )
+    """,
+)
+
+_UPSERT = """
+    INSERT INTO threeds_sessions
+        (secure_id, azul_order_id, order_number, custom_order_id, data, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (secure_id) DO UPDATE SET
+        azul_order_id = excluded.azul_order_id,
+        order_number = excluded.order_number,
+        custom_order_id = excluded.custom_order_id,
+        data = excluded.data,
+        expires_at = excluded.expires_at
+"""
+_SELECT = "SELECT data FROM threeds_sessions WHERE secure_id = ? AND expires_at > ?"
+_DELETE = "DELETE FROM threeds_sessions WHERE secure_id = ? AND expires_at > ?"
+# One query per indexed field; column names cannot be bound as parameters
+_FIND = {
+    field: f"SELECT secure_id FROM threeds_sessions WHERE {field} = ?"
+    " AND expires_at > ? ORDER BY expires_at DESC LIMIT 1"
+    for field in INDEXED_FIELDS
+}
+_EXPIRE_CLAIM = "DELETE FROM threeds_claims WHERE key = ? AND expires_at <= ?"
+_CLAIM = "INSERT OR IGNORE INTO threeds_claims (key, expires_at) VALUES (?, ?)"
+_RELEASE = "DELETE FROM threeds_claims WHERE key = ?"
+_SWEEP = """
+    DELETE FROM threeds_sessions WHERE rowid IN (
+        SELECT rowid FROM threeds_sessions WHERE expires_at <= ? LIMIT ?
+    )
+"""
+_SWEEP_CLAIMS = "DELETE FROM threeds_claims WHERE expires_at <= ?"
+
+
+class SQLiteSessionStore(ThreeDSSessionStore):
+    """Session store in a SQLite database file, accessed from one thread."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 1800.0,
+        sweep_interval: float = 60.0,
+        sweep_batch: int = 500,
+    ):
+        """
+        Initialize the store; the database is created on first use.
+
+        Args:
+            path: Database file, e.g. ``"/var/lib/shop/3ds.sqlite3"``.
+            ttl: Default seconds until a session expires.
+            sweep_interval: Seconds between removals of expired sessions.
+            sweep_batch: Rows deleted per transaction by the sweep.
+        """
+        if ttl <= 0 or sweep_interval <= 0:
+            raise ValueError("ttl and sweep_interval must be positive")
+        if sweep_batch < 1:
+            raise ValueError("sweep_batch must be at least 1")
+        self.path = path
+        self.ttl = ttl
+        self.sweep_interval = sweep_interval
+        self.sweep_batch = sweep_batch
+        self._db: Optional[sqlite3.Connection] = None
+        self._executor = self._new_executor()
+        self._sweeper: Optional["asyncio.Task[None]"] = None
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        register_after_fork(self)
+
+    @staticmethod
+    def _new_executor() -> ThreadPoolExecutor:
+        """Create the thread all database calls run on."""
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyazul-sqlite")
+
+    def _after_fork(self) -> None:
+        """Open a new connection on a new thread; neither survives a fork."""
+        self._db = None
+        self._executor = self._new_executor()
+        self._sweeper = None
+
+    # --- Database thread ---
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the connection, opening and migrating the database once."""
+        if self._db is None:
+            db = sqlite3.connect(self.path, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("PRAGMA busy_timeout=5000")
+            for statement in _SCHEMA:
+                db.execute(statement)
+            self._db = db
+        return self._db
+
+    def _write(self, *statements: Statement) -> int:
+        """Run statements in one transaction, returning the last row count."""
+        db = self._connection()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = None
+            for sql, parameters in statements:
+                cursor = db.execute(sql, parameters)
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return cursor.rowcount if cursor is not None else 0
+
+    def _read(self, sql: str, parameters: Tuple[Any, ...]) -> Any:
+        """Return the first column of the first row, or None."""
+        row = self._connection().execute(sql, parameters).fetchone()
+        return None if row is None else row[0]
+
+    def _sweep(self, now: float) -> int:
+        """Delete expired rows in batches, each in its own transaction."""
+        removed = 0
+        while True:
+            count = self._write((_SWEEP, (now, self.sweep_batch)))
+            removed += count
+            if count < self.sweep_batch:
+                break
+        self._write((_SWEEP_CLAIMS, (now,)))
+        return removed
+
+    def _close(self) -> None:
+        """Close the connection."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run `func` on the database thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
+
+    # --- Store interface ---
+
+    async def get(self, secure_id: str) -> Optional[SessionData]:
+        """Return the session, or None if it is unknown or expired."""
+        content = await self._run(self._read, _SELECT, (secure_id, time.time()))
+        if content is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return decode(content)
+
+    async def set(
+        self, secure_id: str, data: SessionData, ttl: Optional[float] = None
+    ) -> None:
+        """Create or replace a session and its indexed columns."""
+        keys = dict(index_keys(data))
+        row = (
+            secure_id,
+            keys.get("azul_order_id"),
+            keys.get("order_number"),
+            keys.get("custom_order_id"),
+            encode(data),
+            time.time() + (ttl or self.ttl),
+        )
+        await self._run(self._write, (_UPSERT, row))
+        self._start_sweeper()
+
+    async def delete(self, secure_id: str) -> bool:
+        """Remove a session, returning whether it existed."""
+        deleted = await self._run(self._write, (_DELETE, (secure_id, time.time())))
+        return deleted > 0
+
+    async def find(self, value: str, field: str = "azul_order_id") -> Optional[str]:
+        """Return the ``secure_id`` of the live session whose `field` is `value`."""
+        check_indexed(field)
+        return await self._run(self._read, _FIND[field], (str(value), time.time()))
+
+    async def claim(self, key: str, ttl: Optional[float] = None) -> bool:
+        """Take `key` unless a live claim holds it, atomically across processes."""
+        now = time.time()
+        taken = await self._run(
+            self._write,
+            (_EXPIRE_CLAIM, (key, now)),
+            (_CLAIM, (key, now + (ttl or self.ttl))),
+        )
+        return taken > 0
+
+    async def release(self, key: str) -> None:
+        """Free a claimed key."""
+        await self._run(self._write, (_RELEASE, (key,)))
+
+    async def sweep(self) -> int:
+        """
+        Delete every expired session now.
+
+        Returns:
+            Number of sessions removed.
+        """
+        removed = await self._run(self._sweep, time.time())
+        self.expired += removed
+        return removed
+
+    def _start_sweeper(self) -> None:
+        """Start the background sweep on the running loop, if not started."""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep_loop())
+
+    async def _sweep_loop(self) -> None:
+        """Sweep until cancelled."""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                removed = await self.sweep()
+            except sqlite3.Error as e:  # e.g. locked by another process
+                _logger.warning("Expiring 3DS sessions failed: %s", e)
+                continue
+            if removed:
+                _logger.debug("Expired %s 3DS sessions", removed)
+
+    async def aclose(self) -> None:
+        """Stop the sweep and close the database."""
+        task, self._sweeper = self._sweeper, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await self._run(self._close)
+        self._executor.shutdown(wait=True)
+
+    def metrics(self) -> Dict[str, int]:
+        """Return hit and expiry counters."""
+        return {"hits": self.hits, "misses": self.misses, "expired": self.expired}
@@ -0,0 +1,78 @@
+"""
+Per-key deduplication of concurrent calls.
+
+`SingleFlight` runs one call per key: callers arriving while it runs await the
+same result instead of starting their own. Successful results are kept for
+``ttl`` seconds so late duplicates get them too, in an LRU bounded by
+``max_keys``; failures are forgotten at once so the call can be retried.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Generic, Tuple, TypeVar
+
+from .fork import register_after_fork
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Expiring, bounded map of in-flight and recent calls per key."""
+
+    def __init__(self, ttl: float = 600.0, max_keys: int = 10000):
+        """
+        Initialize the map.
+
+        Args:
+            ttl: Seconds a successful result is reused after it completes.
+            max_keys: Keys kept at most; the least recently used is dropped.
+        """
+        if ttl < 0 or max_keys < 1:
+            raise ValueError("ttl must not be negative and max_keys at least 1")
+        self.ttl = ttl
+        self.max_keys = max_keys
+        # Future of each key and when its result expires (inf while running)
+        self._flights: "OrderedDict[str, Tuple[asyncio.Future[T], float]]" = (
+            OrderedDict()
+        )
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Forget calls bound to the parent's event loop."""
+        self._flights = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of keys held, expired ones included."""
+        return len(self._flights)
+
+    async def run(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the result of `call`, shared with every caller for `key`.
+
+        Args:
+            key: Identity of the call.
+            call: Starts the call; only invoked when no live flight exists.
+        """
+        flight = self._flights.get(key)
+        if flight is not None and flight[1] > time.monotonic():
+            self._flights.move_to_end(key)
+            future = flight[0]
+        else:
+            future = asyncio.ensure_future(call())
+            self._flights[key] = (future, float("inf"))
+            future.add_done_callback(lambda done: self._landed(key, done))
+            while len(self._flights) > self.max_keys:
+                self._flights.popitem(last=False)
+        # A cancelled caller must not cancel the call others are waiting on
+        return await asyncio.shield(future)
+
+    def _landed(self, key: str, done: "asyncio.Future[T]") -> None:
+        """Start the result's TTL, or forget the key if the call failed."""
+        flight = self._flights.get(key)
+        if flight is None or flight[0] is not done:
+            return
+        if done.cancelled() or done.exception() is not None:
+            del self._flights[key]
+        else:
+            self._flights[key] = (done, time.monotonic() + self.ttl)
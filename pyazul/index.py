@@ -6,15 +6,26 @@ for interacting with all services offered by the Azul Payment Gateway, including
 payments, 3D Secure, DataVault (tokenization), and Payment Page generation.
 """
 
-from typing import Any, Dict, Optional
+from functools import partial
+from types import TracebackType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Type
+
+import httpx
 
 from .api.client import AzulAPI
+from .api.constants import Priority
+from .api.keepalive import KeepAlive
+from .api.reload import ClientGeneration, CredentialWatcher
+from .api.timeouts import Deadline, TimeoutProfile
 from .core.config import AzulSettings, get_azul_settings
+from .core.sessions import InMemorySessionStore, ThreeDSSessionStore
 from .models.datavault import TokenRequest, TokenResponse, TokenSale
 from .models.payment import Hold, Post, Refund, Sale, Void
 from .models.payment_page import PaymentPage
+from .models.results import ThreeDSResult, TransactionResult
 from .models.three_ds import SecureSale, SecureTokenHold, SecureTokenSale
 from .models.verification import VerifyTransaction
+from .services.batch import BatchRunner, BatchStats, OperationLike
 from .services.datavault import DataVaultService
 from .services.payment_page import PaymentPageService
 from .services.secure import SecureService
@@ -44,11 +55,22 @@ class PyAzul:
         >>> token_response = await azul.create_token(...)
         >>> # Use token for a 3DS payment
         >>> secure_response = await azul.secure_token_sale(...)
+
+    The underlying connection pool is kept open between calls. Prefer using the
+    client as an async context manager, or call `aclose()` on shutdown:
+
+        >>> async with PyAzul() as azul:
+        ...     response = await azul.sale(...)
     """
 
     def __init__(
         self,
         settings: Optional[AzulSettings] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        timeout_profiles: Optional[Mapping[str, TimeoutProfile]] = None,
+        shared_pools: Optional[ClientGeneration] = None,
+        session_store: Optional[ThreeDSSessionStore] = None,
     ):
         """
         Initialize the PyAzul client.
@@ -56,45 +78,241 @@ class PyAzul:
         Args:
             settings: Optional custom settings. If not provided,
                      environment variables will be used.
+            http_client: Optional pre-configured `httpx.AsyncClient`. Must carry
+                     the Azul certificates; it is not closed by `aclose()`.
+            transport: Optional `httpx` transport for the internal client.
+            timeout_profiles: Optional timeouts per operation name, e.g.
+                     ``{"VerifyPayment": TimeoutProfile(connect=2, read=5)}``.
+            shared_pools: Optional connection pools shared between clients using
+                     the same certificate; normally provided by `TenantRegistry`.
+            session_store: Optional store of 3DS sessions, e.g. one shared by
+                     every worker; it is not closed by `aclose()`. Defaults to
+                     an in-memory store bounded by ``THREEDS_MAX_SESSIONS``.
         """
         if settings is None:
             settings = get_azul_settings()
         self.settings = settings
 
         # Create shared API client
-        self.api = AzulAPI(settings=self.settings)
+        self.api = AzulAPI(
+            settings=self.settings,
+            http_client=http_client,
+            transport=transport,
+            timeout_profiles=timeout_profiles,
+            shared_pools=shared_pools,
+        )
 
         # Initialize services with the API client, settings, and session_store
         self.transaction = TransactionService(client=self.api, settings=self.settings)
         self.datavault = DataVaultService(client=self.api, settings=self.settings)
         self.payment_page_service = PaymentPageService(settings=self.settings)
-        self.secure = SecureService(client=self.api, settings=self.settings)
+        # A plain dict is wrapped (with a deprecation warning) by SecureService
+        self._owns_session_store = not isinstance(session_store, ThreeDSSessionStore)
+        if session_store is None:
+            session_store = InMemorySessionStore(
+                max_sessions=self.settings.THREEDS_MAX_SESSIONS,
+                ttl=self.settings.THREEDS_SESSION_TTL,
+            )
+        self.secure = SecureService(
+            client=self.api, settings=self.settings, session_store=session_store
+        )
+        self.credential_watcher: Optional[CredentialWatcher] = None
+        self.keepalive: Optional[KeepAlive] = None
+
+    async def reload(self, settings: Optional[AzulSettings] = None) -> None:
+        """
+        Apply rotated certificates and credentials without a restart.
+
+        See `AzulAPI.reload`: in-flight requests finish on the previous
+        connection pool, new requests use the new certificate and credentials.
+
+        Args:
+            settings: New settings; defaults to the current ones, which reloads
+                certificate files whose content changed on disk.
+        """
+        await self.api.reload(settings)
+        self.settings = self.api.settings
+        for service in (
+            self.transaction,
+            self.datavault,
+            self.payment_page_service,
+            self.secure,
+        ):
+            service.settings = self.settings
+
+    def preload(self) -> "PyAzul":
+        """
+        Load certificates now, before a pre-fork server forks its workers.
+
+        Settings, validators and the SSL context are then built once in the
+        master and shared copy-on-write by every worker, while connection pools
+        and background tasks are rebuilt in each worker after the fork.
+
+        Returns:
+            This client, so it can be created and preloaded in one expression.
+        """
+        self.api.preload()
+        return self
+
+    async def warmup(self, connections: Optional[int] = None) -> int:
+        """
+        Pre-connect the pool to the primary and alternate hosts.
+
+        See `AzulAPI.warmup`.
 
-    async def sale(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        Returns:
+            Number of connections that answered.
+        """
+        return await self.api.warmup(connections)
+
+    def keep_alive(
+        self, interval: Optional[float] = None, connections: Optional[int] = None
+    ) -> KeepAlive:
+        """
+        Start keeping connections to every gateway endpoint warm.
+
+        Must be called from a running event loop; stopped by `aclose()`.
+
+        Args:
+            interval: Seconds between refreshes; defaults to
+                ``KEEPALIVE_INTERVAL`` or, when unset, half of
+                ``HTTP_KEEPALIVE_EXPIRY``.
+            connections: Connections kept per endpoint; defaults to
+                ``WARMUP_CONNECTIONS`` (or 1).
+        """
+        if self.keepalive is None:
+            self.keepalive = KeepAlive(
+                self.api,
+                interval
+                or self.settings.KEEPALIVE_INTERVAL
+                or self.settings.HTTP_KEEPALIVE_EXPIRY / 2,
+                connections or self.settings.WARMUP_CONNECTIONS or 1,
+            )
+        self.keepalive.start()
+        return self.keepalive
+
+    def watch_credentials(
+        self,
+        interval: Optional[float] = None,
+        settings_factory: Optional[Callable[[], AzulSettings]] = None,
+    ) -> CredentialWatcher:
+        """
+        Start polling for rotated certificates and credentials.
+
+        Must be called from a running event loop; the watcher is stopped by
+        `aclose()`.
+
+        Args:
+            interval: Seconds between polls; defaults to
+                ``CREDENTIAL_RELOAD_INTERVAL`` (or 60).
+            settings_factory: Returns the current settings; defaults to reading
+                them again from the environment and ``.env`` file.
+        """
+        if self.credential_watcher is None:
+            self.credential_watcher = CredentialWatcher(
+                self,
+                interval or self.settings.CREDENTIAL_RELOAD_INTERVAL or 60.0,
+                settings_factory,
+            )
+        self.credential_watcher.start()
+        return self.credential_watcher
+
+    async def aclose(self) -> None:
+        """Stop background tasks and close the shared connection pool."""
+        if self.credential_watcher is not None:
+            await self.credential_watcher.aclose()
+        if self.keepalive is not None:
+            await self.keepalive.aclose()
+        if self._owns_session_store:
+            await self.secure.session_store.aclose()
+        await self.api.aclose()
+
+    async def __aenter__(self) -> "PyAzul":
+        """Enter the async context, returning this client.
+
+        Starts the credential watcher when ``CREDENTIAL_RELOAD_INTERVAL`` is set,
+        opens ``WARMUP_CONNECTIONS`` connections per endpoint when set and
+        keeps them warm when ``KEEPALIVE_INTERVAL`` is set.
+        """
+        if self.settings.CREDENTIAL_RELOAD_INTERVAL:
+            self.watch_credentials()
+        if self.settings.WARMUP_CONNECTIONS:
+            await self.warmup()
+        if self.settings.KEEPALIVE_INTERVAL:
+            self.keep_alive()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the shared connection pool on context exit."""
+        await self.aclose()
+
+    async def sale(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
         """Process a direct card payment."""
-        return await self.transaction.process_sale(Sale(**data))
+        return await self.transaction.process_sale(Sale(**data), deadline, priority)
 
-    async def hold(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def hold(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
         """Perform a hold on a card (pre-authorization)."""
-        return await self.transaction.process_hold(Hold(**data))
+        return await self.transaction.process_hold(Hold(**data), deadline, priority)
 
-    async def refund(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def refund(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
         """Process a refund for a previous transaction."""
-        return await self.transaction.process_refund(Refund(**data))
+        return await self.transaction.process_refund(Refund(**data), deadline, priority)
 
-    async def void(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def void(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
         """Void a previous transaction."""
-        return await self.transaction.process_void(Void(**data))
+        return await self.transaction.process_void(Void(**data), deadline, priority)
 
-    async def post_auth(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def post_auth(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
         """Capture a previously held amount (post-authorization)."""
-        return await self.transaction.process_post(Post(**data))
+        return await self.transaction.process_post(Post(**data), deadline, priority)
 
-    async def verify_transaction(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def verify_transaction(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
         """Verify the status of a transaction."""
-        return await self.transaction.verify_payment(VerifyTransaction(**data))
+        return await self.transaction.verify_payment(
+            VerifyTransaction(**data), deadline, priority
+        )
 
-    async def create_token(self, data: Dict[str, Any]) -> TokenResponse:
+    async def create_token(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TokenResponse:
         """
         Create a card token in DataVault.
 
@@ -102,9 +320,16 @@ class PyAzul:
             TokenResponse: Validated response object with type-safe access
                                to token details or error information.
         """
-        return await self.datavault.create_token(TokenRequest(**data))
+        return await self.datavault.create_token(
+            TokenRequest(**data), deadline, priority
+        )
 
-    async def delete_token(self, data: Dict[str, Any]) -> TokenResponse:
+    async def delete_token(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TokenResponse:
         """
         Delete a token from DataVault.
 
@@ -112,11 +337,65 @@ class PyAzul:
             TokenResponse: Validated response object with type-safe access
                                to success confirmation or error information.
         """
-        return await self.datavault.delete_token(TokenRequest(**data))
+        return await self.datavault.delete_token(
+            TokenRequest(**data), deadline, priority
+        )
 
-    async def token_sale(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def token_sale(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
         """Process a sale using a token (without 3DS)."""
-        return await self.transaction.process_token_sale(TokenSale(**data))
+        return await self.transaction.process_token_sale(
+            TokenSale(**data), deadline, priority
+        )
+
+    def run_batch(
+        self,
+        operations: Iterable[OperationLike],
+        concurrency: int = 10,
+        on_progress: Optional[Callable[[BatchStats], None]] = None,
+        priority: Priority = Priority.BACKGROUND,
+    ) -> BatchRunner:
+        """
+        Run many operations concurrently over the shared connection pool.
+
+        Each operation is a `BatchOperation` or a ``(kind, data)`` pair, where
+        ``kind`` names one of the non-interactive methods of this class:
+        ``sale``, ``hold``, ``refund``, ``void``, ``post_auth``,
+        ``verify_transaction``, ``token_sale``, ``create_token`` or
+        ``delete_token``. Results are streamed as they complete and per-item
+        errors are captured on the result instead of being raised.
+
+        Args:
+            operations: Operations to run; consumed lazily.
+            concurrency: Maximum operations in flight. Keep it at or below
+                `HTTP_MAX_CONNECTIONS` to avoid waiting on the pool.
+            on_progress: Optional callback receiving `BatchStats` after each
+                completed operation.
+            priority: Traffic class of the batch; background by default so it
+                cannot starve interactive requests.
+
+        Returns:
+            BatchRunner: Async iterator of `BatchResult` with a `stats` attribute.
+        """
+        handlers = {
+            kind: partial(getattr(self, kind), priority=priority)
+            for kind in (
+                "sale",
+                "hold",
+                "refund",
+                "void",
+                "post_auth",
+                "verify_transaction",
+                "token_sale",
+                "create_token",
+                "delete_token",
+            )
+        }
+        return BatchRunner(handlers, operations, concurrency, on_progress)
 
     def payment_page(self, data: Dict[str, Any]) -> str:
         """Generate HTML for Azul's hosted payment page."""
@@ -124,42 +403,77 @@ class PyAzul:
 
     # --- Secure Methods (3D Secure) ---
 
-    async def secure_sale(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def secure_sale(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
         """Process a card payment using 3D Secure authentication."""
-        return await self.secure.process_sale(SecureSale(**data))
+        return await self.secure.process_sale(SecureSale(**data), deadline, priority)
 
-    async def secure_token_sale(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def secure_token_sale(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
         """Process a tokenized card payment using 3D Secure authentication."""
-        return await self.secure.process_token_sale(SecureTokenSale(**data))
+        return await self.secure.process_token_sale(
+            SecureTokenSale(**data), deadline, priority
+        )
 
-    async def secure_hold(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def secure_hold(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
         """Perform a hold on a card (pre-authorization) with 3D Secure."""
         # SecureService process_hold expects SecureSale model
-        return await self.secure.process_hold(SecureSale(**data))
+        return await self.secure.process_hold(SecureSale(**data), deadline, priority)
 
-    async def secure_token_hold(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def secure_token_hold(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
         """Perform a hold on a saved token (pre-authorization) with 3D Secure."""
-        return await self.secure.process_token_hold(SecureTokenHold(**data))
+        return await self.secure.process_token_hold(
+            SecureTokenHold(**data), deadline, priority
+        )
 
     async def process_3ds_method(
-        self, azul_order_id: str, method_notification_status: str
-    ) -> Dict[str, Any]:
+        self,
+        azul_order_id: str,
+        method_notification_status: str,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
         """Process the 3DS method notification received from ACS."""
         return await self.secure.process_3ds_method(
-            azul_order_id, method_notification_status
+            azul_order_id, method_notification_status, deadline, priority
         )
 
     async def process_challenge(
-        self, session_id: str, challenge_response: str
-    ) -> Dict[str, Any]:
+        self,
+        session_id: str,
+        challenge_response: str,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
         """Process the 3DS challenge response received from ACS."""
-        return await self.secure.process_challenge(session_id, challenge_response)
+        return await self.secure.process_challenge(
+            session_id, challenge_response, deadline, priority
+        )
 
     async def handle_3ds_callback(
         self,
         secure_id: str,
         callback_data: Optional[Dict[str, Any]] = None,
         form_data: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Dict[str, Any]:
         """
         Handle 3DS callbacks - automatically detects and routes to appropriate handler.
@@ -173,6 +487,7 @@ class PyAzul:
             secure_id: The secure session ID from callback URL
             callback_data: Query parameters from the callback
             form_data: Form data from POST callbacks (for method/challenge data)
+            deadline: Optional absolute deadline for any gateway call made
 
         Returns:
             Dict containing:
@@ -183,12 +498,24 @@ class PyAzul:
             - status: Transaction status (approved/declined/pending)
         """
         return await self.secure.handle_3ds_callback(
-            secure_id, callback_data or {}, form_data or {}
+            secure_id, callback_data or {}, form_data or {}, deadline
         )
 
     async def get_session_info(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve information about an active 3DS session."""
-        return self.secure.get_session_info(session_id)
+        return await self.secure.aget_session_info(session_id)
+
+    async def find_session(
+        self, value: str, field: str = "azul_order_id"
+    ) -> Optional[str]:
+        """
+        Find the ``secure_id`` of an active 3DS session.
+
+        Args:
+            value: Value to look up.
+            field: ``azul_order_id``, ``order_number`` or ``custom_order_id``.
+        """
+        return await self.secure.find_session(value, field)
 
     def create_challenge_form(
         self, creq: str, term_url: str, redirect_post_url: str
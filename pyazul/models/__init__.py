@@ -23,32 +23,78 @@ Legacy imports (deprecated):
 """
 
 import warnings
-
-# DataVault domain
-from .datavault import TokenError, TokenRequest, TokenResponse, TokenSale, TokenSuccess
-
-# Payment domain
-from .payment import BaseTransaction, CardPayment, Hold, Post, Refund, Sale, Void
-
-# Payment Page domain
-from .payment_page import PaymentPage
-
-# Base classes and validators from schemas
-from .schemas import AzulBase, _validate_amount_field, _validate_itbis_field
-
-# 3D Secure domain
-from .three_ds import (
-    CardHolderInfo,
-    ChallengeIndicator,
-    ChallengeRequest,
-    SecureSale,
-    SecureTokenSale,
-    SessionID,
-    ThreeDSAuth,
-)
-
-# Verification domain
-from .verification import VerifyTransaction
+from typing import TYPE_CHECKING
+
+from ..core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    # DataVault domain
+    from .datavault import (
+        TokenError,
+        TokenRequest,
+        TokenResponse,
+        TokenSale,
+        TokenSuccess,
+    )
+
+    # Payment domain
+    from .payment import BaseTransaction, CardPayment, Hold, Post, Refund, Sale, Void
+
+    # Payment Page domain
+    from .payment_page import PaymentPage
+
+    # Gateway results
+    from .results import AzulResult, ThreeDSResult, TransactionResult
+
+    # Base classes and validators from schemas
+    from .schemas import AzulBase, _validate_amount_field, _validate_itbis_field
+
+    # 3D Secure domain
+    from .three_ds import (
+        CardHolderInfo,
+        ChallengeIndicator,
+        ChallengeRequest,
+        SecureSale,
+        SecureTokenSale,
+        SessionID,
+        ThreeDSAuth,
+    )
+
+    # Verification domain
+    from .verification import VerifyTransaction
+
+# Models are imported (and their schemas built) on first access
+_EXPORTS = {
+    "AzulBase": ".schemas",
+    "_validate_amount_field": ".schemas",
+    "_validate_itbis_field": ".schemas",
+    "BaseTransaction": ".payment",
+    "CardPayment": ".payment",
+    "Sale": ".payment",
+    "Hold": ".payment",
+    "Refund": ".payment",
+    "Void": ".payment",
+    "Post": ".payment",
+    "TokenRequest": ".datavault",
+    "TokenResponse": ".datavault",
+    "TokenSuccess": ".datavault",
+    "TokenError": ".datavault",
+    "TokenSale": ".datavault",
+    "CardHolderInfo": ".three_ds",
+    "ThreeDSAuth": ".three_ds",
+    "ChallengeIndicator": ".three_ds",
+    "SecureSale": ".three_ds",
+    "SecureTokenSale": ".three_ds",
+    "SessionID": ".three_ds",
+    "ChallengeRequest": ".three_ds",
+    "PaymentPage": ".payment_page",
+    "VerifyTransaction": ".verification",
+    "AzulResult": ".results",
+    "TransactionResult": ".results",
+    "ThreeDSResult": ".results",
+}
+
+_get_export, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 # ========================================
 # Backward Compatibility Aliases (Deprecated)
@@ -69,44 +115,47 @@ def _deprecated_alias(new_name: str, old_name: str, obj):
     return deprecated_property
 
 
-# Create deprecated aliases
+_DEPRECATED_ALIASES = {
+    # Base classes
+    "AzulBaseModel": "AzulBase",
+    "BaseTransactionAttributes": "BaseTransaction",
+    "CardPaymentAttributes": "CardPayment",
+    # Payment models
+    "SaleTransactionModel": "Sale",
+    "HoldTransactionModel": "Hold",
+    "RefundTransactionModel": "Refund",
+    "VoidTransactionModel": "Void",
+    "PostSaleTransactionModel": "Post",
+    # DataVault models
+    "DataVaultRequestModel": "TokenRequest",
+    "DataVaultResponse": "TokenResponse",
+    "DataVaultSuccessResponse": "TokenSuccess",
+    "DataVaultErrorResponse": "TokenError",
+    "TokenSaleModel": "TokenSale",
+    # 3DS models
+    "SecureSaleRequest": "SecureSale",
+    "SecureSessionID": "SessionID",
+    "SecureChallengeRequest": "ChallengeRequest",
+    # Other models
+    "PaymentPageModel": "PaymentPage",
+    "VerifyTransactionModel": "VerifyTransaction",
+}
+
+
 def __getattr__(name: str):
-    """Handle deprecated model name imports with warnings."""
-    deprecation_map = {
-        # Base classes
-        "AzulBaseModel": ("AzulBase", AzulBase),
-        "BaseTransactionAttributes": ("BaseTransaction", BaseTransaction),
-        "CardPaymentAttributes": ("CardPayment", CardPayment),
-        # Payment models
-        "SaleTransactionModel": ("Sale", Sale),
-        "HoldTransactionModel": ("Hold", Hold),
-        "RefundTransactionModel": ("Refund", Refund),
-        "VoidTransactionModel": ("Void", Void),
-        "PostSaleTransactionModel": ("Post", Post),
-        # DataVault models
-        "DataVaultRequestModel": ("TokenRequest", TokenRequest),
-        "DataVaultResponse": ("TokenResponse", TokenResponse),
-        "DataVaultSuccessResponse": ("TokenSuccess", TokenSuccess),
-        "DataVaultErrorResponse": ("TokenError", TokenError),
-        "TokenSaleModel": ("TokenSale", TokenSale),
-        # 3DS models
-        "SecureSaleRequest": ("SecureSale", SecureSale),
-        "SecureSessionID": ("SessionID", SessionID),
-        "SecureChallengeRequest": ("ChallengeRequest", ChallengeRequest),
-        # Other models
-        "PaymentPageModel": ("PaymentPage", PaymentPage),
-        "VerifyTransactionModel": ("VerifyTransaction", VerifyTransaction),
-    }
-
-    if name in deprecation_map:
-        new_name, obj = deprecation_map[name]
+    """Import models lazily and handle deprecated model names with warnings."""
+    if name in _EXPORTS:
+        return _get_export(name)
+
+    if name in _DEPRECATED_ALIASES:
+        new_name = _DEPRECATED_ALIASES[name]
         warnings.warn(
             f"'{name}' is deprecated and will be removed in a future version. "
             f"Use '{new_name}' instead.",
             DeprecationWarning,
             stacklevel=2,
         )
-        return obj
+        return _get_export(new_name)
 
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
@@ -143,4 +192,8 @@ __all__ = [
     "PaymentPage",
     # Verification domain models
     "VerifyTransaction",
+    # Gateway results
+    "AzulResult",
+    "TransactionResult",
+    "ThreeDSResult",
 ]
@@ -58,8 +58,12 @@ class TokenSuccess(BaseModel):
 
     @classmethod
     def from_api_response(cls, data: dict) -> "TokenSuccess":
-        """Create a TokenSuccess from API response data."""
-        return cls(
+        """Create a TokenSuccess from API response data.
+
+        The gateway response is trusted as-is, so the model is constructed
+        without re-running validation.
+        """
+        return cls.model_construct(
             CardNumber=data.get("CardNumber", ""),
             DataVaultToken=data.get("DataVaultToken", ""),
             DataVaultBrand=data.get(
@@ -89,8 +93,8 @@ class TokenError(BaseModel):
 
     @classmethod
     def from_api_response(cls, data: dict) -> "TokenError":
-        """Create a TokenError from API response data."""
-        return cls(
+        """Create a TokenError from API response data without re-validation."""
+        return cls.model_construct(
             CardNumber="",
             DataVaultToken="",
             DataVaultBrand="",
@@ -0,0 +1,219 @@
+"""
+Compact response objects for Azul gateway results.
+
+Results keep the documented response fields in ``__slots__`` instead of a
+per-instance dictionary, which makes them smaller to keep around (e.g. for
+reconciliation) and lets ``result.AzulOrderId`` read a slot directly, without
+re-validating the gateway's answer through pydantic. Unset documented fields
+read as None. Undocumented fields are not copied: the decoded response they
+came in is kept and read only when such a field is asked for.
+
+Results are read-write mappings, so ``result["IsoCode"]``, ``result.get(...)``,
+``in``, iteration, ``dict(result)`` and comparison with a dict all work. They
+are not `dict` instances: use `to_dict()` (or ``json.dumps(result,
+default=dict)``) to serialize one.
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, ClassVar, Dict, FrozenSet, Iterator, Mapping, Optional, Tuple
+
+_MISSING = object()
+
+
+def render_challenge_form(creq: str, term_url: str, redirect_post_url: str) -> str:
+    """Render the auto-submitting HTML form for a 3DS challenge redirect."""
+    return (
+        f'<form id="form3ds" action="{redirect_post_url}" method="POST" '
+        f'style="display: none;">'
+        f'    <input type="hidden" name="creq" value="{creq}" />'
+        f'    <input type="hidden" name="TermUrl" value="{term_url}" />'
+        f"</form>"
+        f"<script>document.getElementById('form3ds').submit();</script>"
+    )
+
+
+class _Extra(dict):
+    """Undocumented fields owned by a result, once one of them is changed."""
+
+    __slots__ = ()
+
+
+class AzulResult(MutableMapping):
+    """Base class for slotted, dict-compatible gateway results."""
+
+    __slots__ = ("_raw",)
+
+    _fields: ClassVar[Tuple[str, ...]] = ()
+    _field_set: ClassVar[FrozenSet[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Index the documented fields of the subclass."""
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls._fields)
+
+    def __init__(self, data: Optional[Mapping[str, Any]] = None):
+        """Initialize the result from a decoded gateway response."""
+        # Response holding undocumented fields; becomes an `_Extra` once written
+        self._raw: Optional[Mapping[str, Any]] = None
+        if not data:
+            return
+        found = 0
+        for key in self._fields:
+            value = data.get(key, _MISSING)
+            if value is not _MISSING:
+                object.__setattr__(self, key, value)
+                found += 1
+        if found < len(data):
+            self._raw = data
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "AzulResult":
+        """Build a result from a decoded gateway response."""
+        return data if isinstance(data, cls) else cls(data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a plain dictionary."""
+        return dict(self.items())
+
+    def _extra_keys(self) -> Iterator[str]:
+        """Iterate over the undocumented fields."""
+        raw = self._raw
+        if raw is None:
+            return iter(())
+        if isinstance(raw, _Extra):
+            return iter(raw)
+        return (key for key in raw if key not in self._field_set)
+
+    def _own_extra(self) -> _Extra:
+        """Copy the undocumented fields out of the response before a write."""
+        raw = self._raw
+        if not isinstance(raw, _Extra):
+            source = raw or {}
+            raw = self._raw = _Extra((key, source[key]) for key in self._extra_keys())
+        return raw
+
+    def __getattr__(self, name: str) -> Any:
+        """Return None for unset documented fields, or an undocumented field."""
+        if name in self._field_set:
+            return None
+        raw = self._raw
+        if raw is not None and name in raw and not name.startswith("_"):
+            return raw[name]
+        raise AttributeError(f"{type(self).__name__!r} has no attribute {name!r}")
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a response field."""
+        if key in self._field_set:
+            try:
+                return object.__getattribute__(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        raw = self._raw
+        if raw is not None and key in raw:
+            return raw[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set a response field."""
+        if key in self._field_set:
+            object.__setattr__(self, key, value)
+        else:
+            self._own_extra()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a response field."""
+        if key in self._field_set:
+            try:
+                object.__delattr__(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._raw is not None and key in self._raw:
+            del self._own_extra()[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether a field is present in the response."""
+        if key in self._field_set:
+            try:
+                object.__getattribute__(self, key)  # type: ignore[arg-type]
+            except AttributeError:
+                return False
+            return True
+        return self._raw is not None and key in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the fields present in the response."""
+        for key in self._fields:
+            try:
+                object.__getattribute__(self, key)
+            except AttributeError:
+                continue
+            yield key
+        yield from self._extra_keys()
+
+    def __len__(self) -> int:
+        """Return the number of fields present in the response."""
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the picklable state of the result."""
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the result from its pickled state."""
+        self.__init__(state)  # type: ignore[misc]
+
+
+class TransactionResult(AzulResult):
+    """Result of a payment operation (sale, hold, refund, void, post, verify)."""
+
+    __slots__ = _fields = (
+        "ResponseCode",
+        "IsoCode",
+        "ResponseMessage",
+        "ErrorDescription",
+        "AuthorizationCode",
+        "AzulOrderId",
+        "CustomOrderId",
+        "OrderNumber",
+        "RRN",
+        "DateTime",
+        "LotNumber",
+        "Ticket",
+        "DataVaultToken",
+        "DataVaultExpiration",
+        "DataVaultBrand",
+    )
+
+    @property
+    def approved(self) -> bool:
+        """Whether the gateway approved the transaction, i.e. ISO code ``00``."""
+        return self.IsoCode == "00"
+
+
+class ThreeDSResult(TransactionResult):
+    """
+    Result of a 3D Secure operation.
+
+    Besides the gateway fields it holds the redirect the browser needs, set by
+    `SecureService`: ``redirect``, ``message`` and the ``html`` to render,
+    which is the ``method_form`` or the ``challenge_html``.
+    """
+
+    __slots__ = (
+        "ThreeDSMethod",
+        "ThreeDSChallenge",
+        "id",
+        "redirect",
+        "message",
+        "challenge_required",
+        "method_form",
+        "challenge_html",
+        "html",
+    )
+    _fields = TransactionResult._fields + __slots__
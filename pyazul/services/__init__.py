@@ -5,12 +5,35 @@ This package contains service classes that encapsulate business logic for intera
 with different aspects of the Azul API, such as transactions, DataVault, and 3D Secure.
 """
 
-from .datavault import DataVaultService
-from .payment_page import PaymentPageService
-from .transaction import TransactionService
+from typing import TYPE_CHECKING
+
+from ..core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .batch import BatchOperation, BatchResult, BatchRunner, BatchStats
+    from .datavault import DataVaultService
+    from .payment_page import PaymentPageService
+    from .transaction import TransactionService
 
 __all__ = [
     "TransactionService",
     "DataVaultService",
     "PaymentPageService",
+    "BatchOperation",
+    "BatchResult",
+    "BatchRunner",
+    "BatchStats",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "TransactionService": ".transaction",
+        "DataVaultService": ".datavault",
+        "PaymentPageService": ".payment_page",
+        "BatchOperation": ".batch",
+        "BatchResult": ".batch",
+        "BatchRunner": ".batch",
+        "BatchStats": ".batch",
+    },
+)
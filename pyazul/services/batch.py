@@ -0,0 +1,231 @@
+"""
+Batch execution service for PyAzul.
+
+This module runs many independent operations (refunds, voids, posts, ...)
+with bounded concurrency over the shared `AzulAPI` connection pool, yielding
+each result as soon as it completes. A failure stays with its own item and
+never aborts the rest of the batch.
+"""
+
+import asyncio
+import logging
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ..core.exceptions import AzulError
+
+_logger = logging.getLogger(__name__)
+
+BatchHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class BatchOperation(NamedTuple):
+    """A single operation in a batch.
+
+    Attributes:
+        kind: Name of the operation, e.g. ``"refund"``, ``"void"``, ``"post_auth"``.
+        data: Request data, as accepted by the matching `PyAzul` method.
+        key: Optional caller reference returned with the result.
+    """
+
+    kind: str
+    data: Dict[str, Any]
+    key: Any = None
+
+
+class BatchResult:
+    """Outcome of one batch operation."""
+
+    __slots__ = ("index", "operation", "response", "error", "elapsed")
+
+    def __init__(
+        self,
+        index: int,
+        operation: BatchOperation,
+        response: Any = None,
+        error: Optional[Exception] = None,
+        elapsed: float = 0.0,
+    ):
+        """Initialize a batch result."""
+        self.index = index
+        self.operation = operation
+        self.response = response
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation completed without raising."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        outcome = "ok" if self.ok else f"error={self.error!r}"
+        return f"BatchResult(index={self.index}, kind={self.operation.kind}, {outcome})"
+
+
+class BatchStats:
+    """Progress and throughput counters for a running batch."""
+
+    __slots__ = ("submitted", "completed", "succeeded", "failed", "_started")
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.submitted = 0
+        self.completed = 0
+        self.succeeded = 0
+        self.failed = 0
+        self._started: Optional[float] = None
+
+    @property
+    def in_flight(self) -> int:
+        """Operations submitted but not yet completed."""
+        return self.submitted - self.completed
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the first operation was submitted."""
+        if self._started is None:
+            return 0.0
+        return time.monotonic() - self._started
+
+    @property
+    def throughput(self) -> float:
+        """Completed operations per second."""
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return (
+            f"BatchStats(completed={self.completed}, succeeded={self.succeeded}, "
+            f"failed={self.failed}, in_flight={self.in_flight}, "
+            f"throughput={self.throughput:.1f}/s)"
+        )
+
+
+OperationLike = Union[BatchOperation, Tuple[str, Dict[str, Any]]]
+
+
+class BatchRunner:
+    """
+    Async iterator running batch operations with bounded concurrency.
+
+    Results are yielded in completion order, not submission order; use
+    `BatchResult.index` or `BatchOperation.key` to correlate them. Leaving the
+    iteration early cancels the operations still in flight.
+
+    Example:
+        >>> batch = azul.run_batch([("refund", {...}), ("void", {...})])
+        >>> async for result in batch:
+        ...     if not result.ok:
+        ...         print(result.operation.key, result.error)
+        >>> print(batch.stats)
+    """
+
+    def __init__(
+        self,
+        handlers: Mapping[str, BatchHandler],
+        operations: Iterable[OperationLike],
+        concurrency: int = 10,
+        on_progress: Optional[Callable[[BatchStats], None]] = None,
+    ):
+        """
+        Initialize the batch runner.
+
+        Args:
+            handlers: Coroutine functions keyed by operation kind.
+            operations: Operations to run; consumed lazily, so generators work.
+            concurrency: Maximum number of operations in flight at once.
+            on_progress: Optional callback invoked with the stats after every
+                completed operation.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._handlers = handlers
+        self._operations = operations
+        self.concurrency = concurrency
+        self.on_progress = on_progress
+        self.stats = BatchStats()
+        self._started = False
+
+    def __aiter__(self) -> AsyncIterator[BatchResult]:
+        """Start the batch and return the result iterator."""
+        if self._started:
+            raise AzulError("A batch can only be iterated once")
+        self._started = True
+        return self._run()
+
+    async def _run(self) -> AsyncIterator[BatchResult]:
+        """Run the operations and yield results as they complete."""
+        pending: Set["asyncio.Task[BatchResult]"] = set()
+        source = enumerate(self._operations)
+        self.stats._started = time.monotonic()
+        try:
+            while True:
+                for index, operation in source:
+                    pending.add(asyncio.ensure_future(self._execute(index, operation)))
+                    self.stats.submitted += 1
+                    if len(pending) >= self.concurrency:
+                        break
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    result = task.result()
+                    self._record(result)
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _execute(self, index: int, item: OperationLike) -> BatchResult:
+        """Run a single operation, capturing any error on its result."""
+        started = time.monotonic()
+        operation = item if isinstance(item, BatchOperation) else None
+        try:
+            if operation is None:
+                operation = BatchOperation(*item)
+            handler = self._handlers.get(operation.kind)
+            if handler is None:
+                raise AzulError(f"Unsupported batch operation: {operation.kind}")
+            response = await handler(operation.data)
+        except Exception as e:
+            if operation is None:  # Malformed item, reported under its index
+                operation = BatchOperation("invalid", {}, key=item)
+            _logger.debug(
+                "Batch operation %s (%s) failed: %s", index, operation.kind, e
+            )
+            return BatchResult(
+                index, operation, error=e, elapsed=time.monotonic() - started
+            )
+        return BatchResult(
+            index, operation, response=response, elapsed=time.monotonic() - started
+        )
+
+    def _record(self, result: BatchResult) -> None:
+        """Update the counters and report progress."""
+        self.stats.completed += 1
+        if result.ok:
+            self.stats.succeeded += 1
+        else:
+            self.stats.failed += 1
+        if self.on_progress is not None:
+            self.on_progress(self.stats)
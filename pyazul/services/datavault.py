@@ -6,9 +6,11 @@ including creating tokens, deleting tokens, and processing token-based payments.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from ..api.client import AzulAPI
+from ..api.constants import Priority
+from ..api.timeouts import Deadline
 from ..core.config import AzulSettings
 from ..core.exceptions import AzulError
 from ..models.datavault import TokenError, TokenRequest, TokenResponse, TokenSuccess
@@ -24,12 +26,19 @@ class DataVaultService:
         self.client = client
         self.settings = settings
 
-    async def create_token(self, request: TokenRequest) -> TokenResponse:
+    async def create_token(
+        self,
+        request: TokenRequest,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TokenResponse:
         """
         Create a new DataVault token for a credit card.
 
         Args:
             request: Token creation request with card details
+            deadline: Optional absolute deadline for the request
+            priority: Traffic class of the request
 
         Returns:
             TokenResponse (either TokenSuccess or TokenError)
@@ -38,14 +47,16 @@ class DataVaultService:
             AzulError: If token creation fails
         """
         try:
-            _logger.info("Creating DataVault token")
+            _logger.debug("Creating DataVault token")
 
             if request.TrxType != "CREATE":
                 raise AzulError("TrxType must be CREATE for token creation")
 
             response = await self.client.post(
                 "/webservices/JSON/default.aspx?ProcessDatavault",
-                request.model_dump(exclude_none=True),
+                request,
+                deadline=deadline,
+                priority=priority,
             )
 
             # Parse response based on success/failure
@@ -57,15 +68,22 @@ class DataVaultService:
                 return TokenError.from_api_response(response)
 
         except Exception as e:
-            _logger.error(f"DataVault token creation failed: {e}")
+            _logger.error("DataVault token creation failed: %s", e)
             raise AzulError(f"DataVault token creation failed: {e}") from e
 
-    async def delete_token(self, request: TokenRequest) -> TokenResponse:
+    async def delete_token(
+        self,
+        request: TokenRequest,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TokenResponse:
         """
         Delete an existing DataVault token.
 
         Args:
             request: Token deletion request with token ID
+            deadline: Optional absolute deadline for the request
+            priority: Traffic class of the request
 
         Returns:
             TokenResponse (either TokenSuccess or TokenError)
@@ -74,14 +92,17 @@ class DataVaultService:
             AzulError: If token deletion fails
         """
         try:
-            _logger.info("Deleting DataVault token")
+            _logger.debug("Deleting DataVault token")
 
             if request.TrxType != "DELETE":
                 raise AzulError("TrxType must be DELETE for token deletion")
 
             response = await self.client.post(
                 "/webservices/JSON/default.aspx?ProcessDatavault",
-                request.model_dump(exclude_none=True),
+                request,
+                hedge=True,
+                deadline=deadline,
+                priority=priority,
             )
 
             # Parse response based on success/failure
@@ -93,15 +114,22 @@ class DataVaultService:
                 return TokenError.from_api_response(response)
 
         except Exception as e:
-            _logger.error(f"DataVault token deletion failed: {e}")
+            _logger.error("DataVault token deletion failed: %s", e)
             raise AzulError(f"DataVault token deletion failed: {e}") from e
 
-    async def process_datavault_request(self, request: TokenRequest) -> TokenResponse:
+    async def process_datavault_request(
+        self,
+        request: TokenRequest,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TokenResponse:
         """
         Process a DataVault request (CREATE or DELETE).
 
         Args:
             request: DataVault request model
+            deadline: Optional absolute deadline for the request
+            priority: Traffic class of the request
 
         Returns:
             TokenResponse based on operation result
@@ -110,9 +138,9 @@ class DataVaultService:
             AzulError: If the request processing fails
         """
         if request.TrxType == "CREATE":
-            return await self.create_token(request)
+            return await self.create_token(request, deadline, priority)
         elif request.TrxType == "DELETE":
-            return await self.delete_token(request)
+            return await self.delete_token(request, deadline, priority)
         else:
             raise AzulError(f"Unsupported TrxType: {request.TrxType}")
 
@@ -130,10 +158,10 @@ class DataVaultService:
             AzulError: If token query fails
         """
         try:
-            _logger.info("Querying DataVault token information")
+            _logger.debug("Querying DataVault token information")
             # This would be implementation specific based on Azul's API
             # Currently using a placeholder implementation
             raise NotImplementedError("Token info query not yet implemented")
         except Exception as e:
-            _logger.error(f"DataVault token query failed: {e}")
+            _logger.error("DataVault token query failed: %s", e)
             raise AzulError(f"DataVault token query failed: {e}") from e
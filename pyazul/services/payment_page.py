@@ -62,7 +62,7 @@ class PaymentPageService:
             return html
 
         except Exception as e:
-            _logger.error(f"Payment Page form generation failed: {e}")
+            _logger.error("Payment Page form generation failed: %s", e)
             raise AzulError(f"Payment Page form generation failed: {e}") from e
 
     def _generate_auth_hash(self, form_data: Dict[str, str]) -> str:
@@ -191,5 +191,5 @@ class PaymentPageService:
             return payment_request
 
         except Exception as e:
-            _logger.error(f"Payment request creation failed: {e}")
+            _logger.error("Payment request creation failed: %s", e)
             raise AzulError(f"Payment request creation failed: {e}") from e
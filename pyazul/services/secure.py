@@ -7,31 +7,67 @@ including cardholder verification, challenge handling, and secure transactions.
 
 import logging
 import uuid
+import warnings
 from typing import Any, Dict, Optional, Union
 
 from ..api.client import AzulAPI
+from ..api.constants import Priority
+from ..api.timeouts import Deadline
 from ..core.config import AzulSettings
 from ..core.exceptions import AzulError
+from ..core.sessions import InMemorySessionStore, SessionData, ThreeDSSessionStore
+from ..core.singleflight import SingleFlight
+from ..models.results import ThreeDSResult, render_challenge_form
 from ..models.three_ds import SecureSale, SecureTokenHold, SecureTokenSale
 
 _logger = logging.getLogger(__name__)
 
 
+class _SessionNotFound(Exception):
+    """No session matches a method notification; the result must not be reused."""
+
+
 class SecureService:
     """Service for managing 3D Secure authentication and transactions."""
 
+    # Seconds a processed 3DS method is deduplicated (ACS retries come early)
+    METHOD_DEDUP_TTL = 600.0
+
     def __init__(
         self,
         client: AzulAPI,
         settings: AzulSettings,
-        session_store: Optional[Dict] = None,
+        session_store: Union[ThreeDSSessionStore, Dict[str, SessionData], None] = None,
     ):
-        """Initialize the 3D Secure service with API client and settings."""
+        """
+        Initialize the 3D Secure service with API client and settings.
+
+        Args:
+            client: API client.
+            settings: Settings of the merchant.
+            session_store: Store of 3DS sessions; defaults to a bounded
+                in-memory store. A plain dict, as accepted by earlier versions,
+                is deprecated: its sessions are copied into an
+                `InMemorySessionStore`, so later changes to it are not seen.
+        """
         self.client = client
         self.settings = settings
-        self.session_store = session_store or {}
-        # Track processed methods to prevent duplicate processing
-        self.processed_methods: Dict[str, bool] = {}
+        if isinstance(session_store, dict):
+            warnings.warn(
+                "Passing a dict as session_store is deprecated. "
+                "Pass an InMemorySessionStore or another ThreeDSSessionStore.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            session_store = InMemorySessionStore.from_mapping(session_store)
+        # An empty store is falsy, so `or` would replace a shared one
+        if session_store is None:
+            session_store = InMemorySessionStore()
+        self.session_store = session_store
+        # Duplicate method notifications share the first one's gateway call
+        self.method_calls: SingleFlight[ThreeDSResult] = SingleFlight(
+            ttl=self.METHOD_DEDUP_TTL
+        )
 
     def _generate_secure_id(self) -> str:
         """Generate a unique secure session ID."""
@@ -40,14 +76,7 @@ class SecureService:
     @staticmethod
     def _create_challenge_form(creq: str, term_url: str, redirect_post_url: str) -> str:
         """Create an HTML form for the 3DS challenge redirect."""
-        return (
-            f'<form id="form3ds" action="{redirect_post_url}" method="POST" '
-            f'style="display: none;">'
-            f'    <input type="hidden" name="creq" value="{creq}" />'
-            f'    <input type="hidden" name="TermUrl" value="{term_url}" />'
-            f"</form>"
-            f"<script>document.getElementById('form3ds').submit();</script>"
-        )
+        return render_challenge_form(creq, term_url, redirect_post_url)
 
     def create_challenge_form(
         self, redirect_post_url: str, creq: str, term_url: str
@@ -72,12 +101,14 @@ class SecureService:
             and "ThreeDSChallenge" in response
         )
 
-    def _process_3ds_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+    def _process_3ds_response(self, response: Dict[str, Any]) -> ThreeDSResult:
         """Process 3DS response and add redirect/html fields if needed."""
+        result = ThreeDSResult.from_dict(response)
+
         # Check for 3DS Method requirement
-        if self._check_3ds_method_required(response):
-            method_form = response["ThreeDSMethod"]["MethodForm"]
-            response.update(
+        if self._check_3ds_method_required(result):
+            method_form = result["ThreeDSMethod"]["MethodForm"]
+            result.update(
                 {
                     "redirect": True,
                     "method_form": method_form,
@@ -85,17 +116,17 @@ class SecureService:
                     "message": "3DS Method required",
                 }
             )
-            return response
+            return result
 
         # Check for 3DS Challenge requirement
-        if self._check_3ds_challenge_required(response):
-            challenge_data = response["ThreeDSChallenge"]
+        if self._check_3ds_challenge_required(result):
+            challenge_data = result["ThreeDSChallenge"]
             creq = challenge_data.get("CReq")
             redirect_url = challenge_data.get("RedirectPostUrl")
 
             if creq and redirect_url:
                 challenge_html = self._create_challenge_form(creq, "", redirect_url)
-                response.update(
+                result.update(
                     {
                         "redirect": True,
                         "html": challenge_html,
@@ -105,7 +136,7 @@ class SecureService:
                     }
                 )
 
-        return response
+        return result
 
     def _get_transaction_status(
         self, response: Dict[str, Any]
@@ -143,21 +174,59 @@ class SecureService:
 
         return status, error_description or None
 
-    def _store_session_data(self, secure_id: str, data: Dict[str, Any]) -> None:
+    async def _store_session_data(self, secure_id: str, data: SessionData) -> None:
         """Store session data for a secure transaction."""
-        self.session_store[secure_id] = data
+        await self.session_store.set(secure_id, data)
 
-    def get_session_info(self, secure_id: str) -> Optional[Dict[str, Any]]:
+    def get_session_info(self, secure_id: str) -> Optional[SessionData]:
         """
-        Retrieve information about an active 3DS session.
+        Retrieve information about an active 3DS session, synchronously.
+
+        Kept for callers of earlier versions; only the in-memory store can be
+        read this way. Use `aget_session_info` with any other store.
 
         Args:
             secure_id: The secure session ID
 
         Returns:
             Session data dictionary or None if session not found
+
+        Raises:
+            AzulError: If the session store can only be read asynchronously.
         """
-        return self.session_store.get(secure_id)
+        if not isinstance(self.session_store, InMemorySessionStore):
+            raise AzulError(
+                f"{type(self.session_store).__name__} is read asynchronously; "
+                "use aget_session_info()"
+            )
+        return self.session_store.get_nowait(secure_id)
+
+    async def aget_session_info(self, secure_id: str) -> Optional[SessionData]:
+        """
+        Retrieve information about an active 3DS session from any store.
+
+        Args:
+            secure_id: The secure session ID
+
+        Returns:
+            Session data dictionary or None if session not found
+        """
+        return await self.session_store.get(secure_id)
+
+    async def find_session(
+        self, value: str, field: str = "azul_order_id"
+    ) -> Optional[str]:
+        """
+        Find the ``secure_id`` of an active 3DS session by an order field.
+
+        Args:
+            value: Value to look up.
+            field: ``azul_order_id``, ``order_number`` or ``custom_order_id``.
+
+        Returns:
+            The secure session ID, or None if no active session matches
+        """
+        return await self.session_store.find(value, field)
 
     def _prepare_secure_request_data(
         self,
@@ -199,6 +268,7 @@ class SecureService:
             "amount": request.Amount,
             "itbis": request.Itbis,
             "order_number": request.OrderNumber,
+            "custom_order_id": request.CustomOrderId,
             "term_url": term_url,
             "status": "processing",
         }
@@ -229,40 +299,42 @@ class SecureService:
 
         return session_data
 
-    def _update_session_with_result(
+    async def _update_session_with_result(
         self, secure_id: str, result: Dict[str, Any], is_final: bool = False
     ) -> str:
         """Update session data with transaction result and return status."""
         status, error_description = self._get_transaction_status(result)
 
-        session_data = self.get_session_info(secure_id)
+        session_data = await self.aget_session_info(secure_id)
         if session_data:
-            session_data.update({"status": status, "final_result": result})
+            # Stores hold plain data; results are dict-like objects
+            session_data.update({"status": status, "final_result": dict(result)})
             if error_description:
                 session_data["error_description"] = error_description
-            self._store_session_data(secure_id, session_data)
+            await self._store_session_data(secure_id, session_data)
 
         # Clean up completed transactions
         if is_final and status in ["approved", "declined"]:
-            self._cleanup_session(secure_id)
+            await self._cleanup_session(secure_id)
 
         return status
 
-    def _cleanup_session(self, secure_id: str) -> None:
+    async def _cleanup_session(self, secure_id: str) -> None:
         """Clean up session data after transaction completion."""
         try:
-            if secure_id in self.session_store:
-                del self.session_store[secure_id]
-                _logger.debug(f"Cleaned up session data for secure_id: {secure_id}")
+            if await self.session_store.delete(secure_id):
+                _logger.debug("Cleaned up session data for secure_id: %s", secure_id)
         except Exception as e:
-            _logger.warning(f"Failed to cleanup session {secure_id}: {e}")
+            _logger.warning("Failed to cleanup session %s: %s", secure_id, e)
 
     async def _process_secure_transaction(
         self,
         request: Union[SecureSale, SecureTokenSale, SecureTokenHold],
         transaction_type: str,
         transaction_name: str,
-    ) -> Dict[str, Any]:
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
         """Process any type of secure transaction with common logic."""
         try:
             secure_id = self._generate_secure_id()
@@ -271,75 +343,131 @@ class SecureService:
             )
 
             response = await self.client._async_request(
-                data=request_data, is_secure=True
+                data=request_data,
+                is_secure=True,
+                deadline=deadline,
+                priority=priority,
             )
 
             # Add secure_id to response first
             response["id"] = secure_id
 
-            # Process 3DS response to add redirect/html fields if needed
+            # Process 3DS response to flag any redirect the browser needs
             response = self._process_3ds_response(response)
 
             # Create and store session data after 3DS processing
             session_data = self._create_session_data(
                 response, request, term_url, transaction_type
             )
-            self._store_session_data(secure_id, session_data)
+            await self._store_session_data(secure_id, session_data)
 
             return response
 
         except Exception as e:
-            _logger.error(f"3D Secure {transaction_name} transaction failed: {e}")
+            _logger.error("3D Secure %s transaction failed: %s", transaction_name, e)
             raise AzulError(
                 f"3D Secure {transaction_name} transaction failed: {e}"
             ) from e
 
-    async def process_sale(self, request: SecureSale) -> Dict[str, Any]:
+    async def process_sale(
+        self,
+        request: SecureSale,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
         """Process a 3D Secure sale transaction."""
-        return await self._process_secure_transaction(request, "Sale", "sale")
+        return await self._process_secure_transaction(
+            request, "Sale", "sale", deadline, priority
+        )
 
-    async def process_token_sale(self, request: SecureTokenSale) -> Dict[str, Any]:
+    async def process_token_sale(
+        self,
+        request: SecureTokenSale,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
         """Process a 3D Secure token sale transaction."""
-        return await self._process_secure_transaction(request, "Sale", "token sale")
+        return await self._process_secure_transaction(
+            request, "Sale", "token sale", deadline, priority
+        )
 
-    async def process_hold(self, request: SecureSale) -> Dict[str, Any]:
+    async def process_hold(
+        self,
+        request: SecureSale,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
         """Process a 3D Secure hold transaction."""
-        return await self._process_secure_transaction(request, "Hold", "hold")
+        return await self._process_secure_transaction(
+            request, "Hold", "hold", deadline, priority
+        )
 
-    async def process_token_hold(self, request: SecureTokenHold) -> Dict[str, Any]:
+    async def process_token_hold(
+        self,
+        request: SecureTokenHold,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
         """Process a 3D Secure token hold transaction."""
-        return await self._process_secure_transaction(request, "Hold", "token hold")
+        return await self._process_secure_transaction(
+            request, "Hold", "token hold", deadline, priority
+        )
 
     async def process_3ds_method(
-        self, azul_order_id: str, method_notification_status: str
-    ) -> Dict[str, Any]:
-        """Process 3DS method notification."""
+        self,
+        azul_order_id: str,
+        method_notification_status: str,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
+        """
+        Process 3DS method notification.
+
+        ACS servers may notify the same method more than once. Duplicates
+        received by this process await the first notification's gateway call
+        and get its result; duplicates claimed by another worker sharing the
+        session store get an ``ALREADY_PROCESSED`` result.
+        """
         try:
-            # Check if already processed
-            if self.processed_methods.get(azul_order_id):
-                return {
+            return await self.method_calls.run(
+                azul_order_id,
+                lambda: self._process_3ds_method_once(
+                    azul_order_id, method_notification_status, deadline, priority
+                ),
+            )
+        except _SessionNotFound:
+            # Raised rather than returned so the flight is not kept: a retry
+            # once the session is stored must reach the gateway
+            return ThreeDSResult(
+                {"ResponseMessage": "SESSION_NOT_FOUND", "AzulOrderId": azul_order_id}
+            )
+        except Exception as e:
+            _logger.error("3DS method processing failed: %s", e)
+            raise AzulError(f"3DS method processing failed: {e}") from e
+
+    async def _process_3ds_method_once(
+        self,
+        azul_order_id: str,
+        method_notification_status: str,
+        deadline: Optional[Deadline],
+        priority: Priority,
+    ) -> ThreeDSResult:
+        """Send the method notification to the gateway, once across workers."""
+        claim = f"3ds-method:{azul_order_id}"
+        taken, _, session_data = await self.session_store.claim_and_get(
+            claim, azul_order_id, ttl=self.METHOD_DEDUP_TTL
+        )
+        if not taken:
+            return ThreeDSResult(
+                {
                     "ResponseMessage": "ALREADY_PROCESSED",
                     "AzulOrderId": azul_order_id,
                 }
-
-            # Mark as processed
-            self.processed_methods[azul_order_id] = True
-
-            # Find session data for this azul_order_id
-            session_data = next(
-                (
-                    session
-                    for session in self.session_store.values()
-                    if session.get("azul_order_id") == azul_order_id
-                ),
-                None,
             )
 
+        try:
             if not session_data:
-                return {
-                    "ResponseMessage": "SESSION_NOT_FOUND",
-                    "AzulOrderId": azul_order_id,
-                }
+                raise _SessionNotFound(azul_order_id)
 
             # Build request data
             data = {
@@ -356,23 +484,30 @@ class SecureService:
                 data["Itbis"] = str(session_data["itbis"])
 
             response = await self.client._async_request(
-                data, operation="processthreedsmethod", is_secure=True
+                data,
+                operation="processthreedsmethod",
+                is_secure=True,
+                deadline=deadline,
+                priority=priority,
             )
 
-            return response
+            return ThreeDSResult.from_dict(response)
 
-        except Exception as e:
-            # Remove processed mark on error
-            self.processed_methods.pop(azul_order_id, None)
-            _logger.error(f"3DS method processing failed: {e}")
-            raise AzulError(f"3DS method processing failed: {e}") from e
+        except BaseException:
+            # Let a retried notification process the method again
+            await self.session_store.release(claim)
+            raise
 
     async def process_challenge(
-        self, session_id: str, challenge_response: str
-    ) -> Dict[str, Any]:
+        self,
+        session_id: str,
+        challenge_response: str,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
         """Process 3DS challenge response."""
         try:
-            session_data = self.get_session_info(session_id)
+            session_data = await self.aget_session_info(session_id)
             if not session_data:
                 raise AzulError(f"No session data found for session_id: {session_id}")
 
@@ -388,13 +523,17 @@ class SecureService:
             }
 
             response = await self.client._async_request(
-                data, operation="processthreedschallenge", is_secure=True
+                data,
+                operation="processthreedschallenge",
+                is_secure=True,
+                deadline=deadline,
+                priority=priority,
             )
 
-            return response
+            return ThreeDSResult.from_dict(response)
 
         except Exception as e:
-            _logger.error(f"3DS challenge processing failed: {e}")
+            _logger.error("3DS challenge processing failed: %s", e)
             raise AzulError(f"3DS challenge processing failed: {e}") from e
 
     async def handle_3ds_callback(
@@ -402,27 +541,30 @@ class SecureService:
         secure_id: str,
         callback_data: Dict[str, Any],
         form_data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
     ) -> Dict[str, Any]:
         """Handle 3DS callbacks - automatically detects and routes to handler."""
         try:
             # Auto-detect callback type based on form data
             if "threeDSMethodData" in form_data:
-                return await self._handle_method_notification(secure_id)
+                return await self._handle_method_notification(secure_id, deadline)
             elif "CRes" in form_data or "cres" in form_data:
                 cres = form_data.get("CRes") or form_data.get("cres")
                 if not cres:
                     raise AzulError("No challenge response found in form data")
-                return await self._handle_challenge_response(secure_id, cres)
+                return await self._handle_challenge_response(secure_id, cres, deadline)
             else:
                 return await self._handle_return_redirect(secure_id)
 
         except Exception as e:
-            _logger.error(f"3DS callback processing failed: {e}")
+            _logger.error("3DS callback processing failed: %s", e)
             raise AzulError(f"3DS callback processing failed: {e}") from e
 
-    async def _handle_method_notification(self, secure_id: str) -> Dict[str, Any]:
+    async def _handle_method_notification(
+        self, secure_id: str, deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
         """Handle 3DS method notification callback."""
-        session_data = self.get_session_info(secure_id)
+        session_data = await self.aget_session_info(secure_id)
         if not session_data:
             raise AzulError(f"No session data found for secure_id: {secure_id}")
 
@@ -430,13 +572,13 @@ class SecureService:
         session_data.pop("method_required", None)
         session_data.pop("method_form", None)
         session_data["status"] = "method_processed"
-        self._store_session_data(secure_id, session_data)
+        await self._store_session_data(secure_id, session_data)
 
         azul_order_id = session_data.get("azul_order_id")
         if not azul_order_id:
             raise AzulError("No AzulOrderId found in session data")
 
-        result = await self.process_3ds_method(azul_order_id, "RECEIVED")
+        result = await self.process_3ds_method(azul_order_id, "RECEIVED", deadline)
 
         # Check if challenge is required after method processing
         if self._check_3ds_challenge_required(result):
@@ -458,7 +600,7 @@ class SecureService:
                         "status": "challenge_required",
                     }
                 )
-                self._store_session_data(secure_id, session_data)
+                await self._store_session_data(secure_id, session_data)
 
                 return {
                     "completed": False,
@@ -469,7 +611,7 @@ class SecureService:
                 }
 
         # Update session with final result
-        status = self._update_session_with_result(secure_id, result)
+        status = await self._update_session_with_result(secure_id, result)
 
         return {
             "completed": status != "processing",
@@ -480,13 +622,15 @@ class SecureService:
         }
 
     async def _handle_challenge_response(
-        self, secure_id: str, cres: str
+        self, secure_id: str, cres: str, deadline: Optional[Deadline] = None
     ) -> Dict[str, Any]:
         """Handle 3DS challenge response callback."""
-        result = await self.process_challenge(secure_id, cres)
+        result = await self.process_challenge(secure_id, cres, deadline)
 
         # Update session with final result
-        status = self._update_session_with_result(secure_id, result, is_final=True)
+        status = await self._update_session_with_result(
+            secure_id, result, is_final=True
+        )
 
         return {
             "completed": True,
@@ -498,7 +642,7 @@ class SecureService:
 
     async def _handle_return_redirect(self, secure_id: str) -> Dict[str, Any]:
         """Handle return redirect without specific form data."""
-        session_data = self.get_session_info(secure_id)
+        session_data = await self.aget_session_info(secure_id)
         if not session_data:
             raise AzulError(f"No session data found for secure_id: {secure_id}")
 
@@ -6,13 +6,16 @@ including sales, holds, refunds, voids, and post-authorization captures.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Optional
 
 from ..api.client import AzulAPI
+from ..api.constants import Priority
+from ..api.timeouts import Deadline
 from ..core.config import AzulSettings
 from ..core.exceptions import AzulError
 from ..models.datavault import TokenSale
 from ..models.payment import Hold, Post, Refund, Sale, Void
+from ..models.results import TransactionResult
 from ..models.verification import VerifyTransaction
 
 _logger = logging.getLogger(__name__)
@@ -26,177 +29,241 @@ class TransactionService:
         self.client = client
         self.settings = settings
 
-    async def process_sale(self, transaction: Sale) -> Dict[str, Any]:
+    async def process_sale(
+        self,
+        transaction: Sale,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
         """
         Process a sale transaction.
 
         Args:
             transaction: Sale transaction model
+            deadline: Optional absolute deadline for the request
+            priority: Traffic class of the request
 
         Returns:
-            API response dict
+            Transaction result (dict-compatible)
 
         Raises:
             AzulError: If transaction processing fails
         """
         try:
-            _logger.info("Processing sale transaction")
+            _logger.debug("Processing sale transaction")
             response = await self.client.post(
                 "/webservices/JSON/default.aspx",
-                transaction.model_dump(exclude_none=True),
+                transaction,
+                deadline=deadline,
+                priority=priority,
             )
             _logger.info("Sale transaction processed successfully")
-            return response
+            return TransactionResult.from_dict(response)
         except Exception as e:
-            _logger.error(f"Sale transaction failed: {e}")
+            _logger.error("Sale transaction failed: %s", e)
             raise AzulError(f"Sale transaction failed: {e}") from e
 
-    async def process_hold(self, transaction: Hold) -> Dict[str, Any]:
+    async def process_hold(
+        self,
+        transaction: Hold,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
         """
         Process a hold (pre-authorization) transaction.
 
         Args:
             transaction: Hold transaction model
+            deadline: Optional absolute deadline for the request
+            priority: Traffic class of the request
 
         Returns:
-            API response dict
+            Transaction result (dict-compatible)
 
         Raises:
             AzulError: If transaction processing fails
         """
         try:
-            _logger.info("Processing hold transaction")
+            _logger.debug("Processing hold transaction")
             response = await self.client.post(
                 "/webservices/JSON/default.aspx",
-                transaction.model_dump(exclude_none=True),
+                transaction,
+                deadline=deadline,
+                priority=priority,
             )
             _logger.info("Hold transaction processed successfully")
-            return response
+            return TransactionResult.from_dict(response)
         except Exception as e:
-            _logger.error(f"Hold transaction failed: {e}")
+            _logger.error("Hold transaction failed: %s", e)
             raise AzulError(f"Hold transaction failed: {e}") from e
 
-    async def process_refund(self, transaction: Refund) -> Dict[str, Any]:
+    async def process_refund(
+        self,
+        transaction: Refund,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
         """
         Process a refund transaction.
 
         Args:
             transaction: Refund transaction model
+            deadline: Optional absolute deadline for the request
+            priority: Traffic class of the request
 
         Returns:
-            API response dict
+            Transaction result (dict-compatible)
 
         Raises:
             AzulError: If transaction processing fails
         """
         try:
-            _logger.info("Processing refund transaction")
+            _logger.debug("Processing refund transaction")
             response = await self.client.post(
                 "/webservices/JSON/default.aspx",
-                transaction.model_dump(exclude_none=True),
+                transaction,
+                deadline=deadline,
+                priority=priority,
             )
             _logger.info("Refund transaction processed successfully")
-            return response
+            return TransactionResult.from_dict(response)
         except Exception as e:
-            _logger.error(f"Refund transaction failed: {e}")
+            _logger.error("Refund transaction failed: %s", e)
             raise AzulError(f"Refund transaction failed: {e}") from e
 
-    async def process_void(self, transaction: Void) -> Dict[str, Any]:
+    async def process_void(
+        self,
+        transaction: Void,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
         """
         Process a void transaction.
 
         Args:
             transaction: Void transaction model
+            deadline: Optional absolute deadline for the request
+            priority: Traffic class of the request
 
         Returns:
-            API response dict
+            Transaction result (dict-compatible)
 
         Raises:
             AzulError: If transaction processing fails
         """
         try:
-            _logger.info("Processing void transaction")
+            _logger.debug("Processing void transaction")
             response = await self.client.post(
                 "/webservices/JSON/default.aspx?ProcessVoid",
-                transaction.model_dump(exclude_none=True),
+                transaction,
+                deadline=deadline,
+                priority=priority,
             )
             _logger.info("Void transaction processed successfully")
-            return response
+            return TransactionResult.from_dict(response)
         except Exception as e:
-            _logger.error(f"Void transaction failed: {e}")
+            _logger.error("Void transaction failed: %s", e)
             raise AzulError(f"Void transaction failed: {e}") from e
 
-    async def process_post(self, transaction: Post) -> Dict[str, Any]:
+    async def process_post(
+        self,
+        transaction: Post,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
         """
         Process a post-authorization (capture) transaction.
 
         Args:
             transaction: Post transaction model
+            deadline: Optional absolute deadline for the request
+            priority: Traffic class of the request
 
         Returns:
-            API response dict
+            Transaction result (dict-compatible)
 
         Raises:
             AzulError: If transaction processing fails
         """
         try:
-            _logger.info("Processing post transaction")
+            _logger.debug("Processing post transaction")
             response = await self.client.post(
                 "/webservices/JSON/default.aspx?ProcessPost",
-                transaction.model_dump(exclude_none=True),
+                transaction,
+                deadline=deadline,
+                priority=priority,
             )
             _logger.info("Post transaction processed successfully")
-            return response
+            return TransactionResult.from_dict(response)
         except Exception as e:
-            _logger.error(f"Post transaction failed: {e}")
+            _logger.error("Post transaction failed: %s", e)
             raise AzulError(f"Post transaction failed: {e}") from e
 
-    async def process_token_sale(self, transaction: TokenSale) -> Dict[str, Any]:
+    async def process_token_sale(
+        self,
+        transaction: TokenSale,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
         """
         Process a sale transaction using a DataVault token.
 
         Args:
             transaction: Token sale transaction model
+            deadline: Optional absolute deadline for the request
+            priority: Traffic class of the request
 
         Returns:
-            API response dict
+            Transaction result (dict-compatible)
 
         Raises:
             AzulError: If transaction processing fails
         """
         try:
-            _logger.info("Processing token sale transaction")
+            _logger.debug("Processing token sale transaction")
             response = await self.client.post(
                 "/webservices/JSON/default.aspx",
-                transaction.model_dump(exclude_none=True),
+                transaction,
+                deadline=deadline,
+                priority=priority,
             )
             _logger.info("Token sale transaction processed successfully")
-            return response
+            return TransactionResult.from_dict(response)
         except Exception as e:
-            _logger.error(f"Token sale transaction failed: {e}")
+            _logger.error("Token sale transaction failed: %s", e)
             raise AzulError(f"Token sale transaction failed: {e}") from e
 
-    async def verify_payment(self, verification: VerifyTransaction) -> Dict[str, Any]:
+    async def verify_payment(
+        self,
+        verification: VerifyTransaction,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
         """
         Verify an existing payment transaction.
 
         Args:
             verification: Transaction verification model
+            deadline: Optional absolute deadline for the request
+            priority: Traffic class of the request
 
         Returns:
-            API response dict
+            Transaction result (dict-compatible)
 
         Raises:
             AzulError: If verification fails
         """
         try:
-            _logger.info("Verifying payment transaction")
+            _logger.debug("Verifying payment transaction")
             response = await self.client.post(
                 "/webservices/JSON/default.aspx?VerifyPayment",
-                verification.model_dump(exclude_none=True),
+                verification,
+                hedge=True,
+                deadline=deadline,
+                priority=priority,
             )
             _logger.info("Payment verification completed successfully")
-            return response
+            return TransactionResult.from_dict(response)
         except Exception as e:
-            _logger.error(f"Payment verification failed: {e}")
+            _logger.error("Payment verification failed: %s", e)
             raise AzulError(f"Payment verification failed: {e}") from e
@@ -0,0 +1,514 @@
+"""
+Synchronous facade for PyAzul.
+
+`PyAzulSync` runs one event loop in a background thread and keeps a single
+`PyAzul` client, with its connection pools, open on it. Every synchronous call
+is handed to that loop with `asyncio.run_coroutine_threadsafe`, so threads of a
+synchronous application (Django, Celery, scripts) share warm connections and
+their requests run concurrently, without creating an event loop per call.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+from concurrent.futures import Future
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+import httpx
+
+from .api.constants import Priority
+from .api.timeouts import Deadline, TimeoutProfile
+from .core.config import AzulSettings
+from .core.exceptions import AzulError
+from .core.fork import register_after_fork
+from .core.sessions import ThreeDSSessionStore
+from .index import PyAzul
+from .models.datavault import TokenResponse
+from .models.results import ThreeDSResult, TransactionResult
+from .services.batch import BatchOperation, BatchResult, BatchStats, OperationLike
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Coroutine methods of `PyAzul` that can be submitted by name
+_SUBMITTABLE = frozenset(
+    {
+        "sale",
+        "hold",
+        "refund",
+        "void",
+        "post_auth",
+        "verify_transaction",
+        "token_sale",
+        "create_token",
+        "delete_token",
+        "secure_sale",
+        "secure_token_sale",
+        "secure_hold",
+        "secure_token_hold",
+        "process_3ds_method",
+        "process_challenge",
+        "handle_3ds_callback",
+    }
+)
+# Submittable methods taking a ``priority``, which `submit_many` passes on
+_PRIORITIZED = frozenset(
+    name
+    for name in _SUBMITTABLE
+    if "priority" in inspect.signature(getattr(PyAzul, name)).parameters
+)
+
+
+def _log_background_failure(future: "Future[Any]") -> None:
+    """Log a failure of the background start, which nobody waits for."""
+    if not future.cancelled() and future.exception() is not None:
+        _logger.error("Starting PyAzul background tasks failed: %s", future.exception())
+
+
+class PyAzulSync:
+    """
+    Synchronous client for the Azul Payment Gateway.
+
+    Mirrors the `PyAzul` methods and is safe to share between threads.
+
+    Example:
+        >>> from pyazul import PyAzulSync
+        >>> with PyAzulSync() as azul:
+        ...     response = azul.sale({...})
+        ...     futures = azul.submit_many([("refund", {...}), ("void", {...})])
+        ...     results = [future.result() for future in futures]
+    """
+
+    def __init__(
+        self,
+        settings: Optional[AzulSettings] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        timeout_profiles: Optional[Mapping[str, TimeoutProfile]] = None,
+        thread_name: str = "pyazul-loop",
+        session_store: Optional[ThreeDSSessionStore] = None,
+    ):
+        """
+        Start the event loop thread and build the client on it.
+
+        Args:
+            settings: Optional custom settings. If not provided,
+                     environment variables will be used.
+            transport: Optional `httpx` transport for the internal client.
+            timeout_profiles: Optional timeouts per operation name.
+            thread_name: Name of the event loop thread.
+            session_store: Optional store of 3DS sessions; see `PyAzul`.
+        """
+        self._thread_name = thread_name
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._start_loop()
+        try:
+            self.client: PyAzul = self._call(
+                self._build(settings, transport, timeout_profiles, session_store)
+            )
+        except BaseException:
+            self._closed = True
+            self._stop_loop()
+            raise
+        register_after_fork(self)
+        self._start_background()
+
+    @property
+    def settings(self) -> AzulSettings:
+        """Settings of the underlying client."""
+        return self.client.settings
+
+    @property
+    def closed(self) -> bool:
+        """Whether `close()` has been called."""
+        return self._closed
+
+    # --- Event loop plumbing ---
+
+    def _start_loop(self) -> None:
+        """Create the event loop and start its thread."""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name=self._thread_name, daemon=True
+        )
+        self._thread.start()
+
+    def _after_fork(self) -> None:
+        """Restart the event loop thread, which does not survive a fork.
+
+        The client's pools were reset for the child; warm connections and
+        background tasks are started again.
+        """
+        self._close_lock = threading.Lock()
+        if self._closed:
+            return
+        self._start_loop()
+        self._start_background()
+
+    def _start_background(self) -> None:
+        """Start the client's configured warmup, keep-alive and watcher.
+
+        Not waited for, so neither construction nor a fork blocks on network.
+        """
+        self._submit(self.client.__aenter__()).add_done_callback(
+            _log_background_failure
+        )
+
+    def _run_loop(self) -> None:
+        """Run the event loop until `close()` stops it."""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @staticmethod
+    async def _build(
+        settings: Optional[AzulSettings],
+        transport: Optional[httpx.AsyncBaseTransport],
+        timeout_profiles: Optional[Mapping[str, TimeoutProfile]],
+        session_store: Optional[ThreeDSSessionStore],
+    ) -> PyAzul:
+        """Build the client on the loop, so its primitives bind to it."""
+        return PyAzul(
+            settings,
+            transport=transport,
+            timeout_profiles=timeout_profiles,
+            session_store=session_store,
+        )
+
+    def _submit(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        """Schedule a coroutine on the loop thread."""
+        if self._closed:
+            coro.close()
+            raise AzulError("PyAzulSync client is closed")
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise AzulError(
+                "PyAzulSync cannot be called from its own event loop; "
+                "await the PyAzul client instead"
+            )
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _call(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop thread and wait for its result."""
+        return self._submit(coro).result()
+
+    # --- Concurrency helpers ---
+
+    def submit(self, method: str, *args: Any, **kwargs: Any) -> "Future[Any]":
+        """
+        Start a call without waiting for it.
+
+        Args:
+            method: Name of a `PyAzul` coroutine method, e.g. ``"refund"``.
+            *args: Positional arguments of the method.
+            **kwargs: Keyword arguments of the method.
+
+        Returns:
+            Future resolving to the response, or raising the call's error.
+        """
+        if method not in _SUBMITTABLE:
+            raise AzulError(f"Unsupported operation: {method}")
+        return self._submit(getattr(self.client, method)(*args, **kwargs))
+
+    def submit_many(
+        self,
+        operations: Iterable[OperationLike],
+        priority: Priority = Priority.BACKGROUND,
+    ) -> List["Future[Any]"]:
+        """
+        Start many calls at once, one future per operation.
+
+        The merchant rate limits and the connection pool still bound how many
+        run at the same time; use `run_batch` for an explicit concurrency.
+
+        Args:
+            operations: `BatchOperation` or ``(kind, data)`` pairs, as accepted
+                by `PyAzul.run_batch`.
+            priority: Traffic class of the calls; background by default.
+                Not passed to operations without one, such as
+                ``handle_3ds_callback``.
+
+        Returns:
+            Futures in the order of `operations`.
+        """
+        futures = []
+        for operation in operations:
+            if not isinstance(operation, BatchOperation):
+                operation = BatchOperation(*operation)
+            options = {"priority": priority} if operation.kind in _PRIORITIZED else {}
+            futures.append(self.submit(operation.kind, operation.data, **options))
+        return futures
+
+    def run_batch(
+        self,
+        operations: Iterable[OperationLike],
+        concurrency: int = 10,
+        on_progress: Optional[Callable[[BatchStats], None]] = None,
+        priority: Priority = Priority.BACKGROUND,
+    ) -> "Future[List[BatchResult]]":
+        """
+        Run a batch in the background (see `PyAzul.run_batch`).
+
+        `on_progress` is called from the event loop thread.
+
+        Returns:
+            Future resolving to every `BatchResult`, in completion order.
+        """
+        runner = self.client.run_batch(operations, concurrency, on_progress, priority)
+
+        async def collect() -> List[BatchResult]:
+            return [result async for result in runner]
+
+        return self._submit(collect())
+
+    # --- Lifecycle ---
+
+    def preload(self) -> "PyAzulSync":
+        """Load certificates now, before forking (see `PyAzul.preload`)."""
+        self.client.preload()
+        return self
+
+    def warmup(self, connections: Optional[int] = None) -> int:
+        """Pre-connect the pool to the primary and alternate hosts."""
+        return self._call(self.client.warmup(connections))
+
+    def reload(self, settings: Optional[AzulSettings] = None) -> None:
+        """Apply rotated certificates and credentials (see `PyAzul.reload`)."""
+        self._call(self.client.reload(settings))
+
+    def close(self) -> None:
+        """Close the connection pools and stop the event loop thread."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        finally:
+            self._stop_loop()
+
+    def _stop_loop(self) -> None:
+        """Stop the event loop and wait for its thread to exit."""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _shutdown(self) -> None:
+        """Close the client and cancel whatever is still running."""
+        await self.client.aclose()
+        current = asyncio.current_task()
+        pending = [task for task in asyncio.all_tasks() if task is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def __enter__(self) -> "PyAzulSync":
+        """Enter the context, returning this client."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the client on context exit."""
+        self.close()
+
+    # --- Transactions ---
+
+    def sale(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
+        """Process a direct card payment."""
+        return self._call(self.client.sale(data, deadline, priority))
+
+    def hold(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
+        """Perform a hold on a card (pre-authorization)."""
+        return self._call(self.client.hold(data, deadline, priority))
+
+    def refund(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
+        """Process a refund for a previous transaction."""
+        return self._call(self.client.refund(data, deadline, priority))
+
+    def void(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
+        """Void a previous transaction."""
+        return self._call(self.client.void(data, deadline, priority))
+
+    def post_auth(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
+        """Capture a previously held amount (post-authorization)."""
+        return self._call(self.client.post_auth(data, deadline, priority))
+
+    def verify_transaction(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
+        """Verify the status of a transaction."""
+        return self._call(self.client.verify_transaction(data, deadline, priority))
+
+    def token_sale(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TransactionResult:
+        """Process a sale using a token (without 3DS)."""
+        return self._call(self.client.token_sale(data, deadline, priority))
+
+    # --- DataVault ---
+
+    def create_token(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TokenResponse:
+        """Create a card token in DataVault."""
+        return self._call(self.client.create_token(data, deadline, priority))
+
+    def delete_token(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> TokenResponse:
+        """Delete a token from DataVault."""
+        return self._call(self.client.delete_token(data, deadline, priority))
+
+    # --- Payment Page ---
+
+    def payment_page(self, data: Dict[str, Any]) -> str:
+        """Generate HTML for Azul's hosted payment page."""
+        return self.client.payment_page(data)
+
+    # --- Secure Methods (3D Secure) ---
+
+    def secure_sale(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
+        """Process a card payment using 3D Secure authentication."""
+        return self._call(self.client.secure_sale(data, deadline, priority))
+
+    def secure_token_sale(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
+        """Process a tokenized card payment using 3D Secure authentication."""
+        return self._call(self.client.secure_token_sale(data, deadline, priority))
+
+    def secure_hold(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
+        """Perform a hold on a card (pre-authorization) with 3D Secure."""
+        return self._call(self.client.secure_hold(data, deadline, priority))
+
+    def secure_token_hold(
+        self,
+        data: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
+        """Perform a hold on a saved token (pre-authorization) with 3D Secure."""
+        return self._call(self.client.secure_token_hold(data, deadline, priority))
+
+    def process_3ds_method(
+        self,
+        azul_order_id: str,
+        method_notification_status: str,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
+        """Process the 3DS method notification received from ACS."""
+        return self._call(
+            self.client.process_3ds_method(
+                azul_order_id, method_notification_status, deadline, priority
+            )
+        )
+
+    def process_challenge(
+        self,
+        session_id: str,
+        challenge_response: str,
+        deadline: Optional[Deadline] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> ThreeDSResult:
+        """Process the 3DS challenge response received from ACS."""
+        return self._call(
+            self.client.process_challenge(
+                session_id, challenge_response, deadline, priority
+            )
+        )
+
+    def handle_3ds_callback(
+        self,
+        secure_id: str,
+        callback_data: Optional[Dict[str, Any]] = None,
+        form_data: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
+        """Handle 3DS callbacks (see `PyAzul.handle_3ds_callback`)."""
+        return self._call(
+            self.client.handle_3ds_callback(
+                secure_id, callback_data, form_data, deadline
+            )
+        )
+
+    def get_session_info(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve information about an active 3DS session."""
+        return self._call(self.client.get_session_info(session_id))
+
+    def find_session(self, value: str, field: str = "azul_order_id") -> Optional[str]:
+        """Find the ``secure_id`` of an active 3DS session."""
+        return self._call(self.client.find_session(value, field))
+
+    def create_challenge_form(
+        self, creq: str, term_url: str, redirect_post_url: str
+    ) -> str:
+        """Create an HTML form for the 3DS challenge redirect."""
+        return self.client.create_challenge_form(creq, term_url, redirect_post_url)
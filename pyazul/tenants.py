@@ -0,0 +1,215 @@
+"""
+Multi-tenant client registry.
+
+Processes serving many merchants need one set of credentials per merchant, but
+not one SSL context and connection pool each. `TenantRegistry` keeps the
+settings of every tenant and builds lightweight `PyAzul` clients for them on
+demand, in an LRU bounded by ``max_tenants``. All tenants using the same
+certificate share one SSL context and one set of connection pools, so memory
+and connection count stay flat as tenants grow.
+
+Registered settings are the only copy of a tenant's credentials, so they are
+not evicted: they are kept until `TenantRegistry.unregister`. Platforms with
+an unbounded or churning set of merchants should provide a ``loader`` instead,
+whose settings are only held by the built client and leave with it.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional, Set, Union
+
+import httpx
+
+from .api.reload import ClientGeneration
+from .api.timeouts import TimeoutProfile
+from .core.certificates import certificate_fingerprint
+from .core.config import AzulSettings, get_azul_settings
+from .core.exceptions import AzulError
+from .core.fork import register_after_fork
+from .core.sessions import InMemorySessionStore, ThreeDSSessionStore
+from .index import PyAzul
+
+_logger = logging.getLogger(__name__)
+
+TenantSettings = Union[AzulSettings, Mapping[str, Any]]
+
+
+class TenantRegistry:
+    """
+    Route requests of many merchants through shared connection pools.
+
+    Example:
+        >>> tenants = TenantRegistry(max_tenants=500)
+        >>> tenants.register("shop-1", {"MERCHANT_ID": "...", "AUTH1": "...",
+        ...                             "AUTH2": "..."})
+        >>> response = await tenants.get("shop-1").sale({...})
+    """
+
+    def __init__(
+        self,
+        settings: Optional[AzulSettings] = None,
+        max_tenants: int = 256,
+        loader: Optional[Callable[[str], TenantSettings]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        timeout_profiles: Optional[Mapping[str, TimeoutProfile]] = None,
+        session_store: Optional[ThreeDSSessionStore] = None,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            settings: Base settings every tenant inherits (environment, URLs,
+                pool sizes, default certificate). Defaults to the environment.
+            max_tenants: Maximum number of tenant clients kept built; the least
+                recently used one is released beyond that.
+            loader: Optional callable returning the settings (or overrides) of
+                a tenant that was not registered, e.g. from a database.
+            transport: Optional `httpx` transport for the shared pools.
+            timeout_profiles: Optional timeouts per operation name.
+            session_store: Optional store of 3DS sessions shared by every
+                tenant; it is not closed by `aclose()`. Defaults to one
+                in-memory store, so a flow survives the release of its tenant.
+        """
+        if max_tenants < 1:
+            raise ValueError("max_tenants must be at least 1")
+        self.settings = settings or get_azul_settings()
+        self.max_tenants = max_tenants
+        self.loader = loader
+        self._transport = transport
+        self._timeout_profiles = timeout_profiles
+        self._owns_session_store = session_store is None
+        if session_store is None:
+            session_store = InMemorySessionStore(
+                max_sessions=self.settings.THREEDS_MAX_SESSIONS,
+                ttl=self.settings.THREEDS_SESSION_TTL,
+            )
+        self.session_store = session_store
+        self._tenants: Dict[str, AzulSettings] = {}
+        self._clients: "OrderedDict[str, PyAzul]" = OrderedDict()
+        self.pools: Dict[str, ClientGeneration] = {}
+        self._closing: Set["asyncio.Task[None]"] = set()
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Forget closing tasks of the parent; pools reset themselves."""
+        self._closing = set()
+
+    def register(self, tenant_id: str, settings: TenantSettings) -> None:
+        """
+        Register (or replace) the settings of a tenant.
+
+        The settings are kept until `unregister`, whatever ``max_tenants``.
+
+        Args:
+            tenant_id: Identifier requests are routed by.
+            settings: Full settings, or overrides of the base settings such as
+                ``MERCHANT_ID``, ``AUTH1``, ``AUTH2``, ``AZUL_CERT``/``AZUL_KEY``.
+        """
+        self._tenants[tenant_id] = self._resolve(settings)
+        self._release(tenant_id)
+
+    def unregister(self, tenant_id: str) -> None:
+        """Forget a tenant and release its client."""
+        self._tenants.pop(tenant_id, None)
+        self._release(tenant_id)
+
+    def get(self, tenant_id: str) -> PyAzul:
+        """
+        Return the client of a tenant, building it if needed.
+
+        Raises:
+            AzulError: If the tenant is unknown.
+        """
+        client = self._clients.get(tenant_id)
+        if client is not None:
+            self._clients.move_to_end(tenant_id)
+            return client
+
+        settings = self._tenants.get(tenant_id)
+        if settings is None:
+            if self.loader is None:
+                raise AzulError(f"Unknown tenant: {tenant_id}")
+            settings = self._resolve(self.loader(tenant_id))
+
+        client = self._clients[tenant_id] = PyAzul(
+            settings,
+            transport=self._transport,
+            timeout_profiles=self._timeout_profiles,
+            shared_pools=self._pools_for(settings),
+            session_store=self.session_store,
+        )
+        while len(self._clients) > self.max_tenants:
+            evicted_id, evicted = self._clients.popitem(last=False)
+            _logger.debug("Releasing least recently used tenant %s", evicted_id)
+            self._release_client(evicted)
+        return client
+
+    __getitem__ = get
+
+    def __contains__(self, tenant_id: object) -> bool:
+        """Whether a tenant is registered or currently built."""
+        return tenant_id in self._tenants or tenant_id in self._clients
+
+    def __len__(self) -> int:
+        """Return the number of tenant clients currently built."""
+        return len(self._clients)
+
+    async def aclose(self) -> None:
+        """Release every tenant client and close the shared pools and store."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+        pools, self.pools = self.pools, {}
+        for pool in pools.values():
+            await pool.aclose()
+        if self._owns_session_store:
+            await self.session_store.aclose()
+
+    async def __aenter__(self) -> "TenantRegistry":
+        """Enter the async context, returning this registry."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the registry on context exit."""
+        await self.aclose()
+
+    def _resolve(self, settings: TenantSettings) -> AzulSettings:
+        """Return full settings for a tenant, validating its overrides."""
+        if isinstance(settings, AzulSettings):
+            return settings
+        return type(self.settings).model_validate(
+            {**self.settings.model_dump(), **settings}
+        )
+
+    def _pools_for(self, settings: AzulSettings) -> ClientGeneration:
+        """Return the pools shared by every tenant using this certificate."""
+        identity = certificate_fingerprint(
+            settings.AZUL_CERT or "", settings.AZUL_KEY or ""
+        )
+        pools = self.pools.get(identity)
+        if pools is None:
+            pools = self.pools[identity] = ClientGeneration(settings)
+        return pools
+
+    def _release(self, tenant_id: str) -> None:
+        """Release the client of a tenant, if built."""
+        client = self._clients.pop(tenant_id, None)
+        if client is not None:
+            self._release_client(client)
+
+    def _release_client(self, client: PyAzul) -> None:
+        """Stop the background work of a released client.
+
+        Its requests keep running: the pools it used are shared and stay open.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # No loop, so no background probes to stop
+            return
+        task = loop.create_task(client.aclose())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
@@ -0,0 +1,56 @@
+"""Fixtures for AzulAPI unit tests."""
+
+import ssl
+from typing import Callable
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from pyazul.api.client import AzulAPI
+from pyazul.core.config import AzulSettings
+
+APPROVED_RESPONSE = {
+    "ResponseCode": "ISO8583",
+    "IsoCode": "00",
+    "ResponseMessage": "APROBADA",
+    "AzulOrderId": "44444",
+}
+
+
+@pytest.fixture
+def api_settings() -> AzulSettings:
+    """Return real AzulSettings populated with dummy credentials."""
+    return AzulSettings(
+        AUTH1="test_auth1",
+        AUTH2="test_auth2",
+        MERCHANT_ID="39038540035",
+        AZUL_CERT="dummy_cert.pem",
+        AZUL_KEY="dummy_key.key",
+        ENVIRONMENT="dev",
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_certificates():
+    """Skip real certificate loading for AzulAPI unit tests."""
+    with patch.object(
+        AzulAPI, "_load_certificates", return_value=ssl.create_default_context()
+    ):
+        yield
+
+
+@pytest.fixture
+def make_api(api_settings) -> Callable[..., AzulAPI]:
+    """Return a factory building an AzulAPI backed by an httpx.MockTransport."""
+
+    def factory(handler=None, settings=None, **kwargs) -> AzulAPI:
+        if handler is None:
+
+            def handler(request: httpx.Request) -> httpx.Response:
+                return httpx.Response(200, json=APPROVED_RESPONSE)
+
+        kwargs.setdefault("transport", httpx.MockTransport(handler))
+        return AzulAPI(settings=settings or api_settings, **kwargs)
+
+    return factory
@@ -0,0 +1,552 @@
+"""Unit tests for the AzulAPI HTTP client."""
+
+import asyncio
+import json
+import logging
+import time
+
+import httpx
+import pytest
+
+from pyazul.api.client import AzulAPI
+from pyazul.api.constants import Priority
+from pyazul.api.timeouts import Deadline, TimeoutProfile
+from pyazul.core.exceptions import (
+    APIError,
+    DeadlineExceededError,
+    NoHealthyEndpointError,
+)
+from pyazul.models.payment import Void
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused_across_requests(make_api):
+    """Test that consecutive requests share a single pooled client."""
+    api = make_api()
+
+    await api.post("/webservices/JSON/default.aspx", {"Amount": "100"})
+    first_client = api._get_client()
+    await api.post("/webservices/JSON/default.aspx?ProcessVoid", {"Amount": "100"})
+
+    assert api._get_client() is first_client
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_limits_come_from_settings(make_api, api_settings):
+    """Test that pool limits and keep-alive expiry are read from settings."""
+    api_settings.HTTP_MAX_CONNECTIONS = 7
+    api_settings.HTTP_KEEPALIVE_EXPIRY = 12.5
+    api = make_api(settings=api_settings)
+
+    assert api.limits.max_connections == 7
+    assert api.limits.keepalive_expiry == 12.5
+
+
+@pytest.mark.asyncio
+async def test_context_manager_closes_owned_client(make_api):
+    """Test that leaving the context releases the internally created client."""
+    async with make_api() as api:
+        await api.post("/webservices/JSON/default.aspx", {"Amount": "100"})
+        assert not api.is_closed
+
+    assert api.is_closed
+    # A closed client is transparently rebuilt on the next request.
+    await api.post("/webservices/JSON/default.aspx", {"Amount": "100"})
+    assert not api.is_closed
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_injected_client_is_used_and_left_open(api_settings):
+    """Test that an injected client is used for requests but never closed."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"IsoCode": "00"})
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    api = AzulAPI(settings=api_settings, http_client=http_client)
+
+    await api.post("/webservices/JSON/default.aspx", {"Amount": "100"})
+    await api.aclose()
+
+    assert len(seen) == 1
+    assert seen[0].headers["Auth1"] == "test_auth1"
+    assert not http_client.is_closed
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_closed_injected_client_raises(api_settings):
+    """Test that a closed injected client is reported instead of replaced."""
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    )
+    await http_client.aclose()
+    api = AzulAPI(settings=api_settings, http_client=http_client)
+
+    with pytest.raises(APIError, match="has been closed"):
+        await api.post("/webservices/JSON/default.aspx", {"Amount": "100"})
+
+
+@pytest.fixture
+def prod_settings(api_settings):
+    """Return production settings with hedging enabled and a short delay."""
+    api_settings.ENVIRONMENT = "prod"
+    api_settings.HEDGE_REQUESTS = True
+    api_settings.HEDGE_DEFAULT_DELAY = 0.01
+    return api_settings
+
+
+def _host_handler(delays, calls):
+    """Build a handler that answers per host after the configured delay."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.host)
+        await asyncio.sleep(delays.get(request.url.host, 0))
+        return httpx.Response(200, json={"IsoCode": "00", "Host": request.url.host})
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_uses_first_answer(make_api, prod_settings):
+    """Test that a slow primary is raced by the alternate and the loser dropped."""
+    calls = []
+    handler = _host_handler({"pagos.azul.com.do": 5}, calls)
+    api = make_api(handler, settings=prod_settings)
+
+    response = await api.post(
+        "/webservices/JSON/default.aspx?VerifyPayment", {"a": 1}, hedge=True
+    )
+
+    assert response["Host"] == "contpagos.azul.com.do"
+    assert calls == ["pagos.azul.com.do", "contpagos.azul.com.do"]
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged(make_api, prod_settings):
+    """Test that no hedge is sent when the primary answers within the delay."""
+    calls = []
+    prod_settings.HEDGE_DEFAULT_DELAY = 1.0
+    api = make_api(_host_handler({}, calls), settings=prod_settings)
+
+    response = await api.post(
+        "/webservices/JSON/default.aspx?VerifyPayment", {"a": 1}, hedge=True
+    )
+
+    assert response["Host"] == "pagos.azul.com.do"
+    assert calls == ["pagos.azul.com.do"]
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_client_error_on_primary_is_not_hedged(make_api, prod_settings):
+    """Test that an early failure another endpoint would repeat is not hedged."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.host)
+        return httpx.Response(400, text="Bad request")
+
+    prod_settings.HEDGE_DEFAULT_DELAY = 1.0
+    api = make_api(handler, settings=prod_settings)
+
+    with pytest.raises(APIError, match="HTTP 400"):
+        await api.post(
+            "/webservices/JSON/default.aspx?VerifyPayment", {"a": 1}, hedge=True
+        )
+
+    assert calls == ["pagos.azul.com.do"]
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_primary_is_hedged_at_once(make_api, prod_settings):
+    """Test that a transport failure sends the copy without waiting the delay."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.host)
+        if request.url.host == "pagos.azul.com.do":
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"IsoCode": "00", "Host": request.url.host})
+
+    prod_settings.HEDGE_DEFAULT_DELAY = 1.0
+    api = make_api(handler, settings=prod_settings)
+
+    started = time.monotonic()
+    response = await api.post(
+        "/webservices/JSON/default.aspx?VerifyPayment", {"a": 1}, hedge=True
+    )
+
+    assert response["Host"] == "contpagos.azul.com.do"
+    assert time.monotonic() - started < 0.5
+    assert calls == ["pagos.azul.com.do", "contpagos.azul.com.do"]
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_gateway_error_fails_over_without_hedging(make_api, prod_settings):
+    """Test that an SGS error on the primary is retried on the alternate."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.host)
+        if request.url.host == "pagos.azul.com.do":
+            return httpx.Response(
+                200, json={"ErrorDescription": "SGS-050001: Server Unavailable"}
+            )
+        return httpx.Response(200, json={"IsoCode": "00", "Host": request.url.host})
+
+    api = make_api(handler, settings=prod_settings)
+
+    response = await api.post("/webservices/JSON/default.aspx", {"a": 1})
+
+    assert response["Host"] == "contpagos.azul.com.do"
+    assert calls == ["pagos.azul.com.do", "contpagos.azul.com.do"]
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, hosts", [(400, 1), (502, 2)])
+async def test_failover_follows_retry_safe_rule(make_api, prod_settings, status, hosts):
+    """Test that client errors are not retried but server errors are."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.host)
+        return httpx.Response(status, text="error")
+
+    api = make_api(handler, settings=prod_settings)
+
+    with pytest.raises(APIError, match=f"HTTP {status}"):
+        await api.post("/webservices/JSON/default.aspx", {"a": 1})
+
+    assert len(calls) == hosts
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_hedging_requires_opt_in(make_api, prod_settings):
+    """Test that non-idempotent requests are never hedged."""
+    calls = []
+    handler = _host_handler({"pagos.azul.com.do": 0.05}, calls)
+    api = make_api(handler, settings=prod_settings)
+
+    await api.post("/webservices/JSON/default.aspx", {"a": 1})
+
+    assert calls == ["pagos.azul.com.do"]
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_hedge_delay_tracks_observed_latency(make_api, prod_settings):
+    """Test that the hedge delay follows the primary's latency percentile."""
+    prod_settings.HEDGE_MIN_SAMPLES = 3
+    api = make_api(settings=prod_settings)
+    endpoint = api._build_endpoint("VerifyPayment")
+    assert api._hedge_delay(endpoint, "VerifyPayment") == (
+        prod_settings.HEDGE_DEFAULT_DELAY
+    )
+
+    for seconds in (0.1, 0.2, 0.3):
+        api._latency_window(endpoint, "VerifyPayment").record(seconds)
+
+    assert api._hedge_delay(endpoint, "VerifyPayment") == 0.3
+    # Slow operations on the same endpoint do not stretch the delay of others
+    for seconds in (2.0, 3.0, 4.0):
+        api._latency_window(endpoint, "ProcessDatavault").record(seconds)
+    assert api._hedge_delay(endpoint, "VerifyPayment") == 0.3
+
+
+@pytest.mark.asyncio
+async def test_latency_is_recorded_per_operation(make_api, prod_settings):
+    """Test that each operation's latency is kept apart on one endpoint."""
+    api = make_api(settings=prod_settings)
+
+    await api.post("/webservices/JSON/default.aspx?VerifyPayment", {"a": 1})
+    await api.post("/webservices/JSON/default.aspx", {"TrxType": "Hold"})
+
+    endpoint = api._build_endpoint()
+    assert len(api._latency_window(endpoint, "VerifyPayment")) == 1
+    assert len(api._latency_window(endpoint, "Hold")) == 1
+    assert len(api._latency_window(endpoint, "Sale")) == 0
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_hedge_needs_spare_admission(make_api, prod_settings):
+    """Test that no hedge copy is sent when the merchant governor is full."""
+    calls = []
+    handler = _host_handler({"pagos.azul.com.do": 0.1}, calls)
+    prod_settings.MERCHANT_ID = "hedge-governed-merchant"
+    prod_settings.MAX_IN_FLIGHT = 1
+    api = make_api(handler, settings=prod_settings)
+
+    response = await api.post(
+        "/webservices/JSON/default.aspx?VerifyPayment", {"a": 1}, hedge=True
+    )
+
+    assert response["Host"] == "pagos.azul.com.do"
+    assert calls == ["pagos.azul.com.do"]
+    assert api.governor.limiter.in_flight == 0
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_failing_primary_is_skipped_once_circuit_opens(make_api, prod_settings):
+    """Test that requests go straight to the alternate while the primary is down."""
+    calls = []
+    prod_settings.CIRCUIT_FAILURE_THRESHOLD = 1
+    prod_settings.CIRCUIT_RESET_TIMEOUT = 60
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.host)
+        if request.url.host == "pagos.azul.com.do":
+            raise httpx.ConnectError("primary down")
+        return httpx.Response(200, json={"IsoCode": "00"})
+
+    api = make_api(handler, settings=prod_settings)
+    await api.post("/webservices/JSON/default.aspx", {"a": 1})
+    await api.post("/webservices/JSON/default.aspx", {"a": 1})
+
+    assert calls == [
+        "pagos.azul.com.do",
+        "contpagos.azul.com.do",
+        "contpagos.azul.com.do",
+    ]
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_request_fails_fast_when_all_circuits_open(make_api, api_settings):
+    """Test that no request is sent once every endpoint circuit is open."""
+    calls = []
+    api_settings.CIRCUIT_FAILURE_THRESHOLD = 1
+    api_settings.CIRCUIT_RESET_TIMEOUT = 60
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.host)
+        return httpx.Response(503, text="Service Unavailable")
+
+    api = make_api(handler, settings=api_settings)
+    with pytest.raises(APIError):
+        await api.post("/webservices/JSON/default.aspx", {"a": 1})
+    with pytest.raises(NoHealthyEndpointError):
+        await api.post("/webservices/JSON/default.aspx", {"a": 1})
+
+    assert len(calls) == 1
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_expired_deadline_is_rejected_before_sending(make_api):
+    """Test that nothing is sent once the deadline has already passed."""
+    calls = []
+    api = make_api(lambda request: calls.append(request) or httpx.Response(200))
+
+    with pytest.raises(DeadlineExceededError):
+        await api.post(
+            "/webservices/JSON/default.aspx", {"a": 1}, deadline=Deadline.after(-1)
+        )
+
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_failover_is_skipped_when_deadline_is_too_close(make_api, prod_settings):
+    """Test that a slow primary consumes the budget and no retry is attempted."""
+    calls = []
+    handler = _host_handler({"pagos.azul.com.do": 5}, calls)
+    api = make_api(
+        handler,
+        settings=prod_settings,
+        timeout_profiles={"Sale": TimeoutProfile(min_attempt=0.5)},
+    )
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        await api.post(
+            "/webservices/JSON/default.aspx",
+            {"TrxType": "Sale"},
+            deadline=Deadline.after(0.3),
+        )
+
+    assert time.monotonic() - started < 1
+    assert calls == ["pagos.azul.com.do"]
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_deadline_budget_is_split_with_failover(make_api, prod_settings):
+    """Test that the primary gets part of the budget and the alternate the rest."""
+    calls = []
+    handler = _host_handler({"pagos.azul.com.do": 5}, calls)
+    api = make_api(
+        handler,
+        settings=prod_settings,
+        timeout_profiles={"Sale": TimeoutProfile(min_attempt=0.1)},
+    )
+
+    response = await api.post(
+        "/webservices/JSON/default.aspx", {"a": 1}, deadline=Deadline.after(0.5)
+    )
+
+    assert response["Host"] == "contpagos.azul.com.do"
+    assert calls == ["pagos.azul.com.do", "contpagos.azul.com.do"]
+    await api.aclose()
+
+
+def test_timeout_profile_is_selected_per_operation(make_api):
+    """Test that operations map to their own timeout profile."""
+    verify = TimeoutProfile(connect=2, read=5)
+    hold = TimeoutProfile(connect=3, read=20)
+    api = make_api(timeout_profiles={"VerifyPayment": verify, "Hold": hold})
+
+    assert api._get_timeout_profile("VerifyPayment", {}) is verify
+    assert api._get_timeout_profile("", {"TrxType": "Hold"}) is hold
+    assert (
+        api._get_timeout_profile("", {"TrxType": "Sale"})
+        is api.timeout_profiles.default
+    )
+
+
+@pytest.mark.asyncio
+async def test_merchant_governor_caps_requests_in_flight(make_api, api_settings):
+    """Test that MAX_IN_FLIGHT bounds concurrent requests and records queue wait."""
+    active = {"now": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return httpx.Response(200, json={"IsoCode": "00"})
+
+    api_settings.MERCHANT_ID = "governed-merchant"
+    api_settings.MAX_IN_FLIGHT = 2
+    api = make_api(handler)
+
+    await asyncio.gather(
+        *(api.post("/webservices/JSON/default.aspx", {"a": 1}) for _ in range(6))
+    )
+
+    assert active["peak"] == 2
+    assert len(api.governor.queue_wait) == 6
+    assert api.governor.limiter.in_flight == 0
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_gateway_overload_error_shrinks_adaptive_limit(make_api, api_settings):
+    """Test that an SGS unavailable error reduces the adaptive in-flight limit."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"ErrorDescription": "SGS-050001: Server Unavailable"}
+        )
+
+    api_settings.MERCHANT_ID = "adaptive-merchant"
+    api_settings.MAX_IN_FLIGHT = 8
+    api_settings.ADAPTIVE_CONCURRENCY = True
+    api = make_api(handler)
+    limit = api.governor.limiter.limit
+
+    with pytest.raises(APIError):
+        await api.post("/webservices/JSON/default.aspx", {"a": 1})
+
+    assert api.governor.limiter.limit == limit // 2
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_priorities_use_separate_pools(make_api, api_settings):
+    """Test that background traffic gets its own, smaller connection pool."""
+    api_settings.HTTP_BACKGROUND_MAX_CONNECTIONS = 4
+    api = make_api()
+
+    await api.post("/webservices/JSON/default.aspx", {"a": 1})
+    await api.post(
+        "/webservices/JSON/default.aspx", {"a": 1}, priority=Priority.BACKGROUND
+    )
+
+    interactive = api._get_client(Priority.INTERACTIVE)
+    background = api._get_client(Priority.BACKGROUND)
+    assert interactive is not background
+    assert api.background_limits.max_connections == 4
+    await api.aclose()
+    assert interactive.is_closed and background.is_closed
+
+
+@pytest.mark.asyncio
+async def test_request_logging_never_contains_card_data(make_api, caplog):
+    """Test that debug payload logs mask the PAN and drop the CVC."""
+    api = make_api()
+
+    with caplog.at_level(logging.DEBUG, logger="pyazul.api.client"):
+        await api.post(
+            "/webservices/JSON/default.aspx",
+            {"CardNumber": "4111111111111111", "CVC": "123"},
+        )
+
+    messages = "\n".join(record.getMessage() for record in caplog.records)
+    assert "azul.request" in messages and "azul.response" in messages
+    assert "4111111111111111" not in messages
+    assert '"CVC":"123"' not in messages
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_request_body_is_pre_encoded_once(make_api):
+    """Test that a model is sent as JSON bytes with Channel and Store applied."""
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        return httpx.Response(200, json={"IsoCode": "00"})
+
+    api = make_api(handler)
+    void = Void(Store="12345", AzulOrderId="AZUL1")
+
+    await api.post("/webservices/JSON/default.aspx?ProcessVoid", void)
+
+    assert json.loads(bodies[0]) == {
+        "Channel": "EC",
+        "Store": "39038540035",
+        "AzulOrderId": "AZUL1",
+    }
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_warmup_opens_concurrent_connections(make_api, api_settings):
+    """Test warmup sends one concurrent request per connection to open."""
+    state = {"active": 0, "peak": 0, "methods": set()}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["methods"].add(request.method)
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return httpx.Response(404)
+
+    api = make_api(handler, api_settings.model_copy(update={"WARMUP_CONNECTIONS": 3}))
+
+    assert await api.warmup() == 3
+    assert state["peak"] == 3 and state["methods"] == {"GET"}
+    await api.aclose()
+
+
+def test_preload_loads_certificates_up_front(make_api):
+    """Test preload builds the SSL context before any request."""
+    api = make_api()
+    assert api.generation.ssl_context is None
+
+    api.preload()
+
+    assert api.generation.ssl_context is not None
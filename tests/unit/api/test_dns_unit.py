@@ -0,0 +1,148 @@
+"""Unit tests for the DNS cache and IP pinning."""
+
+import asyncio
+import json
+
+import httpcore
+import pytest
+
+from pyazul.api.dns import DNSCache, ResolvingBackend
+
+HOST = "pagos.azul.com.do"
+
+
+class RecordingBackend(httpcore.AsyncNetworkBackend):
+    """Network backend recording connections, refusing some addresses."""
+
+    def __init__(self, refused=(), responses=()):
+        """Initialize with addresses to refuse and raw responses to serve."""
+        self.refused = set(refused)
+        self.connected = []
+        self._mock = httpcore.AsyncMockBackend(list(responses))
+
+    async def connect_tcp(self, host, port, timeout=None, **kwargs):
+        """Record the address and connect, unless it is refused."""
+        self.connected.append(host)
+        if host in self.refused:
+            raise httpcore.ConnectError(f"{host} refused")
+        return await self._mock.connect_tcp(host, port, timeout)
+
+
+def counting_lookup(calls, addresses=("10.0.0.1",), delay=0.0, fail=False):
+    """Build a lookup counting its calls."""
+
+    async def lookup(host, port):
+        calls.append(host)
+        await asyncio.sleep(delay)
+        if fail:
+            raise OSError("resolver unavailable")
+        return list(addresses)
+
+    return lookup
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_lookup():
+    """Test a burst of new connections resolves the host once."""
+    calls = []
+    cache = DNSCache(ttl=60, lookup=counting_lookup(calls, delay=0.01))
+
+    results = await asyncio.gather(*(cache.resolve(HOST, 443) for _ in range(5)))
+    await cache.resolve(HOST, 443)
+
+    assert results == [["10.0.0.1"]] * 5
+    assert calls == [HOST]
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_refreshing():
+    """Test stale addresses are returned at once and refreshed in background."""
+    calls = []
+    cache = DNSCache(ttl=0.01, lookup=counting_lookup(calls))
+    await cache.resolve(HOST, 443)
+    await asyncio.sleep(0.02)
+
+    cache._lookup = counting_lookup(calls, addresses=("10.0.0.2",))
+    assert await cache.resolve(HOST, 443) == ["10.0.0.1"]
+    await asyncio.sleep(0)
+    await asyncio.gather(*cache._refreshes)
+
+    assert await cache.resolve(HOST, 443) == ["10.0.0.2"]
+    await cache.aclose()
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_last_addresses():
+    """Test a resolver outage does not break connections to a known host."""
+    calls = []
+    cache = DNSCache(ttl=0.01, lookup=counting_lookup(calls))
+    await cache.resolve(HOST, 443)
+    await asyncio.sleep(0.02)
+
+    cache._lookup = counting_lookup(calls, fail=True)
+    assert await cache.resolve(HOST, 443) == ["10.0.0.1"]
+    await asyncio.gather(*cache._refreshes)
+
+    assert await cache.resolve(HOST, 443) == ["10.0.0.1"]
+    await cache.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pinned_hosts_are_never_resolved():
+    """Test pinned IPs skip the resolver, even with caching disabled."""
+    calls = []
+    cache = DNSCache(
+        ttl=None, pinned={"PAGOS.azul.com.do": ["192.168.50.10"]}, lookup=calls.append
+    )
+
+    assert await cache.resolve(HOST, 443) == ["192.168.50.10"]
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_backend_falls_back_to_next_address_and_invalidates():
+    """Test unreachable addresses are skipped and a full failure re-resolves."""
+    calls = []
+    cache = DNSCache(ttl=60, lookup=counting_lookup(calls, ("10.0.0.1", "10.0.0.2")))
+    inner = RecordingBackend(refused={"10.0.0.1"})
+    backend = ResolvingBackend(inner, cache)
+
+    await backend.connect_tcp(HOST, 443)
+    assert inner.connected == ["10.0.0.1", "10.0.0.2"]
+
+    inner.refused.add("10.0.0.2")
+    with pytest.raises(httpcore.ConnectError):
+        await backend.connect_tcp(HOST, 443)
+    await backend.connect_tcp("10.0.0.9", 443)  # IP literals are not resolved
+
+    assert calls == [HOST]
+    assert cache._entries == {}
+    assert inner.connected[-1] == "10.0.0.9"
+
+
+@pytest.mark.asyncio
+async def test_api_connects_to_pinned_ip(make_api, api_settings):
+    """Test AzulAPI routes its pooled connections through the pinned IP."""
+    settings = api_settings.model_copy(
+        update={"DNS_PINNED_HOSTS": {"pruebas.azul.com.do": ["10.20.30.40"]}}
+    )
+    api = make_api(settings=settings, transport=None)
+    body = json.dumps({"ResponseCode": "ISO8583", "IsoCode": "00"}).encode()
+    inner = RecordingBackend(
+        responses=[
+            b"HTTP/1.1 200 OK\r\n",
+            b"Content-Type: application/json\r\n",
+            f"Content-Length: {len(body)}\r\n\r\n".encode(),
+            body,
+        ]
+    )
+    pool = api._get_client()._transport._pool
+    assert isinstance(pool._network_backend, ResolvingBackend)
+    pool._network_backend._backend = inner
+
+    response = await api.post("/webservices/JSON/default.aspx", {"Amount": "100"})
+
+    assert response["IsoCode"] == "00"
+    assert inner.connected == ["10.20.30.40"]
+    await api.aclose()
@@ -0,0 +1,85 @@
+"""Unit tests for connection warmup and keep-alive."""
+
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+
+from pyazul.api.keepalive import KeepAlive
+from pyazul.index import PyAzul
+
+PRIMARY = "https://primary.example/webservices/JSON/default.aspx"
+ALTERNATE = "https://alternate.example/webservices/JSON/default.aspx"
+
+
+@pytest.fixture
+def prod_settings(api_settings):
+    """Return production settings with a primary and an alternate host."""
+    return api_settings.model_copy(
+        update={"ENVIRONMENT": "prod", "CUSTOM_URL": PRIMARY, "ALT_PROD_URL": ALTERNATE}
+    )
+
+
+def counting_handler(hosts: Counter):
+    """Build a slow handler counting requests per host."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hosts[request.url.host] += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(405)
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_warmup_connects_primary_and_alternate(make_api, prod_settings):
+    """Test warmup opens connections to both gateway hosts."""
+    hosts: Counter = Counter()
+    api = make_api(counting_handler(hosts), prod_settings)
+
+    assert await api.warmup(2) == 4
+    assert hosts == {"primary.example": 2, "alternate.example": 2}
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_keepalive_refreshes_and_skips_busy_pool(make_api, prod_settings):
+    """Test pings refresh every endpoint unless traffic keeps them warm."""
+    hosts: Counter = Counter()
+    api = make_api(counting_handler(hosts), prod_settings)
+    keepalive = KeepAlive(api, interval=0.01)
+
+    keepalive.start()
+    await asyncio.sleep(0.1)
+    await keepalive.aclose()
+
+    assert keepalive.pings >= 2 and not keepalive.running
+    assert hosts["primary.example"] == hosts["alternate.example"] >= 2
+
+    api.generation.enter()
+    assert await keepalive.ping() == 0
+    api.generation.exit()
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_context_starts_warmup_and_keepalive(prod_settings):
+    """Test PyAzul warms up and keeps connections alive when configured."""
+    hosts: Counter = Counter()
+    settings = prod_settings.model_copy(
+        update={"WARMUP_CONNECTIONS": 1, "KEEPALIVE_INTERVAL": 60}
+    )
+    transport = httpx.MockTransport(counting_handler(hosts))
+
+    async with PyAzul(settings, transport=transport) as azul:
+        assert hosts == {"primary.example": 1, "alternate.example": 1}
+        assert azul.keepalive is not None and azul.keepalive.running
+
+    assert not azul.keepalive.running
+
+
+def test_keepalive_rejects_invalid_interval(make_api):
+    """Test the interval must be positive."""
+    with pytest.raises(ValueError):
+        KeepAlive(make_api(), interval=0)
@@ -0,0 +1,272 @@
+"""Unit tests for pyazul.api.limits."""
+
+import asyncio
+import logging
+from collections import deque
+
+import pytest
+
+from pyazul.api.constants import Priority
+from pyazul.api.limits import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimiter,
+    MerchantGovernor,
+    TokenBucket,
+)
+from pyazul.api.timeouts import Deadline
+from pyazul.core.exceptions import DeadlineExceededError
+
+
+@pytest.fixture(autouse=True)
+def clear_governors():
+    """Isolate the per-merchant governor registry between tests."""
+    MerchantGovernor._registry.clear()
+    MerchantGovernor._unbound.clear()
+    yield
+    MerchantGovernor._registry.clear()
+    MerchantGovernor._unbound.clear()
+
+
+def test_token_bucket_reserves_in_order():
+    """Test that the burst is free and later tokens wait their turn."""
+    bucket = TokenBucket(rate=10, burst=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_token_bucket_rejects_wait_beyond_limit():
+    """Test that a reservation exceeding max_wait fails without taking a token."""
+    bucket = TokenBucket(rate=1, burst=1)
+    bucket.reserve()
+
+    with pytest.raises(DeadlineExceededError):
+        bucket.reserve(max_wait=0.5)
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_hands_slots_over_in_order():
+    """Test that released slots go to waiters first come, first served."""
+    limiter = ConcurrencyLimiter(1)
+    order = []
+    await limiter.acquire()
+
+    async def worker(name):
+        await limiter.acquire()
+        order.append(name)
+        limiter.release()
+
+    tasks = [asyncio.ensure_future(worker(name)) for name in "ab"]
+    await asyncio.sleep(0)
+    assert limiter.queued == 2
+
+    limiter.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["a", "b"]
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_times_out_and_cleans_up():
+    """Test that a timed out waiter leaves the queue and holds no slot."""
+    limiter = ConcurrencyLimiter(1)
+    await limiter.acquire()
+
+    with pytest.raises(DeadlineExceededError):
+        await limiter.acquire(timeout=0.01)
+
+    assert limiter.queued == 0
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_governor_rejects_request_that_would_expire_in_queue():
+    """Test that the deadline is checked against the rate limit wait up front."""
+    governor = MerchantGovernor(rate=1, burst=1)
+    await governor.acquire()
+
+    with pytest.raises(DeadlineExceededError):
+        await governor.acquire(Deadline.after(0.2))
+
+    assert governor.rejected == 1
+    assert len(governor.queue_wait) == 1
+
+
+@pytest.mark.asyncio
+async def test_background_burst_does_not_delay_interactive_request():
+    """Test that background requests only take tokens nobody reserved."""
+    governor = MerchantGovernor(rate=100, burst=1)
+    await governor.acquire()
+    background = [
+        asyncio.ensure_future(governor.acquire(priority=Priority.BACKGROUND))
+        for _ in range(20)
+    ]
+    await asyncio.sleep(0)
+
+    waited = await governor.acquire()
+    assert waited < 0.1  # about one token interval, not behind twenty (0.2s)
+
+    await asyncio.gather(*background)
+    with pytest.raises(DeadlineExceededError):
+        await governor.acquire(Deadline.after(0), Priority.BACKGROUND)
+    assert governor.bucket._spare_waiters == deque()
+
+
+@pytest.mark.asyncio
+async def test_governor_try_acquire_never_waits():
+    """Test that a non-blocking admission needs both a token and a slot."""
+    governor = MerchantGovernor(rate=1, burst=2, max_in_flight=1)
+    assert governor.try_acquire() is True
+    assert governor.try_acquire() is False  # no slot
+    governor.release()
+
+    assert governor.try_acquire() is True
+    governor.release()
+    assert governor.try_acquire() is False  # no token
+    assert governor.limiter.in_flight == 0
+    assert MerchantGovernor().try_acquire() is True
+
+
+def test_governor_is_shared_per_merchant(caplog):
+    """Test that clients of the same merchant draw from one governor."""
+    first = MerchantGovernor.for_merchant("1", max_in_flight=2)
+
+    assert MerchantGovernor.for_merchant("1", max_in_flight=2) is first
+    assert not caplog.records
+    with caplog.at_level(logging.WARNING, logger="pyazul.api.limits"):
+        assert MerchantGovernor.for_merchant("1", max_in_flight=5) is first
+    assert "ignoring limits" in caplog.text
+    assert MerchantGovernor.for_merchant("2", max_in_flight=2) is not first
+    assert not MerchantGovernor.for_merchant("1").enabled
+
+
+def test_governor_is_separate_per_event_loop():
+    """Test that event loops never share a governor and its futures."""
+
+    async def get_governor():
+        return MerchantGovernor.for_merchant("1", max_in_flight=2)
+
+    first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        first = first_loop.run_until_complete(get_governor())
+        assert first_loop.run_until_complete(get_governor()) is first
+        assert second_loop.run_until_complete(get_governor()) is not first
+    finally:
+        first_loop.close()
+        second_loop.close()
+    assert MerchantGovernor.for_merchant("1", max_in_flight=2) is not first
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_grows_while_latency_is_stable():
+    """Test that a saturated limiter gains one slot per stable window."""
+    limiter = AdaptiveConcurrencyLimiter(min_limit=1, max_limit=4, initial=1, window=5)
+
+    for _ in range(3):
+        held = limiter.limit
+        for _ in range(held):
+            await limiter.acquire()
+        for _ in range(5):
+            limiter.on_success(0.1)
+        for _ in range(held):
+            limiter.release()
+
+    assert limiter.limit == 4
+
+
+def test_adaptive_limit_does_not_grow_when_unused():
+    """Test that the limit stays put if it was never reached."""
+    limiter = AdaptiveConcurrencyLimiter(min_limit=1, max_limit=8, initial=2, window=5)
+
+    for _ in range(20):
+        limiter.on_success(0.1)
+
+    assert limiter.limit == 2
+
+
+def test_adaptive_limit_backs_off_on_latency_rise():
+    """Test that a p90 latency rise halves the limit."""
+    limiter = AdaptiveConcurrencyLimiter(min_limit=1, max_limit=8, initial=8, window=5)
+    for _ in range(5):
+        limiter.on_success(0.1)
+
+    for _ in range(5):
+        limiter.on_success(0.5)
+
+    assert limiter.limit == 4
+
+
+def test_adaptive_limit_backs_off_once_per_window_on_overload():
+    """Test that a burst of overload errors counts as a single decrease."""
+    limiter = AdaptiveConcurrencyLimiter(min_limit=3, max_limit=8, initial=8, window=5)
+
+    limiter.on_overload()
+    limiter.on_overload()
+    assert limiter.limit == 4
+
+    for _ in range(5):
+        limiter.on_success(0.1)
+    limiter.on_overload()
+    assert limiter.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_shrunk_limit_is_enforced_on_release():
+    """Test that slots above a reduced limit are retired instead of handed over."""
+    limiter = AdaptiveConcurrencyLimiter(min_limit=1, max_limit=2, initial=2)
+    await limiter.acquire()
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+
+    limiter.on_overload()
+    limiter.release()
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.release()
+    await waiter
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_more_urgent_priority_is_dequeued_first():
+    """Test that a freed slot goes to the most urgent queue before older waiters."""
+    limiter = ConcurrencyLimiter(1)
+    order = []
+    await limiter.acquire()
+
+    async def worker(name, priority):
+        await limiter.acquire(priority=priority)
+        order.append(name)
+        limiter.release(priority)
+
+    background = asyncio.ensure_future(worker("background", 1))
+    await asyncio.sleep(0)
+    interactive = asyncio.ensure_future(worker("interactive", 0))
+    await asyncio.sleep(0)
+
+    limiter.release()
+    await asyncio.gather(background, interactive)
+
+    assert order == ["interactive", "background"]
+
+
+@pytest.mark.asyncio
+async def test_priority_share_caps_its_slots():
+    """Test that a capped priority leaves the remaining slots to others."""
+    limiter = ConcurrencyLimiter(4, shares={1: 0.5})
+    await limiter.acquire(priority=1)
+    await limiter.acquire(priority=1)
+
+    with pytest.raises(DeadlineExceededError):
+        await limiter.acquire(timeout=0.01, priority=1)
+    await limiter.acquire(priority=0)
+    await limiter.acquire(priority=0)
+
+    assert limiter.in_flight == 4
@@ -0,0 +1,120 @@
+"""Unit tests for certificate and credential hot reload."""
+
+import asyncio
+import ssl
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from pyazul.api.client import AzulAPI
+from pyazul.api.reload import CredentialWatcher
+from pyazul.core.exceptions import SSLError
+
+APPROVED_RESPONSE = {"ResponseCode": "ISO8583", "IsoCode": "00"}
+
+
+def rotated(settings, **changes):
+    """Return a copy of `settings` with rotated values."""
+    return settings.model_copy(update=changes)
+
+
+@pytest.fixture
+def new_context_per_load():
+    """Make every certificate load return a distinct SSL context."""
+    with patch.object(
+        AzulAPI,
+        "_load_certificates",
+        side_effect=lambda settings=None: ssl.create_default_context(),
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_reload_applies_new_credentials(make_api, api_settings):
+    """Test requests after a reload carry the new Auth1/Auth2 headers."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Auth1"])
+        return httpx.Response(200, json=APPROVED_RESPONSE)
+
+    api = make_api(handler)
+    await api.post("/webservices/JSON/default.aspx", {"Amount": "100"})
+    client = api._get_client()
+
+    await api.reload(rotated(api_settings, AUTH1="rotated_auth1"))
+    await api.post("/webservices/JSON/default.aspx", {"Amount": "100"})
+
+    assert seen == ["test_auth1", "rotated_auth1"]
+    assert api.generation.number == 2
+    # Same certificate: the warm pool is kept
+    assert api._get_client() is client
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_in_flight_requests_drain_on_old_pool(
+    make_api, api_settings, new_context_per_load
+):
+    """Test a rotation swaps pools while a running request finishes on the old one."""
+    release = asyncio.Event()
+    started = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers["Auth1"] == "test_auth1":
+            started.set()
+            await release.wait()
+        return httpx.Response(200, json=APPROVED_RESPONSE)
+
+    api = make_api(handler)
+    in_flight = asyncio.ensure_future(
+        api.post("/webservices/JSON/default.aspx", {"Amount": "100"})
+    )
+    await started.wait()
+    old_client = api._get_client()
+
+    old = await api.reload(rotated(api_settings, AUTH1="rotated_auth1"))
+    new_client = api._get_client()
+    await api.post("/webservices/JSON/default.aspx", {"Amount": "100"})
+
+    assert new_client is not old_client
+    assert old.retired and not old_client.is_closed
+
+    release.set()
+    assert (await in_flight)["IsoCode"] == "00"
+    await asyncio.wait_for(old.wait_closed(), 1)
+    assert old_client.is_closed and not new_client.is_closed
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_failed_reload_keeps_current_generation(make_api, api_settings):
+    """Test a certificate that cannot be loaded leaves the client untouched."""
+    api = make_api()
+    generation = api.generation
+
+    with patch.object(
+        AzulAPI, "_load_certificates", side_effect=SSLError("bad certificate")
+    ):
+        with pytest.raises(SSLError):
+            await api.reload(rotated(api_settings, AZUL_CERT="other.pem"))
+
+    assert api.generation is generation and not generation.retired
+
+
+@pytest.mark.asyncio
+async def test_watcher_reloads_on_change(make_api, api_settings):
+    """Test the watcher reloads only when certificates or credentials change."""
+    api = make_api()
+    current = {"settings": api_settings}
+    watcher = CredentialWatcher(api, settings_factory=lambda: current["settings"])
+
+    assert not await watcher.check()
+
+    current["settings"] = rotated(api_settings, AUTH2="rotated_auth2")
+    assert await watcher.check()
+    assert api.auth2 == "rotated_auth2"
+    assert not await watcher.check()
+    assert watcher.reloads == 1
+    await api.aclose()
@@ -0,0 +1,99 @@
+"""Unit tests for pyazul.api.routing."""
+
+import asyncio
+
+import pytest
+
+from pyazul.api.routing import CircuitState, EndpointRouter
+from pyazul.core.exceptions import NoHealthyEndpointError
+
+PRIMARY = "https://primary.example/api"
+ALTERNATE = "https://alternate.example/api"
+
+
+def test_endpoints_keep_configured_order_when_healthy():
+    """Test that healthy endpoints are returned in preference order."""
+    router = EndpointRouter([PRIMARY, ALTERNATE, PRIMARY, ""])
+
+    assert [e.url for e in router.available()] == [PRIMARY, ALTERNATE]
+
+
+def test_circuit_opens_after_consecutive_failures():
+    """Test that an endpoint stops receiving traffic once its circuit opens."""
+    router = EndpointRouter([PRIMARY, ALTERNATE], failure_threshold=2)
+
+    router.record_failure(PRIMARY)
+    assert router.get(PRIMARY).state == CircuitState.CLOSED
+    router.record_failure(PRIMARY)
+
+    assert router.get(PRIMARY).state == CircuitState.OPEN
+    assert [e.url for e in router.available()] == [ALTERNATE]
+
+
+def test_lower_success_rate_is_routed_last():
+    """Test that a degraded but not failed endpoint is demoted."""
+    router = EndpointRouter([PRIMARY, ALTERNATE], failure_threshold=10)
+    for _ in range(3):
+        router.record_failure(PRIMARY)
+        router.record_success(PRIMARY, 0.1)
+
+    assert [e.url for e in router.available()] == [ALTERNATE, PRIMARY]
+
+
+def test_traffic_returns_to_primary_after_isolated_failure():
+    """Test that a failure's demotion wears off as the success rate recovers."""
+    router = EndpointRouter([PRIMARY, ALTERNATE], reset_timeout=30)
+    router.record_failure(PRIMARY)
+    assert [e.url for e in router.available()] == [ALTERNATE, PRIMARY]
+
+    # Three half-lives later the primary is back within rounding of the alternate
+    router.get(PRIMARY).updated_at -= 90
+    router.get(ALTERNATE).updated_at -= 90
+
+    assert [e.url for e in router.available()] == [PRIMARY, ALTERNATE]
+    assert router.get(PRIMARY).success_rate == pytest.approx(0.975)
+
+
+def test_all_circuits_open_fails_fast():
+    """Test that a clear error is raised when no endpoint is available."""
+    router = EndpointRouter([PRIMARY], failure_threshold=1, reset_timeout=60)
+    router.record_failure(PRIMARY)
+
+    with pytest.raises(NoHealthyEndpointError, match="circuits open"):
+        router.available()
+
+
+def test_open_circuit_half_opens_after_reset_without_probe():
+    """Test the lazy half-open fallback when no probe is configured."""
+    router = EndpointRouter([PRIMARY], failure_threshold=1, reset_timeout=0)
+    router.record_failure(PRIMARY)
+
+    assert [e.url for e in router.available()] == [PRIMARY]
+    assert router.get(PRIMARY).state == CircuitState.HALF_OPEN
+
+    router.record_failure(PRIMARY)
+    assert router.get(PRIMARY).state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_background_probe_half_opens_and_success_closes():
+    """Test that a successful probe re-admits the endpoint."""
+    probed = asyncio.Event()
+
+    async def probe(url: str) -> bool:
+        probed.set()
+        return True
+
+    router = EndpointRouter(
+        [PRIMARY, ALTERNATE], failure_threshold=1, reset_timeout=0, probe=probe
+    )
+    router.record_failure(PRIMARY)
+    assert [e.url for e in router.available()] == [ALTERNATE]
+
+    await asyncio.wait_for(probed.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert router.get(PRIMARY).state == CircuitState.HALF_OPEN
+
+    router.record_success(PRIMARY, 0.05)
+    assert router.get(PRIMARY).state == CircuitState.CLOSED
+    await router.aclose()
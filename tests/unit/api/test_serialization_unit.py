@@ -0,0 +1,42 @@
+"""Unit tests for pyazul.api.serialization."""
+
+import json
+
+import pytest
+
+from pyazul.api.serialization import encode_request, loads
+from pyazul.models.payment import Void
+
+OVERRIDES = {"Channel": "EC", "Store": "39038540035"}
+
+
+def test_model_is_encoded_with_overrides_and_without_none():
+    """Test that models are dumped to bytes with settings-sourced fields."""
+    void = Void(Store="12345", AzulOrderId="AZUL1")
+
+    body = encode_request(void, OVERRIDES)
+
+    assert isinstance(body, bytes)
+    assert json.loads(body) == {
+        **void.model_dump(exclude_none=True),
+        **OVERRIDES,
+    }
+    assert void.Store == "12345"
+
+
+def test_mapping_is_encoded_without_being_mutated():
+    """Test that plain payloads are encoded compactly and left untouched."""
+    data = {"AzulOrderId": "AZUL1", "Store": "12345", "Name": "José"}
+
+    body = encode_request(data, OVERRIDES)
+
+    assert json.loads(body) == {**data, **OVERRIDES}
+    assert data["Store"] == "12345"
+    assert b", " not in body
+
+
+def test_invalid_json_raises_json_decode_error():
+    """Test that every backend reports bad payloads as JSONDecodeError."""
+    assert loads(b'{"IsoCode":"00"}') == {"IsoCode": "00"}
+    with pytest.raises(json.JSONDecodeError):
+        loads(b"<html>Service Unavailable</html>")
@@ -0,0 +1,29 @@
+"""Unit tests for pyazul.api.stats."""
+
+from pyazul.api.stats import LatencyWindow
+
+
+def test_percentile_of_empty_window_is_none():
+    """Test that an empty window has no percentile."""
+    assert LatencyWindow().percentile(0.5) is None
+
+
+def test_percentile_uses_nearest_rank():
+    """Test nearest-rank percentiles over the recorded samples."""
+    window = LatencyWindow()
+    for value in range(1, 101):
+        window.record(value / 100)
+
+    assert window.percentile(0.5) == 0.5
+    assert window.percentile(0.95) == 0.95
+    assert window.percentile(1.0) == 1.0
+
+
+def test_window_keeps_only_recent_samples():
+    """Test that old samples are evicted once the window is full."""
+    window = LatencyWindow(size=3)
+    for value in (10.0, 1.0, 2.0, 3.0):
+        window.record(value)
+
+    assert len(window) == 3
+    assert window.percentile(1.0) == 3.0
@@ -0,0 +1,59 @@
+"""Unit tests for pyazul.api.timeouts."""
+
+import time
+
+import pytest
+
+from pyazul.api.timeouts import Deadline, TimeoutProfile, TimeoutProfiles
+
+
+def test_deadline_remaining_and_expiry():
+    """Test that a deadline counts down and reports expiry."""
+    assert Deadline.after(10).remaining() == pytest.approx(10, abs=0.1)
+    assert not Deadline.after(10).expired
+
+    past = Deadline(time.monotonic() - 1)
+    assert past.expired
+    assert past.remaining() == 0.0
+
+
+def test_phases_are_capped_by_budget():
+    """Test that every httpx phase timeout is limited by the attempt budget."""
+    timeout = TimeoutProfile(connect=5, read=30, write=10, pool=10).timeout(4)
+
+    assert timeout.connect == 4
+    assert timeout.read == 4
+    assert timeout.write == 4
+    assert timeout.pool == 4
+
+
+def test_budget_reserves_time_for_failover():
+    """Test that part of the remaining time is kept for the failover attempt."""
+    profile = TimeoutProfile(min_attempt=1, failover_share=0.4)
+
+    budget = profile.attempt_budget(Deadline.after(10), attempts_left=2)
+
+    assert budget == pytest.approx(6, abs=0.1)
+
+
+def test_budget_uses_all_time_when_failover_is_not_worth_it():
+    """Test that a tight deadline is spent on a single attempt."""
+    profile = TimeoutProfile(min_attempt=2, failover_share=0.4)
+
+    budget = profile.attempt_budget(Deadline.after(3), attempts_left=2)
+
+    assert budget == pytest.approx(3, abs=0.1)
+
+
+def test_no_deadline_means_no_overall_budget():
+    """Test that per-phase timeouts alone apply without a deadline."""
+    assert TimeoutProfile().attempt_budget(None, attempts_left=2) is None
+
+
+def test_profiles_lookup_is_case_insensitive_with_default():
+    """Test per-operation lookup falling back to the default profile."""
+    verify = TimeoutProfile(connect=2, read=5)
+    profiles = TimeoutProfiles({"VerifyPayment": verify})
+
+    assert profiles.get("verifypayment") is verify
+    assert profiles.get("ProcessDatavault") is profiles.default
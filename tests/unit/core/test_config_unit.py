@@ -1,24 +1,12 @@
 """Unit tests for pyazul.core.config."""
 
 import os
-from unittest.mock import patch
 
 import pytest
 
 from pyazul.core.config import AzulSettings
 
 
-@pytest.fixture(scope="session", autouse=True)
-def mock_load_dotenv_session_wide():
-    """Patch dotenv.load_dotenv session-wide to reduce .env influence.
-
-    Note: This might not prevent an initial load if .env is loaded at module import time
-    before this patch takes effect for all code paths. Tests should be robust to this.
-    """
-    with patch("pyazul.core.config.load_dotenv", return_value=False) as mock_load:
-        yield mock_load
-
-
 @pytest.fixture
 def azul_settings_test_factory(monkeypatch):
     """Provide a factory to create AzulSettings for testing.
@@ -119,3 +107,20 @@ def test_alt_prod_url_setting_works(azul_settings_test_factory):
     )
     assert settings.ENVIRONMENT == "prod"
     assert settings.ALT_PROD_URL == custom_alt_url
+
+
+def test_dotenv_is_read_at_construction_without_touching_environ(tmp_path, monkeypatch):
+    """Test .env values fill in settings but never override or leak into env."""
+    (tmp_path / ".env").write_text(
+        "AUTH1=from_file\nAUTH2=from_file\nMERCHANT_ID=from_file\n"
+        "AZUL_CERT=cert.pem\nAZUL_KEY=key.pem\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AUTH1", "from_env")
+    monkeypatch.delenv("AUTH2", raising=False)
+
+    settings = AzulSettings()
+
+    assert settings.AUTH1 == "from_env"
+    assert settings.AUTH2 == "from_file"
+    assert "AUTH2" not in os.environ
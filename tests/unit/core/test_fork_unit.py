@@ -0,0 +1,86 @@
+"""Unit tests for post-fork resets."""
+
+import os
+import ssl
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from pyazul.api.client import AzulAPI
+from pyazul.core import fork
+from pyazul.core.config import AzulSettings
+from pyazul.sync import PyAzulSync
+
+STORE = "39038540035"
+
+
+@pytest.fixture(autouse=True)
+def no_certificates():
+    """Skip real certificate loading."""
+    with patch.object(
+        AzulAPI, "_load_certificates", return_value=ssl.create_default_context()
+    ):
+        yield
+
+
+@pytest.fixture
+def settings() -> AzulSettings:
+    """Return settings with a merchant in-flight limit."""
+    return AzulSettings(
+        AUTH1="test_auth1",
+        AUTH2="test_auth2",
+        MERCHANT_ID=STORE,
+        AZUL_CERT="dummy_cert.pem",
+        AZUL_KEY="dummy_key.key",
+        ENVIRONMENT="dev",
+        MAX_IN_FLIGHT=4,
+    )
+
+
+def approve(request: httpx.Request) -> httpx.Response:
+    """Approve every request."""
+    return httpx.Response(200, json={"ResponseCode": "ISO8583", "IsoCode": "00"})
+
+
+@pytest.mark.asyncio
+async def test_child_reset_drops_pools_and_keeps_ssl_context(settings):
+    """Test the child drops inherited pools and governor, not the SSL context."""
+    api = AzulAPI(settings, transport=httpx.MockTransport(approve))
+    await api.post("/webservices/JSON/default.aspx", {"Amount": "100"})
+    client, governor = api._get_client(), api.governor
+    ssl_context = api.ssl_context
+
+    fork._reinit_in_child()
+
+    assert api._clients == {}
+    assert not client.is_closed  # The parent's sockets are left alone
+    assert api.governor is not governor
+    assert api.ssl_context is ssl_context
+    await api.post("/webservices/JSON/default.aspx", {"Amount": "100"})
+    assert api._get_client() is not client
+    await api.aclose()
+    await client.aclose()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_sync_client_works_in_forked_child(settings):
+    """Test a PyAzulSync created before fork serves requests in the child."""
+    azul = PyAzulSync(settings, transport=httpx.MockTransport(approve))
+    void = {"Store": STORE, "AzulOrderId": "1"}
+    azul.void(void)
+    parent_thread = azul._thread
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        code = 1
+        try:
+            ok = azul.void(void).approved and azul._thread is not parent_thread
+            code = 0 if ok else 1
+        finally:
+            os._exit(code)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert azul.void(void).approved
+    azul.close()
@@ -0,0 +1,37 @@
+"""Unit tests for lazy package exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import pyazul
+import pyazul.models
+
+
+def test_import_pyazul_loads_no_dependencies():
+    """Test `import pyazul` imports neither httpx, pydantic nor the services."""
+    code = (
+        "import sys, pyazul; "
+        "print(sorted(m for m in ('httpx', 'pydantic', 'dotenv', 'pyazul.index') "
+        "if m in sys.modules))"
+    )
+    output = subprocess.run(  # nosec B603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == "[]"
+
+
+def test_exports_resolve_on_access():
+    """Test every name in __all__ resolves and is listed by dir()."""
+    for module in (pyazul, pyazul.models):
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+            assert name in dir(module)
+
+
+def test_unknown_attribute_raises():
+    """Test unknown names still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        pyazul.NotAnExport
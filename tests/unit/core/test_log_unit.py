@@ -0,0 +1,63 @@
+"""Unit tests for pyazul.core.log."""
+
+import logging
+
+from pyazul.core.log import REDACTED, LazyJSON, log_event, redact
+
+PAYLOAD = {
+    "CardNumber": "4111111111111111",
+    "CVC": "123",
+    "Expiration": "202812",
+    "Amount": "1000",
+    "ThreeDSAuth": {"TermUrl": "https://example.com", "CRes": "abc"},
+}
+
+
+def test_redact_masks_sensitive_fields_at_any_depth():
+    """Test that card data is masked and nested secrets are redacted."""
+    redacted = redact(PAYLOAD)
+
+    assert redacted["CardNumber"] == "411111******1111"
+    assert redacted["CVC"] == REDACTED
+    assert redacted["Expiration"] == REDACTED
+    assert redacted["Amount"] == "1000"
+    assert redacted["ThreeDSAuth"]["CRes"] == REDACTED
+    assert PAYLOAD["CVC"] == "123"
+
+
+def test_disabled_level_does_no_work(caplog):
+    """Test that nothing is redacted or serialized when the level is off."""
+
+    class Exploding:
+        def __str__(self):
+            raise AssertionError("formatted while disabled")
+
+    logger = logging.getLogger("pyazul.tests.disabled")
+    logger.setLevel(logging.INFO)
+
+    log_event(logger, logging.DEBUG, "azul.request", payload=Exploding())
+
+    assert caplog.records == []
+
+
+def test_event_is_structured_and_redacted(caplog):
+    """Test that the record carries the event name and redacted fields."""
+    logger = logging.getLogger("pyazul.tests.enabled")
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        log_event(logger, logging.DEBUG, "azul.request", payload=PAYLOAD)
+
+    (record,) = caplog.records
+    assert record.event == "azul.request"
+    assert record.fields["payload"]["CVC"] == REDACTED
+    assert "4111111111111111" not in record.getMessage()
+    assert isinstance(record.args[1], LazyJSON)
+
+
+def test_sampling_drops_events(caplog):
+    """Test that a zero sample rate emits nothing."""
+    logger = logging.getLogger("pyazul.tests.sampled")
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        for _ in range(10):
+            log_event(logger, logging.DEBUG, "azul.response", sample_rate=0.0)
+
+    assert caplog.records == []
@@ -0,0 +1,235 @@
+"""Unit tests for the Redis 3DS session store, against an in-process fake."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from pyazul.core.sessions import RedisSessionStore
+from pyazul.core.sessions.codec import decode
+from pyazul.core.sessions.redis import _CLAIM_AND_GET
+from pyazul.services.secure import SecureService
+
+
+class FakeRedis:
+    """Subset of ``redis.asyncio.Redis`` with PX expiry, counting round trips."""
+
+    def __init__(self):
+        """Initialize an empty keyspace."""
+        self.data = {}
+        self.round_trips = 0
+
+    def _live(self, name):
+        """Return the value of a key, dropping it once expired."""
+        entry = self.data.get(name)
+        if entry is not None and entry[1] is not None and entry[1] <= time.time():
+            del self.data[name]
+            return None
+        return entry
+
+    def _set(self, name, value, px=None, nx=False):
+        """Apply a SET."""
+        if nx and self._live(name) is not None:
+            return None
+        if isinstance(value, str):
+            value = value.encode()
+        self.data[name] = (value, time.time() + px / 1000 if px else None)
+        return True
+
+    def _delete(self, *names):
+        """Apply a DEL."""
+        return sum(self.data.pop(name, None) is not None for name in names)
+
+    async def get(self, name):
+        """Run GET."""
+        self.round_trips += 1
+        entry = self._live(name)
+        return None if entry is None else entry[0]
+
+    async def set(self, name, value, px=None, nx=False):
+        """Run SET."""
+        self.round_trips += 1
+        return self._set(name, value, px, nx)
+
+    async def delete(self, *names):
+        """Run DEL."""
+        self.round_trips += 1
+        return self._delete(*names)
+
+    def pipeline(self, transaction=True):
+        """Start a pipeline."""
+        return FakePipeline(self)
+
+    def register_script(self, script):
+        """Register a Lua script; only the store's claim-and-get is emulated."""
+        assert script == _CLAIM_AND_GET
+        return FakeClaimAndGet(self)
+
+
+class FakeClaimAndGet:
+    """Python equivalent of the store's claim-and-get Lua script."""
+
+    def __init__(self, redis):
+        """Initialize the script on a `FakeRedis`."""
+        self.redis = redis
+
+    async def __call__(self, keys, args):
+        """Run the script in one round trip."""
+        self.redis.round_trips += 1
+        claim_key, index_key = keys
+        ttl_ms, session_prefix = args
+        if self.redis._set(claim_key, b"1", ttl_ms, nx=True) is None:
+            return None
+        index = self.redis._live(index_key)
+        if index is None:
+            return []
+        session = self.redis._live(session_prefix + index[0].decode())
+        return [index[0]] if session is None else [index[0], session[0]]
+
+
+class FakePipeline:
+    """Buffered commands sent to `FakeRedis` in one round trip."""
+
+    def __init__(self, redis):
+        """Initialize an empty pipeline."""
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        """Return the pipeline."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Discard buffered commands."""
+        self.commands = []
+
+    def set(self, name, value, px=None, nx=False):
+        """Buffer a SET."""
+        self.commands.append((self.redis._set, (name, value, px, nx)))
+        return self
+
+    async def execute(self):
+        """Run the buffered commands at once."""
+        self.redis.round_trips += 1
+        results = [command(*args) for command, args in self.commands]
+        self.commands = []
+        return results
+
+
+def session(azul_order_id):
+    """Build session data for an order."""
+    return {
+        "azul_order_id": azul_order_id,
+        "order_number": f"ORD-{azul_order_id}",
+        "amount": "1000",
+        "status": "processing",
+    }
+
+
+@pytest.mark.asyncio
+async def test_set_writes_session_and_indexes_in_one_round_trip():
+    """Test a state transition costs one round trip, with server-side TTLs."""
+    redis = FakeRedis()
+    store = RedisSessionStore(redis, ttl=60)
+
+    await store.set("s1", session("100"))
+
+    assert redis.round_trips == 1
+    assert set(redis.data) == {
+        "pyazul:3ds:s:s1",
+        "pyazul:3ds:i:azul_order_id:100",
+        "pyazul:3ds:i:order_number:ORD-100",
+    }
+    now = time.time()
+    assert all(
+        now + 59 < expires_at <= now + 60 for _, expires_at in redis.data.values()
+    )
+    assert await store.get("s1") == session("100")
+    assert await store.find("ORD-100", "order_number") == "s1"
+
+
+@pytest.mark.asyncio
+async def test_find_ignores_stale_index_keys():
+    """Test index keys of deleted or changed sessions are not followed."""
+    store = RedisSessionStore(FakeRedis())
+    await store.set("s1", session("100"))
+    await store.set("s2", session("200"))
+
+    await store.set("s1", {**session("101"), "order_number": "ORD-100"})
+    assert await store.delete("s2") is True
+    assert await store.delete("s2") is False
+
+    assert await store.find("100") is None
+    assert await store.find("101") == "s1"
+    assert await store.find("200") is None
+    assert await store.get("s2") is None
+    assert store.metrics() == {"hits": 0, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_sessions_expire_on_the_server():
+    """Test sessions and their index keys expire with the TTL."""
+    store = RedisSessionStore(FakeRedis(), ttl=60)
+    await store.set("s1", session("100"), ttl=0.01)
+    await asyncio.sleep(0.02)
+
+    assert await store.get("s1") is None
+    assert await store.find("100") is None
+
+
+@pytest.mark.asyncio
+async def test_claim_is_set_if_absent():
+    """Test only one node takes a method key until it is released."""
+    redis = FakeRedis()
+    node_a, node_b = RedisSessionStore(redis), RedisSessionStore(redis)
+
+    assert await node_a.claim("3ds-method:100") is True
+    assert await node_b.claim("3ds-method:100") is False
+    await node_a.release("3ds-method:100")
+    assert await node_b.claim("3ds-method:100") is True
+
+
+@pytest.mark.asyncio
+async def test_claim_and_get_is_one_round_trip():
+    """Test the method transition claims and reads its session in one call."""
+    redis = FakeRedis()
+    store = RedisSessionStore(redis)
+    await store.set("s1", session("100"))
+    moved = {**session("101"), "order_number": "ORD-100"}
+    await store.set("s1", moved)
+    redis.round_trips = 0
+
+    assert await store.claim_and_get("m:101", "101") == (True, "s1", moved)
+    assert await store.claim_and_get("m:101", "101") == (False, None, None)
+    assert await store.claim_and_get("m:100", "100") == (True, None, None)
+    assert await store.claim_and_get("m:200", "200") == (True, None, None)
+    assert redis.round_trips == 4
+    assert store.metrics() == {"hits": 1, "misses": 2}
+
+
+@pytest.mark.asyncio
+async def test_flow_continues_on_another_node():
+    """Test a method notification finds a session stored by another node."""
+    redis = FakeRedis()
+    settings = Mock(MERCHANT_ID="39038540035")
+    client = Mock(_async_request=AsyncMock())
+    client._async_request.return_value = {
+        "ResponseMessage": "APROBADA",
+        "IsoCode": "00",
+        "AzulOrderId": "100",
+    }
+    node_a = SecureService(client, settings, session_store=RedisSessionStore(redis))
+    node_b = SecureService(client, settings, session_store=RedisSessionStore(redis))
+    await node_a._store_session_data("s1", session("100"))
+
+    result = await node_b.process_3ds_method("100", "RECEIVED")
+    duplicate = await node_a.process_3ds_method("100", "RECEIVED")
+    status = await node_b._update_session_with_result("s1", result)
+
+    assert result["IsoCode"] == "00"
+    assert duplicate["ResponseMessage"] == "ALREADY_PROCESSED"
+    assert client._async_request.await_count == 1
+    assert redis.round_trips == 5
+    assert status == "approved"
+    assert decode(redis.data["pyazul:3ds:s:s1"][0])["final_result"]["IsoCode"] == "00"
@@ -0,0 +1,78 @@
+"""Unit tests for the SQLite 3DS session store."""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from pyazul.core.sessions import SQLiteSessionStore
+
+
+def session(azul_order_id):
+    """Build session data for an order."""
+    return {
+        "azul_order_id": azul_order_id,
+        "order_number": f"ORD-{azul_order_id}",
+        "amount": "1000",
+        "status": "processing",
+    }
+
+
+@pytest.mark.asyncio
+async def test_sessions_survive_a_restart(tmp_path):
+    """Test sessions written by one store are read back after reopening."""
+    path = str(tmp_path / "3ds.sqlite3")
+    store = SQLiteSessionStore(path)
+    await store.set("s1", session("100"))
+    await store.set("s1", {**session("101"), "status": "method_processed"})
+    await store.aclose()
+
+    store = SQLiteSessionStore(path)
+    assert (await store.get("s1"))["status"] == "method_processed"
+    assert await store.find("101") == "s1"
+    assert await store.find("100") is None
+    assert await store.find("ORD-101", "order_number") == "s1"
+    assert await store.delete("s1") is True
+    assert await store.delete("s1") is False
+    assert await store.get("s1") is None
+    assert store.metrics() == {"hits": 1, "misses": 1, "expired": 0}
+    await store.aclose()
+
+    with sqlite3.connect(path) as db:
+        assert db.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+
+@pytest.mark.asyncio
+async def test_expired_sessions_are_hidden_and_swept_in_batches(tmp_path):
+    """Test expired rows are never returned and are deleted in batches."""
+    store = SQLiteSessionStore(str(tmp_path / "3ds.sqlite3"), sweep_batch=2)
+    for n in range(5):
+        await store.set(f"old{n}", session(f"10{n}"), ttl=0.01)
+    await store.set("live", session("200"))
+    await asyncio.sleep(0.02)
+
+    assert await store.get("old0") is None
+    assert await store.find("100") is None
+    assert await store.delete("old1") is False
+    assert await store.sweep() == 5
+    assert await store.get("live") is not None
+    assert store.expired == 5
+    await store.aclose()
+
+
+@pytest.mark.asyncio
+async def test_claim_is_shared_by_processes_using_the_file(tmp_path):
+    """Test a claim taken through one connection blocks another until released."""
+    path = str(tmp_path / "3ds.sqlite3")
+    worker_a, worker_b = SQLiteSessionStore(path), SQLiteSessionStore(path)
+
+    assert await worker_a.claim("3ds-method:100") is True
+    assert await worker_b.claim("3ds-method:100") is False
+    await worker_a.release("3ds-method:100")
+    assert await worker_b.claim("3ds-method:100") is True
+    assert await worker_a.claim("3ds-method:200", ttl=0.01) is True
+    await asyncio.sleep(0.02)
+    assert await worker_b.claim("3ds-method:200") is True
+
+    await worker_a.aclose()
+    await worker_b.aclose()
@@ -0,0 +1,157 @@
+"""Unit tests for the in-memory 3DS session store."""
+
+import asyncio
+import ssl
+from unittest.mock import patch
+
+import pytest
+
+from pyazul.api.client import AzulAPI
+from pyazul.core.config import AzulSettings
+from pyazul.core.sessions import InMemorySessionStore
+from pyazul.index import PyAzul
+
+
+def session(azul_order_id: str) -> dict:
+    """Build session data for an order."""
+    return {"azul_order_id": azul_order_id, "amount": "1000", "status": "processing"}
+
+
+@pytest.mark.asyncio
+async def test_set_get_delete_and_find():
+    """Test the basic operations and the lookup by AzulOrderId."""
+    store = InMemorySessionStore()
+    await store.set("s1", session("100"))
+    await store.set("s2", session("200"))
+
+    assert (await store.get("s1"))["azul_order_id"] == "100"
+    assert await store.find("200") == "s2"
+    assert await store.delete("s1") is True
+    assert await store.delete("s1") is False
+    assert await store.get("s1") is None
+    assert await store.find("100") is None
+    await store.aclose()
+
+
+@pytest.mark.asyncio
+async def test_expired_sessions_are_not_returned():
+    """Test a session past its TTL is a miss and is removed."""
+    store = InMemorySessionStore(ttl=60)
+    await store.set("s1", session("100"), ttl=0.01)
+    await store.set("s2", session("200"))
+    await asyncio.sleep(0.02)
+
+    assert await store.get("s1") is None
+    assert await store.find("100") is None
+    assert await store.get("s2") is not None
+    assert len(store) == 1
+    assert store.metrics()["expired"] == 1
+    await store.aclose()
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_session_is_evicted():
+    """Test the store stays bounded, evicting the least recently used session."""
+    store = InMemorySessionStore(max_sessions=2)
+    await store.set("s1", session("100"))
+    await store.set("s2", session("200"))
+    await store.get("s1")
+    await store.set("s3", session("300"))
+
+    assert await store.get("s2") is None
+    assert await store.get("s1") is not None
+    assert store.metrics() == {
+        "size": 2,
+        "hits": 2,
+        "misses": 1,
+        "expired": 0,
+        "evicted": 1,
+        "claims": 0,
+    }
+    await store.aclose()
+
+
+@pytest.mark.asyncio
+async def test_background_sweep_removes_expired_sessions():
+    """Test expired sessions are removed without being read again."""
+    store = InMemorySessionStore(sweep_interval=0.01)
+    await store.set("s1", session("100"), ttl=0.01)
+    await store.set("s2", session("200"), ttl=0.01)
+    await store.set("s2", session("200"))  # Renewed before expiring
+    await asyncio.sleep(0.05)
+
+    assert len(store) == 1
+    assert store.expired == 1
+    assert store.misses == 0
+    await store.aclose()
+    assert store._sweeper is None
+
+
+@pytest.mark.asyncio
+@patch.object(AzulAPI, "_load_certificates", return_value=ssl.create_default_context())
+async def test_client_store_is_bounded_by_settings(_load_certificates):
+    """Test PyAzul builds its default store from the 3DS session settings."""
+    settings = AzulSettings(
+        AUTH1="test_auth1",
+        AUTH2="test_auth2",
+        MERCHANT_ID="39038540035",
+        AZUL_CERT="dummy_cert.pem",
+        AZUL_KEY="dummy_key.key",
+        ENVIRONMENT="dev",
+        THREEDS_MAX_SESSIONS=5,
+        THREEDS_SESSION_TTL=120,
+    )
+    azul = PyAzul(settings)
+    store = azul.secure.session_store
+
+    assert isinstance(store, InMemorySessionStore)
+    assert (store.max_sessions, store.ttl) == (5, 120)
+    await store.set("s1", session("100"))
+    assert (await azul.get_session_info("s1"))["amount"] == "1000"
+    await azul.aclose()
+    assert store._sweeper is None
+
+
+@pytest.mark.asyncio
+async def test_indexes_follow_updates_deletes_and_evictions():
+    """Test every indexed field finds the session until it changes or leaves."""
+    store = InMemorySessionStore(max_sessions=2)
+    data = {**session("100"), "order_number": "ORD-1", "custom_order_id": "C-1"}
+    await store.set("s1", data)
+
+    assert await store.find("ORD-1", "order_number") == "s1"
+    assert await store.find("C-1", field="custom_order_id") == "s1"
+
+    stored = await store.get("s1")
+    stored["azul_order_id"] = "101"  # Changed in place, then stored again
+    await store.set("s1", stored)
+    assert await store.find("100") is None
+    assert await store.find("101") == "s1"
+
+    await store.set("s2", {**session("200"), "order_number": "ORD-1"})
+    await store.delete("s1")
+    assert await store.find("ORD-1", "order_number") == "s2"
+    assert await store.find("C-1", "custom_order_id") is None
+
+    await store.set("s3", session("300"))
+    await store.set("s4", session("400"))  # Evicts s2
+    assert await store.find("200") is None
+    assert await store.find("ORD-1", "order_number") is None
+    assert store._index.keys() == {("azul_order_id", "300"), ("azul_order_id", "400")}
+
+    with pytest.raises(ValueError):
+        await store.find("1000", "amount")
+    await store.aclose()
+
+
+@pytest.mark.asyncio
+async def test_index_skips_expired_sessions():
+    """Test a lookup does not return a session past its TTL."""
+    store = InMemorySessionStore(sweep_interval=60)
+    await store.set("s1", session("100"), ttl=0.01)
+    await asyncio.sleep(0.02)
+
+    assert await store.find("100") is None
+    assert store._index == {}
+    assert store.expired == 1
+    await store.aclose()
@@ -0,0 +1,70 @@
+"""Unit tests for per-key call deduplication."""
+
+import asyncio
+
+import pytest
+
+from pyazul.core.singleflight import SingleFlight
+
+
+def counting_call(calls, result="ok", delay=0.0, fail=False):
+    """Build a call factory counting its invocations."""
+
+    async def call():
+        calls.append(result)
+        await asyncio.sleep(delay)
+        if fail:
+            raise ConnectionError("gateway unreachable")
+        return result
+
+    return lambda: call()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_and_late_callers_share_one_call():
+    """Test callers during and shortly after a call get its result."""
+    calls = []
+    flights = SingleFlight(ttl=60)
+
+    results = await asyncio.gather(
+        *(flights.run("order", counting_call(calls, delay=0.01)) for _ in range(3))
+    )
+
+    assert results == ["ok"] * 3
+    assert await flights.run("order", counting_call(calls, "new")) == "ok"
+    assert calls == ["ok"]
+
+
+@pytest.mark.asyncio
+async def test_failed_call_is_retried():
+    """Test a failure is shared by waiting callers but not kept."""
+    calls = []
+    flights = SingleFlight(ttl=60)
+    failing = counting_call(calls, delay=0.01, fail=True)
+
+    results = await asyncio.gather(
+        flights.run("order", failing),
+        flights.run("order", failing),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert await flights.run("order", counting_call(calls, "retried")) == "retried"
+    assert calls == ["ok", "retried"]
+
+
+@pytest.mark.asyncio
+async def test_results_expire_and_keys_are_bounded():
+    """Test results are reused only within the TTL and the map stays bounded."""
+    calls = []
+    flights = SingleFlight(ttl=0.01, max_keys=2)
+
+    await flights.run("a", counting_call(calls, "a1"))
+    await asyncio.sleep(0.02)
+    assert await flights.run("a", counting_call(calls, "a2")) == "a2"
+
+    await flights.run("b", counting_call(calls, "b"))
+    await flights.run("c", counting_call(calls, "c"))
+
+    assert len(flights) == 2
+    assert list(flights._flights) == ["b", "c"]
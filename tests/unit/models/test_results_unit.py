@@ -0,0 +1,117 @@
+"""Unit tests for pyazul.models.results."""
+
+import json
+import pickle
+import sys
+from collections.abc import Mapping
+
+import pytest
+
+from pyazul.models.results import ThreeDSResult, TransactionResult
+
+SALE_RESPONSE = {
+    "AuthorizationCode": "OK1234",
+    "AzulOrderId": "44586",
+    "IsoCode": "00",
+    "ResponseCode": "ISO8583",
+    "ResponseMessage": "APROBADA",
+    "CustomField": "extra",
+}
+
+
+class TestTransactionResult:
+    """Tests for TransactionResult."""
+
+    def test_behaves_like_the_response_dict(self):
+        """Test mapping access, membership, iteration and dict equality."""
+        result = TransactionResult.from_dict(SALE_RESPONSE)
+
+        assert result == SALE_RESPONSE
+        assert result["IsoCode"] == "00"
+        assert result.get("RRN") is None
+        assert "CustomField" in result
+        assert "RRN" not in result
+        assert set(result) == set(SALE_RESPONSE)
+        assert len(result) == len(SALE_RESPONSE)
+        with pytest.raises(KeyError):
+            result["RRN"]
+
+    def test_attribute_access(self):
+        """Test documented fields, unset fields and undocumented fields."""
+        result = TransactionResult(SALE_RESPONSE)
+
+        assert result.AzulOrderId == "44586"
+        assert result.RRN is None
+        assert result.CustomField == "extra"
+        assert result.approved
+        with pytest.raises(AttributeError):
+            result.NotAField
+
+    def test_is_slotted_and_smaller_than_the_response(self):
+        """Test documented fields live in slots, not in a per-instance dict."""
+        documented = {k: v for k, v in SALE_RESPONSE.items() if k != "CustomField"}
+        result = TransactionResult(documented)
+
+        assert isinstance(result, Mapping)
+        assert not hasattr(result, "__dict__")
+        assert result._raw is None
+        assert sys.getsizeof(result) < sys.getsizeof(dict(documented))
+
+    def test_undocumented_fields_are_read_from_the_response(self):
+        """Test undocumented fields are not copied until one is changed."""
+        response = dict(SALE_RESPONSE)
+        result = TransactionResult(response)
+
+        assert result._raw is response
+        assert result["CustomField"] == "extra"
+        result["CustomField"] = "changed"
+
+        assert response["CustomField"] == "extra"
+        assert dict(result._raw) == {"CustomField": "changed"}
+
+    def test_json_and_pickle(self):
+        """Test JSON serialization and that pickling round trips."""
+        result = TransactionResult(SALE_RESPONSE)
+
+        assert json.loads(json.dumps(result.to_dict())) == SALE_RESPONSE
+        assert json.loads(json.dumps(result, default=dict)) == SALE_RESPONSE
+        restored = pickle.loads(pickle.dumps(result))
+        assert type(restored) is TransactionResult
+        assert restored == result
+
+    def test_mutation(self):
+        """Test setting and deleting fields."""
+        result = TransactionResult({"IsoCode": "99"})
+        result["IsoCode"] = "00"
+        result["note"] = "x"
+        del result["note"]
+
+        assert result.to_dict() == {"IsoCode": "00"}
+        with pytest.raises(KeyError):
+            del result["RRN"]
+
+
+class TestThreeDSResult:
+    """Tests for ThreeDSResult redirect fields."""
+
+    def test_redirect_fields_are_serialized(self):
+        """Test the browser HTML is a stored field, kept in the output."""
+        result = ThreeDSResult(
+            {
+                "IsoCode": "3D2METHOD",
+                "ThreeDSMethod": {"MethodForm": "<form>method</form>"},
+            }
+        )
+        result.update({"redirect": True, "html": "<form>method</form>"})
+
+        assert result.html == result["html"] == "<form>method</form>"
+        assert result.challenge_html is None and "challenge_html" not in result
+        assert json.loads(json.dumps(result.to_dict()))["html"] == result.html
+        assert pickle.loads(pickle.dumps(result))["redirect"] is True
+
+    def test_no_html_without_redirect(self):
+        """Test no HTML is set when no redirect is needed."""
+        result = ThreeDSResult({"IsoCode": "00", "ResponseMessage": "APROBADA"})
+
+        assert result.get("html") is None
+        assert result == {"IsoCode": "00", "ResponseMessage": "APROBADA"}
@@ -0,0 +1,148 @@
+"""Unit tests for the batch execution service."""
+
+import asyncio
+import ssl
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from pyazul.api.client import AzulAPI
+from pyazul.api.constants import Priority
+from pyazul.core.config import AzulSettings
+from pyazul.core.exceptions import AzulError
+from pyazul.index import PyAzul
+from pyazul.services.batch import BatchOperation, BatchRunner
+
+
+def _tracking_handler(state, delays=None):
+    """Build a handler recording concurrency and echoing its data."""
+
+    async def handler(data):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        try:
+            await asyncio.sleep((delays or {}).get(data["id"], 0.01))
+            if data.get("fail"):
+                raise AzulError(f"item {data['id']} failed")
+            return {"id": data["id"]}
+        finally:
+            state["active"] -= 1
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_batch_respects_concurrency_and_streams_results():
+    """Results arrive in completion order with at most N operations in flight."""
+    state = {"active": 0, "peak": 0}
+    delays = {0: 0.05, 1: 0.01, 2: 0.01, 3: 0.01}
+    operations = [("op", {"id": i}) for i in range(4)]
+    runner = BatchRunner({"op": _tracking_handler(state, delays)}, operations, 2)
+
+    order = [result.index async for result in runner]
+
+    assert state["peak"] == 2
+    assert order[0] == 1
+    assert sorted(order) == [0, 1, 2, 3]
+    assert runner.stats.completed == runner.stats.succeeded == 4
+    assert runner.stats.throughput > 0
+
+
+@pytest.mark.asyncio
+async def test_batch_keeps_errors_on_their_item():
+    """A failing item is reported on its result and the batch carries on."""
+    state = {"active": 0, "peak": 0}
+    progress = []
+    operations = [
+        BatchOperation("op", {"id": 0}, key="a"),
+        BatchOperation("op", {"id": 1, "fail": True}, key="b"),
+        BatchOperation("missing", {"id": 2}, key="c"),
+    ]
+    runner = BatchRunner(
+        {"op": _tracking_handler(state)},
+        operations,
+        on_progress=lambda stats: progress.append(stats.completed),
+    )
+
+    results = {result.operation.key: result async for result in runner}
+
+    assert results["a"].ok and results["a"].response == {"id": 0}
+    assert isinstance(results["b"].error, AzulError)
+    assert "Unsupported batch operation" in str(results["c"].error)
+    assert runner.stats.failed == 2
+    assert progress == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_malformed_item_on_its_index():
+    """An item that is not a valid operation fails alone instead of the batch."""
+    state = {"active": 0, "peak": 0}
+    operations = [("op", {"id": 0}), ("op",), ("op", {"id": 2})]
+    runner = BatchRunner({"op": _tracking_handler(state)}, operations)
+
+    results = {result.index: result async for result in runner}
+
+    assert results[0].ok and results[2].ok
+    assert isinstance(results[1].error, TypeError)
+    assert results[1].operation.key == ("op",)
+    assert runner.stats.failed == 1 and runner.stats.succeeded == 2
+
+
+@pytest.mark.asyncio
+async def test_leaving_batch_early_cancels_pending_operations():
+    """Breaking out of the iteration cancels the operations still in flight."""
+    state = {"active": 0, "peak": 0}
+    delays = {0: 0.01, 1: 1.0, 2: 1.0}
+    operations = [("op", {"id": i}) for i in range(3)]
+    runner = BatchRunner({"op": _tracking_handler(state, delays)}, operations, 3)
+
+    iterator = runner.__aiter__()
+    first = await iterator.__anext__()
+    await iterator.aclose()
+
+    assert first.index == 0
+    assert state["active"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pyazul_batch_shares_one_client():
+    """PyAzul.run_batch validates each item and reuses the background pool."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200, json={"ResponseCode": "ISO8583", "IsoCode": "00", "AzulOrderId": "1"}
+        )
+
+    settings = AzulSettings(
+        AUTH1="test_auth1",
+        AUTH2="test_auth2",
+        MERCHANT_ID="39038540035",
+        AZUL_CERT="dummy_cert.pem",
+        AZUL_KEY="dummy_key.key",
+        ENVIRONMENT="dev",
+    )
+    operations = [
+        ("void", {"Store": "39038540035", "AzulOrderId": str(i)}) for i in range(3)
+    ]
+    operations.append(("void", {"Store": "39038540035"}))
+
+    with patch.object(
+        AzulAPI, "_load_certificates", return_value=ssl.create_default_context()
+    ):
+        async with PyAzul(settings, transport=httpx.MockTransport(handler)) as azul:
+            batch = azul.run_batch(operations, concurrency=2)
+            results = [result async for result in batch]
+            client = azul.api._get_client(Priority.BACKGROUND)
+            assert list(azul.api._clients.values()) == [client]
+
+    assert len(results) == 4 and len(requests) == 3
+    assert batch.stats.succeeded == 3 and batch.stats.failed == 1
+
+
+def test_batch_rejects_invalid_concurrency():
+    """Concurrency must be a positive number."""
+    with pytest.raises(ValueError):
+        BatchRunner({}, [], concurrency=0)
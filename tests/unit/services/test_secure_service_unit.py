@@ -1,11 +1,13 @@
 """Tests for 3D Secure functionalities of the PyAzul SDK."""
 
+import asyncio
 import uuid
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from pyazul.core.exceptions import AzulError
+from pyazul.core.sessions import InMemorySessionStore, ThreeDSSessionStore
 from pyazul.models.three_ds import (
     CardHolderInfo,
     ChallengeIndicator,
@@ -184,7 +186,7 @@ async def test_process_sale_direct_approval(service, sale_request, api_client):
 async def test_process_3ds_method(service, api_client):
     """Test process_3ds_method with successful response."""
     # Set up session data for the azul_order_id
-    service._store_session_data(
+    await service._store_session_data(
         "test_session",
         {
             "azul_order_id": "12345",
@@ -210,13 +212,32 @@ async def test_process_3ds_method(service, api_client):
     assert "ThreeDSChallenge" in result
 
 
+def test_challenge_html_is_kept_in_serialized_result(service):
+    """Test the challenge form reaches the browser through to_dict()."""
+    result = service._process_3ds_response(
+        {
+            "IsoCode": "3D",
+            "ResponseMessage": "3D_SECURE_CHALLENGE",
+            "ThreeDSChallenge": {
+                "CReq": "creq-value",
+                "RedirectPostUrl": "https://acs.example/challenge",
+            },
+        }
+    )
+
+    serialized = result.to_dict()
+    assert serialized["redirect"] is True and serialized["challenge_required"]
+    assert 'value="creq-value"' in serialized["html"]
+    assert serialized["html"] == serialized["challenge_html"] == result.html
+
+
 @pytest.mark.asyncio
 async def test_process_challenge(service, api_client):
     """Test process_challenge with successful response."""
     # Setup test data
     secure_id = "test_session"
     card_details = get_card("SECURE_3DS_CHALLENGE_WITH_3DS")
-    service._store_session_data(
+    await service._store_session_data(
         secure_id,
         {
             "azul_order_id": "12345",
@@ -250,13 +271,79 @@ async def test_process_challenge_invalid_session(service):
 
 @pytest.mark.asyncio
 async def test_process_3ds_method_already_processed(service, api_client):
-    """Test process_3ds_method with already processed transaction."""
-    # Add order to processed methods
-    service.processed_methods["12345"] = True
+    """Test process_3ds_method with a method claimed by another worker."""
+    await service.session_store.claim("3ds-method:12345")
 
     result = await service.process_3ds_method("12345", "RECEIVED")
 
     assert result["ResponseMessage"] == "ALREADY_PROCESSED"
+    api_client._async_request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_3ds_method_without_session_is_not_reused(service, api_client):
+    """Test a retry after SESSION_NOT_FOUND reaches the gateway once stored."""
+    api_client._async_request.return_value = {
+        "ResponseMessage": "APROBADA",
+        "IsoCode": "00",
+        "AzulOrderId": "12345",
+    }
+
+    missing = await service.process_3ds_method("12345", "RECEIVED")
+    await service._store_session_data(
+        "test_session", {"azul_order_id": "12345", "amount": "1000"}
+    )
+    retried = await service.process_3ds_method("12345", "RECEIVED")
+
+    assert missing["ResponseMessage"] == "SESSION_NOT_FOUND"
+    assert retried["IsoCode"] == "00"
+    assert api_client._async_request.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_duplicate_3ds_method_shares_gateway_call(service, api_client):
+    """Test duplicate notifications await the in-flight call and get its result."""
+    await service._store_session_data(
+        "test_session",
+        {"azul_order_id": "12345", "amount": "1000", "order_number": "TEST123"},
+    )
+    release = asyncio.Event()
+
+    async def gateway(*args, **kwargs):
+        await release.wait()
+        return {"ResponseMessage": "APROBADA", "IsoCode": "00", "AzulOrderId": "12345"}
+
+    api_client._async_request.side_effect = gateway
+    calls = [
+        asyncio.ensure_future(service.process_3ds_method("12345", "RECEIVED"))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*calls)
+    late = await service.process_3ds_method("12345", "RECEIVED")
+
+    assert [result["IsoCode"] for result in results + [late]] == ["00"] * 4
+    assert api_client._async_request.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_3ds_method_can_be_retried(service, api_client):
+    """Test a failed method call frees its key for the ACS retry."""
+    await service._store_session_data(
+        "test_session", {"azul_order_id": "12345", "amount": "1000"}
+    )
+    api_client._async_request.side_effect = [
+        ConnectionError("reset"),
+        {"ResponseMessage": "APROBADA", "IsoCode": "00", "AzulOrderId": "12345"},
+    ]
+
+    with pytest.raises(AzulError, match="3DS method processing failed"):
+        await service.process_3ds_method("12345", "RECEIVED")
+    result = await service.process_3ds_method("12345", "RECEIVED")
+
+    assert result["IsoCode"] == "00"
+    assert service.session_store.metrics()["claims"] == 1
 
 
 @pytest.mark.asyncio
@@ -455,9 +542,10 @@ async def test_process_token_hold_with_challenge_flow(
     secure_id = result["id"]
 
     # Verify session data is stored correctly
-    session_data = service.get_session_info(secure_id)
+    session_data = await service.aget_session_info(secure_id)
     assert session_data is not None
     assert session_data.get("azul_order_id") == "67890"
+    assert await service.find_session("67890") == secure_id
     assert session_data.get("amount") == "1000"
     assert session_data.get("itbis") == "180"
 
@@ -486,3 +574,33 @@ async def test_secure_token_hold_error_handling(
 
     with pytest.raises(AzulError, match="3D Secure token hold transaction failed"):
         await service.process_token_hold(token_hold_request)
+
+
+@pytest.mark.asyncio
+async def test_dict_session_store_is_wrapped(mock_api_client, mock_settings):
+    """A plain dict session store is deprecated and copied into the memory store."""
+    with pytest.warns(DeprecationWarning, match="session_store"):
+        service = SecureService(
+            mock_api_client,
+            mock_settings,
+            session_store={"s1": {"azul_order_id": "42", "amount": "1000"}},
+        )
+
+    assert isinstance(service.session_store, InMemorySessionStore)
+    assert service.get_session_info("s1")["amount"] == "1000"
+    assert await service.aget_session_info("s1") == {
+        "azul_order_id": "42",
+        "amount": "1000",
+    }
+    assert await service.find_session("42") == "s1"
+    assert service.get_session_info("missing") is None
+
+
+def test_sync_session_info_needs_memory_store(mock_api_client, mock_settings):
+    """Stores read asynchronously point to aget_session_info."""
+    service = SecureService(
+        mock_api_client, mock_settings, session_store=Mock(spec=ThreeDSSessionStore)
+    )
+
+    with pytest.raises(AzulError, match="aget_session_info"):
+        service.get_session_info("s1")
@@ -310,7 +310,7 @@ async def test_token_sale_with_3ds_method(
 
     # Test method notification processing
     secure_id = result["id"]
-    session_data = secure_service.get_session_info(secure_id)
+    session_data = await secure_service.aget_session_info(secure_id)
     azul_order_id = session_data["azul_order_id"]
 
     mock_api_client._async_request.return_value = {
@@ -495,7 +495,7 @@ async def test_token_hold_with_3ds_method(
 
     # Test method notification processing
     secure_id = result["id"]
-    session_data = secure_service.get_session_info(secure_id)
+    session_data = await secure_service.aget_session_info(secure_id)
     azul_order_id = session_data["azul_order_id"]
 
     mock_api_client._async_request.return_value = {
@@ -1,11 +1,15 @@
 """Unit tests for transaction service."""
 
-from unittest.mock import MagicMock
+import ssl
+from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from pyazul.api.client import AzulAPI
+from pyazul.api.constants import Priority
 from pyazul.core.config import AzulSettings
+from pyazul.index import PyAzul
 from pyazul.models.payment import Hold, Post, Refund, Sale, Void
 from pyazul.services.transaction import TransactionService
 
@@ -83,10 +87,7 @@ class TestTransactionService:
         assert response == expected_response
         actual_call_args = mock_api_client.post.call_args
         assert actual_call_args is not None
-        expected_payload = sale_request_model.model_dump(
-            exclude_none=True, exclude_defaults=False, exclude_unset=False
-        )
-        assert actual_call_args[0][1] == expected_payload
+        assert actual_call_args[0][1] == sale_request_model
 
     @pytest.mark.asyncio
     async def test_refund(
@@ -102,9 +103,7 @@ class TestTransactionService:
         assert response == expected_response
         actual_call_args = mock_api_client.post.call_args
         assert actual_call_args is not None
-        assert actual_call_args[0][1] == refund_request_model.model_dump(
-            exclude_none=True
-        )
+        assert actual_call_args[0][1] == refund_request_model
 
     @pytest.mark.asyncio
     async def test_void(
@@ -120,9 +119,7 @@ class TestTransactionService:
         assert response == expected_response
         actual_call_args = mock_api_client.post.call_args
         assert actual_call_args is not None
-        assert actual_call_args[0][1] == void_request_model.model_dump(
-            exclude_none=True
-        )
+        assert actual_call_args[0][1] == void_request_model
         assert actual_call_args[0][0] == "/webservices/JSON/default.aspx?ProcessVoid"
 
     @pytest.mark.asyncio
@@ -139,9 +136,7 @@ class TestTransactionService:
         assert response == expected_response
         actual_call_args = mock_api_client.post.call_args
         assert actual_call_args is not None
-        assert actual_call_args[0][1] == hold_request_model.model_dump(
-            exclude_none=True
-        )
+        assert actual_call_args[0][1] == hold_request_model
 
     @pytest.mark.asyncio
     async def test_post_sale(
@@ -157,7 +152,52 @@ class TestTransactionService:
         assert response == expected_response
         actual_call_args = mock_api_client.post.call_args
         assert actual_call_args is not None
-        assert actual_call_args[0][1] == post_request_model.model_dump(
-            exclude_none=True
-        )
+        assert actual_call_args[0][1] == post_request_model
         assert actual_call_args[0][0] == "/webservices/JSON/default.aspx?ProcessPost"
+
+
+@pytest.mark.asyncio
+async def test_verify_transaction_uses_the_requested_governor_lane():
+    """Test PyAzul.verify_transaction admits and releases on its priority lane."""
+    settings = AzulSettings(
+        AUTH1="test_auth1",
+        AUTH2="test_auth2",
+        MERCHANT_ID="39038540099",
+        AZUL_CERT="dummy_cert.pem",
+        AZUL_KEY="dummy_key.key",
+        ENVIRONMENT="dev",
+        MAX_IN_FLIGHT=4,
+    )
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"Found": True, "IsoCode": "00"})
+    )
+    lanes = []
+
+    with patch.object(
+        AzulAPI, "_load_certificates", return_value=ssl.create_default_context()
+    ):
+        async with PyAzul(settings, transport=transport) as azul:
+            governor = azul.api.governor
+            acquire, release = governor.acquire, governor.release
+
+            async def tracking_acquire(deadline=None, priority=Priority.INTERACTIVE):
+                lanes.append(("acquire", priority))
+                return await acquire(deadline, priority)
+
+            def tracking_release(priority=Priority.INTERACTIVE):
+                lanes.append(("release", priority))
+                release(priority)
+
+            with (
+                patch.object(governor, "acquire", tracking_acquire),
+                patch.object(governor, "release", tracking_release),
+            ):
+                await azul.verify_transaction(
+                    {"Store": "39038540099", "CustomOrderId": "ORDER001"},
+                    priority=Priority.BACKGROUND,
+                )
+
+    assert lanes == [
+        ("acquire", Priority.BACKGROUND),
+        ("release", Priority.BACKGROUND),
+    ]
@@ -0,0 +1,157 @@
+"""Unit tests for the synchronous PyAzul facade."""
+
+import asyncio
+import ssl
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from pyazul.api.client import AzulAPI
+from pyazul.api.constants import Priority
+from pyazul.core.config import AzulSettings
+from pyazul.core.exceptions import AzulError
+from pyazul.sync import PyAzulSync
+
+STORE = "39038540035"
+
+
+@pytest.fixture(autouse=True)
+def no_certificates():
+    """Skip real certificate loading."""
+    with patch.object(
+        AzulAPI, "_load_certificates", return_value=ssl.create_default_context()
+    ):
+        yield
+
+
+@pytest.fixture
+def state():
+    """Return counters filled by the gateway handler."""
+    return {"active": 0, "peak": 0, "threads": set()}
+
+
+@pytest.fixture
+def azul(state):
+    """Return a PyAzulSync backed by a slow mock gateway."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["threads"].add(threading.current_thread().name)
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.02)
+        state["active"] -= 1
+        return httpx.Response(
+            200, json={"ResponseCode": "ISO8583", "IsoCode": "00", "AzulOrderId": "1"}
+        )
+
+    settings = AzulSettings(
+        AUTH1="test_auth1",
+        AUTH2="test_auth2",
+        MERCHANT_ID=STORE,
+        AZUL_CERT="dummy_cert.pem",
+        AZUL_KEY="dummy_key.key",
+        ENVIRONMENT="dev",
+    )
+    client = PyAzulSync(settings, transport=httpx.MockTransport(handler))
+    yield client
+    client.close()
+
+
+def void(order_id: int) -> dict:
+    """Return the data of a void."""
+    return {"Store": STORE, "AzulOrderId": str(order_id)}
+
+
+def test_threads_share_one_loop_and_pool(azul, state):
+    """Test calls from many threads run concurrently over one pooled client."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(executor.map(lambda i: azul.void(void(i)), range(8)))
+
+    assert all(response.approved for response in responses)
+    assert state["peak"] > 1
+    assert state["threads"] == {"pyazul-loop"}
+    assert len(azul.client.api._clients) == 1
+
+
+def test_submit_many_returns_futures_in_order(azul):
+    """Test batch submission returns one concurrent future per operation."""
+    futures = azul.submit_many(
+        [("void", void(1)), ("void", {"Store": STORE}), ("refund", {})]
+    )
+
+    assert all(isinstance(future, Future) for future in futures)
+    assert futures[0].result().approved
+    assert futures[1].exception() is not None  # Invalid data fails its own future
+    assert futures[2].exception() is not None
+    assert azul.client.api._get_client(Priority.BACKGROUND) is not None
+    with pytest.raises(AzulError, match="Unsupported operation"):
+        azul.submit("payment_page", {})
+
+
+def test_submit_many_passes_priority_only_where_accepted(azul):
+    """Test operations without a priority parameter are still submitted."""
+    futures = azul.submit_many(
+        [("void", void(1)), ("handle_3ds_callback", "unknown-session")]
+    )
+
+    assert futures[0].result().approved
+    assert not isinstance(futures[1].exception(), TypeError)
+
+
+def test_background_start_failure_is_logged(caplog):
+    """Test a failing warmup or keep-alive start is logged, not lost."""
+    settings = AzulSettings(
+        AUTH1="test_auth1",
+        AUTH2="test_auth2",
+        MERCHANT_ID=STORE,
+        AZUL_CERT="dummy_cert.pem",
+        AZUL_KEY="dummy_key.key",
+        ENVIRONMENT="dev",
+    )
+    with patch(
+        "pyazul.index.PyAzul.__aenter__", side_effect=ConnectionError("no route")
+    ):
+        client = PyAzulSync(settings, transport=httpx.MockTransport(None))
+        client.close()
+
+    assert "Starting PyAzul background tasks failed: no route" in caplog.text
+
+
+def test_run_batch_future(azul, state):
+    """Test a batch runs in the background with bounded concurrency."""
+    future = azul.run_batch([("void", void(i)) for i in range(6)], concurrency=3)
+
+    results = future.result(timeout=5)
+
+    assert len(results) == 6 and all(result.ok for result in results)
+    assert state["peak"] <= 3
+
+
+def test_calls_from_loop_thread_are_rejected(azul):
+    """Test blocking calls from the loop thread raise instead of deadlocking."""
+
+    async def blocking_call():
+        try:
+            azul.void(void(1))
+        except AzulError as e:
+            return e
+
+    error = asyncio.run_coroutine_threadsafe(blocking_call(), azul._loop).result()
+
+    assert "own event loop" in str(error)
+
+
+def test_close_stops_loop_thread(azul):
+    """Test closing releases the pool and the thread, and is idempotent."""
+    azul.void(void(1))
+    azul.close()
+    azul.close()
+
+    assert azul.closed
+    assert not azul._thread.is_alive()
+    assert azul.client.api.is_closed
+    with pytest.raises(AzulError, match="closed"):
+        azul.void(void(1))
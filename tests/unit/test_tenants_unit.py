@@ -0,0 +1,156 @@
+"""Unit tests for the multi-tenant client registry."""
+
+import ssl
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from pyazul.api.client import AzulAPI
+from pyazul.core.config import AzulSettings
+from pyazul.core.exceptions import AzulError
+from pyazul.tenants import TenantRegistry
+
+APPROVED_RESPONSE = {"ResponseCode": "ISO8583", "IsoCode": "00"}
+
+
+@pytest.fixture(autouse=True)
+def no_certificates():
+    """Skip real certificate loading."""
+    with patch.object(
+        AzulAPI,
+        "_load_certificates",
+        side_effect=lambda settings=None: ssl.create_default_context(),
+    ):
+        yield
+
+
+@pytest.fixture
+def base_settings() -> AzulSettings:
+    """Return base settings shared by every tenant."""
+    return AzulSettings(
+        AUTH1="base_auth1",
+        AUTH2="base_auth2",
+        MERCHANT_ID="39038540035",
+        AZUL_CERT="dummy_cert.pem",
+        AZUL_KEY="dummy_key.key",
+        ENVIRONMENT="dev",
+    )
+
+
+def tenant(number: int, **overrides) -> dict:
+    """Return the credentials of a tenant."""
+    return {
+        "MERCHANT_ID": f"3903854003{number}",
+        "AUTH1": f"auth1-{number}",
+        "AUTH2": f"auth2-{number}",
+        **overrides,
+    }
+
+
+@pytest.mark.asyncio
+async def test_tenants_share_pools_per_certificate(base_settings):
+    """Test tenants with the same certificate share one SSL context and pool."""
+    registry = TenantRegistry(base_settings)
+    registry.register("a", tenant(1))
+    registry.register("b", tenant(2))
+    registry.register("c", tenant(3, AZUL_CERT="other_cert.pem"))
+
+    a, b, c = registry.get("a").api, registry.get("b").api, registry.get("c").api
+
+    assert a._get_client() is b._get_client()
+    assert a.ssl_context is b.ssl_context
+    assert c._get_client() is not a._get_client()
+    assert len(registry.pools) == 2
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_requests_carry_tenant_credentials(base_settings):
+    """Test each tenant's requests use its own Auth1 header and merchant id."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Auth1"])
+        return httpx.Response(200, json=APPROVED_RESPONSE)
+
+    async with TenantRegistry(
+        base_settings, transport=httpx.MockTransport(handler)
+    ) as registry:
+        registry.register("a", tenant(1))
+        registry.register("b", tenant(2))
+        await registry["a"].api.post("/webservices/JSON/default.aspx", {})
+        await registry["b"].api.post("/webservices/JSON/default.aspx", {})
+
+        assert seen == ["auth1-1", "auth1-2"]
+        assert registry["b"].settings.MERCHANT_ID == "39038540032"
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_tenant_is_released(base_settings):
+    """Test clients beyond max_tenants are released, and rebuilt on demand."""
+    registry = TenantRegistry(base_settings, max_tenants=2)
+    for number in range(3):
+        registry.register(str(number), tenant(number))
+
+    first = registry.get("0")
+    registry.get("1")
+    registry.get("0")  # "1" is now the least recently used
+    registry.get("2")
+
+    assert len(registry) == 2
+    assert "1" in registry  # Still registered
+    assert registry.get("0") is first
+    assert registry.get("1") is not None
+    await registry.aclose()
+
+
+def test_tenant_overrides_are_validated(base_settings):
+    """Test overrides are coerced and checked like constructed settings."""
+    registry = TenantRegistry(base_settings)
+
+    registry.register("a", tenant(1, BACKGROUND_IN_FLIGHT_SHARE="0.25"))
+    with pytest.raises(ValueError, match="AUTH1"):
+        registry.register("b", tenant(2, AUTH1=None))
+    with pytest.raises(ValueError, match="BACKGROUND_IN_FLIGHT_SHARE"):
+        registry.register("c", tenant(3, BACKGROUND_IN_FLIGHT_SHARE="half"))
+
+    assert registry._tenants["a"].BACKGROUND_IN_FLIGHT_SHARE == 0.25
+    assert registry._tenants["a"].AUTH1 == "auth1-1"
+    assert "b" not in registry._tenants and "c" not in registry._tenants
+
+
+@pytest.mark.asyncio
+async def test_unknown_tenant_uses_loader(base_settings):
+    """Test unregistered tenants come from the loader, or raise without one."""
+    registry = TenantRegistry(base_settings)
+    with pytest.raises(AzulError, match="Unknown tenant"):
+        registry.get("missing")
+
+    loaded = []
+
+    def loader(tenant_id: str) -> dict:
+        loaded.append(tenant_id)
+        return tenant(7)
+
+    registry.loader = loader
+    assert registry.get("shop-7").settings.AUTH1 == "auth1-7"
+    registry.get("shop-7")
+    assert loaded == ["shop-7"]
+    # Loaded settings live with the client only, so they are bounded too
+    assert "shop-7" not in registry._tenants
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_shared_pools(base_settings):
+    """Test closing the registry closes the shared connection pools."""
+    registry = TenantRegistry(base_settings)
+    registry.register("a", tenant(1))
+    client = registry.get("a").api._get_client()
+
+    await registry.aclose()
+
+    assert client.is_closed
+    assert len(registry) == 0
+    assert registry.pools == {}